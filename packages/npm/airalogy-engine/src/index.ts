@@ -69,6 +69,10 @@ export interface SandboxOptions {
   fileBridge?: SandboxFileBridgeOptions;
 }
 
+export interface AssignCascadeOptions extends SandboxOptions {
+  maxWorkers?: number;
+}
+
 export type WorkflowAssignerRuntime = "sandbox" | "local";
 
 export interface WorkflowRunOptions extends SandboxOptions {
@@ -189,7 +193,7 @@ class SandboxExecutionTimeoutError extends Error {
   }
 }
 
-function isSandboxOptions(value: EnvVars | SandboxOptions | WorkflowRunOptions | WorkflowTransitionOptions | undefined): value is SandboxOptions {
+function isSandboxOptions(value: EnvVars | SandboxOptions | AssignCascadeOptions | WorkflowRunOptions | WorkflowTransitionOptions | undefined): value is SandboxOptions {
   if (value === undefined) {
     return false;
   }
@@ -203,6 +207,7 @@ function isSandboxOptions(value: EnvVars | SandboxOptions | WorkflowRunOptions |
     "debug",
     "logFile",
     "fileBridge",
+    "maxWorkers",
     "workflowId",
     "transitionIds",
     "transitionOutputs",
@@ -2035,6 +2040,35 @@ export async function assignVariable(
   return executeInSandbox("assign_variable", protocolPath, params, resolved.envVars, resolved.options);
 }
 
+export function assignCascade(
+  protocolPath: string,
+  changedFields: string[],
+  data: Record<string, unknown>,
+  options?: AssignCascadeOptions,
+): Promise<ProtocolResult>;
+export function assignCascade(
+  protocolPath: string,
+  changedFields: string[],
+  data: Record<string, unknown>,
+  envVars?: EnvVars,
+  options?: AssignCascadeOptions,
+): Promise<ProtocolResult>;
+export async function assignCascade(
+  protocolPath: string,
+  changedFields: string[],
+  data: Record<string, unknown>,
+  envVarsOrOptions?: EnvVars | AssignCascadeOptions,
+  options?: AssignCascadeOptions,
+): Promise<ProtocolResult> {
+  const resolved = resolveEnvAndOptions(envVarsOrOptions, options);
+  const params = {
+    changed_fields: changedFields,
+    data,
+    max_workers: (resolved.options as AssignCascadeOptions).maxWorkers ?? 1,
+  };
+  return executeInSandbox("assign_cascade", protocolPath, params, resolved.envVars, resolved.options);
+}
+
 export function validateVariables(
   protocolPath: string,
   vars: Record<string, unknown>,
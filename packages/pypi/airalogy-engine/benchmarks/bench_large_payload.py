@@ -0,0 +1,120 @@
+"""
+Benchmark validate_variables with large payloads, argv JSON vs stdin frames.
+
+By default the protocol executor runs as host subprocesses in a temporary
+directory laid out like the sandbox. Parameters are passed either as one argv
+JSON string, as before, or as the length-prefixed stdin frame the engine now
+uses above 64 KiB. Linux caps one argv string at 128 KiB, so the argv column
+reports the failure for larger payloads. Pass ``--rootfs-path`` or ``--image``
+to measure through ``AiralogyEngine`` in a BoxLite sandbox instead. Run from
+``packages/pypi/airalogy-engine``:
+
+    uv run python benchmarks/bench_large_payload.py
+    uv run python benchmarks/bench_large_payload.py --sizes-mib 1 50 --rootfs-path <rootfs>
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy_engine import AiralogyEngine
+from airalogy_engine.engine import _EXECUTOR_PATH, _STDIN_PARAMS_ARG
+
+_MONOREPO_ROOT = Path(__file__).resolve().parents[4]
+_EXAMPLE_PROTOCOL = _MONOREPO_ROOT / "examples/airalogy-engine"
+
+
+def _variables(size_mib: float) -> dict:
+    return {
+        "seconds": "60",
+        "duration": "PT1M",
+        "user_name": "x" * int(size_mib * 1024 * 1024),
+        "current_time": "2025-01-01T00:00:00",
+        "endpoint": "https://api.example.test",
+    }
+
+
+def _run_executor(working_dir: str, params_arg: str, stdin: bytes | None) -> float:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "protocol_executor.py",
+            "validate_variables",
+            "protocol",
+            params_arg,
+        ],
+        cwd=working_dir,
+        input=stdin,
+        capture_output=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+    assert json.loads(completed.stdout)["success"] is True
+    return elapsed
+
+
+def bench_host(sizes_mib: list[float]) -> None:
+    with tempfile.TemporaryDirectory() as working_dir:
+        shutil.copytree(_EXAMPLE_PROTOCOL, Path(working_dir) / "protocol")
+        shutil.copy(_EXECUTOR_PATH, working_dir)
+
+        for size_mib in sizes_mib:
+            payload = json.dumps(_variables(size_mib), separators=(",", ":"))
+            data = payload.encode("utf-8")
+            try:
+                argv = f"{_run_executor(working_dir, payload, None) * 1000:9.1f} ms"
+            except OSError as e:
+                argv = f"failed ({e.strerror})"
+            frame = b"%d\n" % len(data) + data
+            stdin = _run_executor(working_dir, _STDIN_PARAMS_ARG, frame)
+            print(
+                f"{size_mib:>6g} MiB  argv={argv:<34} stdin={stdin * 1000:9.1f} ms"
+            )
+
+
+async def bench_sandbox(sizes_mib: list[float], sandbox_kwargs: dict) -> None:
+    engine = AiralogyEngine(
+        str(_EXAMPLE_PROTOCOL),
+        auto_stop=False,
+        **sandbox_kwargs,
+    )
+    try:
+        # Boot the box outside the measured calls.
+        await engine.parse_protocol()
+        for size_mib in sizes_mib:
+            started = time.perf_counter()
+            result = await engine.validate_variables(_variables(size_mib))
+            elapsed = time.perf_counter() - started
+            assert result["success"] is True, result["message"]
+            print(f"{size_mib:>6g} MiB  engine={elapsed * 1000:9.1f} ms")
+    finally:
+        await engine.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes-mib", type=float, nargs="+", default=[0.05, 1, 50])
+    parser.add_argument("--rootfs-path")
+    parser.add_argument("--image")
+    args = parser.parse_args()
+
+    if args.rootfs_path or args.image:
+        sandbox_kwargs = (
+            {"rootfs_path": args.rootfs_path}
+            if args.rootfs_path
+            else {"image": args.image}
+        )
+        asyncio.run(bench_sandbox(args.sizes_mib, sandbox_kwargs))
+    else:
+        bench_host(args.sizes_mib)
+
+
+if __name__ == "__main__":
+    main()
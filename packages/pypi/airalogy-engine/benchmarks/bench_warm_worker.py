@@ -0,0 +1,131 @@
+"""
+Benchmark per-call assign_variable latency, one-shot executor vs warm worker.
+
+By default the protocol executor runs as host subprocesses in a temporary
+directory laid out like the sandbox, which isolates process start and import
+cost from box boot. Pass ``--rootfs-path`` or ``--image`` to measure through
+``AiralogyEngine`` in a BoxLite sandbox instead. Run from
+``packages/pypi/airalogy-engine``:
+
+    uv run python benchmarks/bench_warm_worker.py
+    uv run python benchmarks/bench_warm_worker.py --rootfs-path <rootfs>
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy_engine import AiralogyEngine
+from airalogy_engine.engine import _EXECUTOR_PATH, _SERVE_RESPONSE_PREFIX
+
+_MONOREPO_ROOT = Path(__file__).resolve().parents[4]
+_EXAMPLE_PROTOCOL = _MONOREPO_ROOT / "examples/airalogy-engine"
+_PARAMS = {"var_name": "duration", "dependent_data": {"seconds": 60}}
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<10} calls={len(latencies):>4}  "
+        f"median={statistics.median(latencies) * 1000:9.2f} ms  "
+        f"min={min(latencies) * 1000:9.2f} ms  "
+        f"max={max(latencies) * 1000:9.2f} ms"
+    )
+
+
+def bench_host(calls: int) -> None:
+    with tempfile.TemporaryDirectory() as working_dir:
+        shutil.copytree(_EXAMPLE_PROTOCOL, Path(working_dir) / "protocol")
+        shutil.copy(_EXECUTOR_PATH, working_dir)
+        argv = [sys.executable, "protocol_executor.py"]
+
+        one_shot = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [*argv, "assign_variable", "protocol", json.dumps(_PARAMS)],
+                cwd=working_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            one_shot.append(time.perf_counter() - started)
+            assert json.loads(completed.stdout)["success"] is True
+
+        worker = subprocess.Popen(
+            [*argv, "serve", "protocol"],
+            cwd=working_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        request = json.dumps({"action": "assign_variable", "params": _PARAMS})
+        warm = []
+        try:
+            for _ in range(calls):
+                started = time.perf_counter()
+                worker.stdin.write(f"{request}\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+                while not line.startswith(_SERVE_RESPONSE_PREFIX):
+                    line = worker.stdout.readline()
+                warm.append(time.perf_counter() - started)
+                response = json.loads(line[len(_SERVE_RESPONSE_PREFIX) :])
+                assert response["success"] is True
+        finally:
+            worker.stdin.close()
+            worker.wait()
+
+    _report("one-shot", one_shot)
+    _report("warm", warm)
+    _report("warm[1:]", warm[1:] or warm)
+
+
+async def bench_sandbox(calls: int, sandbox_kwargs: dict) -> None:
+    for label, warm_worker in (("one-shot", False), ("warm", True)):
+        engine = AiralogyEngine(
+            str(_EXAMPLE_PROTOCOL),
+            auto_stop=False,
+            warm_worker=warm_worker,
+            **sandbox_kwargs,
+        )
+        try:
+            # Boot the box outside the measured calls.
+            await engine.parse_protocol()
+            latencies = []
+            for _ in range(calls):
+                started = time.perf_counter()
+                result = await engine.assign_variable("duration", {"seconds": 60})
+                latencies.append(time.perf_counter() - started)
+                assert result["success"] is True, result
+        finally:
+            await engine.close()
+        _report(label, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--rootfs-path")
+    parser.add_argument("--image")
+    args = parser.parse_args()
+
+    if args.rootfs_path or args.image:
+        sandbox_kwargs = (
+            {"rootfs_path": args.rootfs_path}
+            if args.rootfs_path
+            else {"image": args.image}
+        )
+        asyncio.run(bench_sandbox(args.calls, sandbox_kwargs))
+    else:
+        bench_host(args.calls)
+
+
+if __name__ == "__main__":
+    main()
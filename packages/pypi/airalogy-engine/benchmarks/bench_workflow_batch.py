@@ -0,0 +1,97 @@
+"""
+Benchmark workflow assigner calls, one executor process each vs one batch.
+
+Runs ``workflow_executor.py`` as host subprocesses in a temporary directory
+laid out like the sandbox workflow mount. The assigner module imports
+pydantic to stand in for typical assigner dependencies. Each round runs
+``--calls`` assigners either as separate processes, as the engine did for
+every transition, or as one batch invocation, as the engine now does for the
+ready transitions of a DAG pass. Run from ``packages/pypi/airalogy-engine``:
+
+    uv run python benchmarks/bench_workflow_batch.py
+    uv run python benchmarks/bench_workflow_batch.py --calls 2 8 32
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy_engine.workflow import _WORKFLOW_EXECUTOR_PATH
+
+_ASSIGNERS = """
+import pydantic
+
+
+def double(value):
+    return {"value": value * 2, "pydantic": pydantic.VERSION}
+"""
+
+
+def _run_executor(working_dir: str, params: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "workflow_executor.py", json.dumps(params)],
+        cwd=working_dir,
+        env={**os.environ, "AIRALOGY_WORKFLOW_DIR": "workflow"},
+        capture_output=True,
+        check=True,
+    )
+    result = json.loads(completed.stdout)
+    assert result["success"] is True, result
+    return result
+
+
+def bench(calls_list: list[int], runs: int) -> None:
+    with tempfile.TemporaryDirectory() as working_dir:
+        assigner_dir = Path(working_dir) / "workflow" / "assigners"
+        assigner_dir.mkdir(parents=True)
+        (assigner_dir / "workflow_assigners.py").write_text(_ASSIGNERS)
+        shutil.copy(_WORKFLOW_EXECUTOR_PATH, working_dir)
+        entrypoint = "./assigners/workflow_assigners.py:double"
+
+        for calls in calls_list:
+            separate = []
+            batched = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                for value in range(calls):
+                    params = {"entrypoint": entrypoint, "inputs": {"value": value}}
+                    _run_executor(working_dir, params)
+                separate.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                result = _run_executor(
+                    working_dir,
+                    {
+                        "batch": [
+                            {"entrypoint": entrypoint, "inputs": {"value": value}}
+                            for value in range(calls)
+                        ],
+                        "timeout": 60,
+                    },
+                )
+                batched.append(time.perf_counter() - started)
+                assert all(item["success"] for item in result["data"]["results"])
+
+            print(
+                f"calls={calls:<4} separate={min(separate) * 1000:9.1f} ms  "
+                f"batch={min(batched) * 1000:9.1f} ms  "
+                f"speedup={min(separate) / min(batched):5.1f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    bench(args.calls, args.runs)
+
+
+if __name__ == "__main__":
+    main()
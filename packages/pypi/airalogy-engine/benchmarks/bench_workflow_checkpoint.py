@@ -0,0 +1,106 @@
+"""
+Benchmark checkpointed AiralogyWorkflowEngine runs over large records.
+
+Runs the workflow of ``bench_workflow_state.py``: transitions pass a counter
+around a ring of nodes, each holding a Record of about ``--record-mib`` MiB
+of nested rows. A ``SQLiteCheckpointStore`` file saves the run after every
+transition. Reports the run time, the checkpoint file size and the time to
+``load`` the final checkpoint. Run from ``packages/pypi/airalogy-engine``:
+
+    uv run python benchmarks/bench_workflow_checkpoint.py
+    uv run python benchmarks/bench_workflow_checkpoint.py --transitions 200 --record-mib 1
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy_engine import AiralogyWorkflowEngine, SQLiteCheckpointStore
+
+
+def _write_workflow(root: Path, nodes: int, transitions: int) -> Path:
+    lines = [
+        "version: airalogy.workflow.v1",
+        "id: state_benchmark",
+        "nodes:",
+    ]
+    for index in range(nodes):
+        lines += [f"  - id: n{index}", f"    protocol: ./protocols/n{index}/protocol.aimd"]
+    lines += ["assigners: []", "transitions:"]
+    for index in range(transitions):
+        source = f"n{index % nodes}"
+        target = f"n{(index + 1) % nodes}"
+        lines += [
+            f"  - id: t{index}",
+            f"    from: {source}",
+            f"    to: {target}",
+            f"    when: ${{{source}.var.step}} >= 0",
+            "    assign:",
+            f"      {target}:",
+            f"        var.step: ${{{source}.var.step}}",
+            f"        var.last_transition: t{index}",
+        ]
+    path = root / "workflow.aimd"
+    path.write_text(
+        "# State benchmark\n\n```workflow\n" + "\n".join(lines) + "\n```\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _record(record_mib: float, step: int) -> dict:
+    row = {"sample": "s-0000", "values": [1.5, 2.5, 3.5], "ok": True}
+    row_size = len(json.dumps(row))
+    rows = [dict(row, sample=f"s-{i:04d}") for i in range(int(record_mib * 1024 * 1024 / row_size))]
+    return {"data": {"var": {"step": step, "rows": rows}}}
+
+
+async def bench(transitions: int, nodes: int, record_mib: float, runs: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workflow_path = _write_workflow(Path(root), nodes, transitions)
+        records = {f"n{index}": _record(record_mib, index) for index in range(nodes)}
+
+        timings = []
+        load_timings = []
+        for run in range(runs):
+            store_path = Path(root) / f"checkpoints-{run}.sqlite"
+            store = SQLiteCheckpointStore(store_path)
+            engine = AiralogyWorkflowEngine(
+                str(workflow_path), assigner_runtime="local", checkpoint_store=store
+            )
+            started = time.perf_counter()
+            result = await engine.run(records)
+            timings.append(time.perf_counter() - started)
+            assert result["success"] is True, result["message"]
+            assert len(result["data"]["executed_transitions"]) == transitions
+
+            started = time.perf_counter()
+            checkpoint = store.load(result["data"]["run_id"])
+            load_timings.append(time.perf_counter() - started)
+            assert checkpoint is not None and checkpoint["status"] == "succeeded"
+            store.close()
+            size_mib = store_path.stat().st_size / (1024 * 1024)
+
+    print(
+        f"transitions={transitions} nodes={nodes} record={record_mib:g} MiB  "
+        f"best={min(timings):.3f} s  "
+        f"per transition={min(timings) / transitions * 1000:.2f} ms  "
+        f"store={size_mib:.1f} MiB  load={min(load_timings):.3f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transitions", type=int, default=200)
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--record-mib", type=float, default=1.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(bench(args.transitions, args.nodes, args.record_mib, args.runs))
+
+
+if __name__ == "__main__":
+    main()
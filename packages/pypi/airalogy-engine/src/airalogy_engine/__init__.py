@@ -2,10 +2,25 @@
 
 Provides ``AiralogyEngine`` for running protocol packages inside a secure
 BoxLite sandbox, and ``AiralogyWorkflowEngine`` for executing AIMD workflow
-transition assignments.
+transition assignments. ``SandboxPool`` keeps warm boxes shared by several
+engines, and ``AiralogyEngineHost`` serves many protocols from one pool.
+``SQLiteCheckpointStore`` makes workflow runs resumable.
 """
 
-from airalogy_engine.engine import AiralogyEngine
+from airalogy_engine.checkpoint import SQLiteCheckpointStore, WorkflowCheckpointStore
+from airalogy_engine.engine import AiralogyEngine, SandboxSpec
+from airalogy_engine.host import AiralogyEngineHost
+from airalogy_engine.sandbox_pool import SandboxPool, SandboxPoolMetrics
 from airalogy_engine.workflow import AiralogyWorkflowEngine, WorkflowExecutionError
 
-__all__ = ["AiralogyEngine", "AiralogyWorkflowEngine", "WorkflowExecutionError"]
+__all__ = [
+    "AiralogyEngine",
+    "AiralogyEngineHost",
+    "AiralogyWorkflowEngine",
+    "SandboxPool",
+    "SandboxPoolMetrics",
+    "SandboxSpec",
+    "SQLiteCheckpointStore",
+    "WorkflowCheckpointStore",
+    "WorkflowExecutionError",
+]
@@ -0,0 +1,338 @@
+"""Checkpoint stores for resumable workflow runs."""
+
+from __future__ import annotations
+
+import base64
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Protocol
+
+# Key that marks an encoded value JSON has no type for, see _encode.
+_TYPE_KEY = "__airalogy_type__"
+
+
+def _encode(value: Any) -> Any:
+    """Convert ``value`` to JSON-compatible data that ``_decode_object`` restores.
+
+    Tuples, sets, dicts with non-string keys, dates and times, timedeltas,
+    Decimals, UUIDs and bytes are tagged with their type. Any other type,
+    including subclasses of the supported ones, raises ``TypeError`` rather
+    than being stored as something else.
+    """
+    kind = type(value)
+    if value is None or kind in (bool, int, float, str):
+        return value
+    if kind is list:
+        return [_encode(item) for item in value]
+    if kind is dict:
+        if _TYPE_KEY not in value and all(type(key) is str for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        items = [[_encode(key), _encode(item)] for key, item in value.items()]
+        return {_TYPE_KEY: "dict", "items": items}
+    if kind in (tuple, set, frozenset):
+        return {_TYPE_KEY: kind.__name__, "items": [_encode(item) for item in value]}
+    if kind in (datetime.datetime, datetime.time):
+        if value.tzinfo is not None and type(value.tzinfo) is not datetime.timezone:
+            raise TypeError(
+                f"{kind.__name__} with tzinfo {value.tzinfo!r} cannot be stored losslessly"
+            )
+        encoded = {_TYPE_KEY: kind.__name__, "value": value.isoformat()}
+        if value.fold:
+            encoded["fold"] = value.fold
+        return encoded
+    if kind is datetime.date:
+        return {_TYPE_KEY: "date", "value": value.isoformat()}
+    if kind is datetime.timedelta:
+        return {
+            _TYPE_KEY: "timedelta",
+            "value": [value.days, value.seconds, value.microseconds],
+        }
+    if kind in (Decimal, uuid.UUID):
+        return {_TYPE_KEY: kind.__name__, "value": str(value)}
+    if kind is bytes:
+        return {_TYPE_KEY: "bytes", "value": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"{kind.__name__} values cannot be stored losslessly")
+
+
+def _decode_object(value: dict[str, Any]) -> Any:
+    kind = value.get(_TYPE_KEY)
+    if kind is None:
+        return value
+    if kind == "dict":
+        return {key: item for key, item in value["items"]}
+    if kind == "tuple":
+        return tuple(value["items"])
+    if kind == "set":
+        return set(value["items"])
+    if kind == "frozenset":
+        return frozenset(value["items"])
+    if kind == "datetime":
+        return datetime.datetime.fromisoformat(value["value"]).replace(
+            fold=value.get("fold", 0)
+        )
+    if kind == "time":
+        return datetime.time.fromisoformat(value["value"]).replace(
+            fold=value.get("fold", 0)
+        )
+    if kind == "date":
+        return datetime.date.fromisoformat(value["value"])
+    if kind == "timedelta":
+        return datetime.timedelta(*value["value"])
+    if kind == "Decimal":
+        return Decimal(value["value"])
+    if kind == "UUID":
+        return uuid.UUID(value["value"])
+    if kind == "bytes":
+        return base64.b64decode(value["value"])
+    raise ValueError(f"unknown encoded type: {kind}")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(payload: str) -> Any:
+    return json.loads(payload, object_hook=_decode_object)
+
+
+def _shadow(state: dict[str, Any]) -> dict[str, Any]:
+    """Copy the containers of ``state`` that the engine updates in place."""
+    return {
+        key: dict(value) if type(value) is dict else list(value) if type(value) is list else value
+        for key, value in state.items()
+    }
+
+
+def _diff(old: Any, new: Any, path: list[Any], changes: list[list[Any]]) -> None:
+    """Append the changes that turn ``old`` into ``new`` to ``changes``.
+
+    Workflow state is copy-on-write, so anything unchanged since the last save
+    is the same object and is skipped without looking inside it.
+    """
+    if old is new:
+        return
+    if type(old) is dict and type(new) is dict:
+        for key in old:
+            if key not in new:
+                changes.append(["delete", [*path, key]])
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, [*path, key], changes)
+            else:
+                changes.append(["set", [*path, key], value])
+        return
+    if (
+        type(old) is list
+        and type(new) is list
+        and len(new) >= len(old)
+        and all(before is after for before, after in zip(old, new))
+    ):
+        if len(new) > len(old):
+            changes.append(["extend", path, new[len(old) :]])
+        return
+    changes.append(["set", path, new])
+
+
+def _apply(root: Any, change: list[Any]) -> Any:
+    """Apply one change from ``_diff`` to ``root`` and return the new root."""
+    operation, path = change[0], change[1]
+    if operation == "set" and not path:
+        return change[2]
+    parent = root
+    for key in path[:-1]:
+        parent = parent[key]
+    if operation == "set":
+        parent[path[-1]] = change[2]
+    elif operation == "delete":
+        del parent[path[-1]]
+    elif operation == "extend":
+        (parent[path[-1]] if path else parent).extend(change[2])
+    else:
+        raise ValueError(f"unknown checkpoint change: {operation}")
+    return root
+
+
+class WorkflowCheckpointStore(Protocol):
+    """Persist workflow run checkpoints and memoized assigner outputs.
+
+    Checkpoints and outputs are dicts of assigner results, which are usually
+    but not always JSON-compatible. ``AiralogyWorkflowEngine`` calls these
+    methods from its event loop, so implementations should return quickly; a
+    ``TypeError`` or ``ValueError`` from ``save`` fails the run, and one from
+    ``put_outputs`` leaves the outputs unmemoized. ``save`` is called after
+    every transition with the same state objects, which are never mutated
+    below their top-level containers, so a store can persist only what changed.
+    """
+
+    def save(self, run_id: str, checkpoint: dict[str, Any]) -> None:
+        """Store ``checkpoint`` as the latest state of ``run_id``."""
+        ...
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        """Return the latest checkpoint of ``run_id``, or None when unknown."""
+        ...
+
+    def get_outputs(self, key: str) -> dict[str, Any] | None:
+        """Return memoized assigner outputs for ``key``, or None."""
+        ...
+
+    def put_outputs(self, key: str, outputs: dict[str, Any]) -> None:
+        """Memoize assigner outputs under ``key``."""
+        ...
+
+
+class SQLiteCheckpointStore:
+    """Keep workflow checkpoints and memoized assigner outputs in one SQLite file.
+
+    Pass ``":memory:"`` for a store that lives only as long as this object.
+    The first save of a run stores its whole state; later saves of a running
+    run store only the records, outputs and list entries that changed since
+    the previous save, and ``load`` replays them. Values are stored
+    losslessly, so a resumed or memoized run sees the same types; values of
+    types ``_encode`` does not support raise ``TypeError``.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        # The state each running run had at its last save, to diff against.
+        self._saved: dict[str, dict[str, Any]] = {}
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS workflow_checkpoints ("
+                "run_id TEXT PRIMARY KEY, workflow_id TEXT, status TEXT, "
+                "updated_at REAL NOT NULL, checkpoint TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS workflow_checkpoint_changes ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, run_id TEXT NOT NULL, "
+                "changes TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS workflow_checkpoint_changes_run "
+                "ON workflow_checkpoint_changes (run_id, seq)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS assigner_outputs ("
+                "key TEXT PRIMARY KEY, created_at REAL NOT NULL, outputs TEXT NOT NULL)"
+            )
+
+    def save(self, run_id: str, checkpoint: dict[str, Any]) -> None:
+        state = checkpoint.get("state", {})
+        previous = self._saved.get(run_id)
+        changes: list[list[Any]] = []
+        if previous is None:
+            changes.append(["set", [], state])
+        else:
+            _diff(previous, state, [], changes)
+        header = _dumps({key: value for key, value in checkpoint.items() if key != "state"})
+        payload = _dumps(changes) if changes else None
+        with self._lock, self._connection:
+            if previous is None:
+                self._connection.execute(
+                    "DELETE FROM workflow_checkpoint_changes WHERE run_id = ?",
+                    (run_id,),
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO workflow_checkpoints "
+                "(run_id, workflow_id, status, updated_at, checkpoint) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    checkpoint.get("workflow_id"),
+                    checkpoint.get("status"),
+                    time.time(),
+                    header,
+                ),
+            )
+            if payload is not None:
+                self._connection.execute(
+                    "INSERT INTO workflow_checkpoint_changes (run_id, changes) "
+                    "VALUES (?, ?)",
+                    (run_id, payload),
+                )
+        if checkpoint.get("status") == "running":
+            self._saved[run_id] = _shadow(state)
+        else:
+            self._saved.pop(run_id, None)
+
+    def load(self, run_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checkpoint FROM workflow_checkpoints WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            change_rows = self._connection.execute(
+                "SELECT changes FROM workflow_checkpoint_changes "
+                "WHERE run_id = ? ORDER BY seq",
+                (run_id,),
+            ).fetchall()
+        if row is None:
+            return None
+        checkpoint = _loads(row[0])
+        # Checkpoints written before changes were stored separately hold
+        # their whole state.
+        state = checkpoint.get("state")
+        for (changes,) in change_rows:
+            for change in _loads(changes):
+                state = _apply(state, change)
+        if state is not None:
+            checkpoint["state"] = state
+        # The caller continues from new objects, so the next save is whole.
+        self._saved.pop(run_id, None)
+        return checkpoint
+
+    def delete(self, run_id: str) -> None:
+        """Forget the checkpoint of ``run_id``."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM workflow_checkpoints WHERE run_id = ?", (run_id,)
+            )
+            self._connection.execute(
+                "DELETE FROM workflow_checkpoint_changes WHERE run_id = ?", (run_id,)
+            )
+        self._saved.pop(run_id, None)
+
+    def run_ids(self, status: str | None = None) -> list[str]:
+        """Return stored run ids, most recently updated first."""
+        query = "SELECT run_id FROM workflow_checkpoints"
+        params: tuple[str, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY updated_at DESC", params
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_outputs(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT outputs FROM assigner_outputs WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else _loads(row[0])
+
+    def put_outputs(self, key: str, outputs: dict[str, Any]) -> None:
+        payload = _dumps(outputs)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO assigner_outputs (key, created_at, outputs) "
+                "VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+
+__all__ = ["SQLiteCheckpointStore", "WorkflowCheckpointStore"]
@@ -1,16 +1,23 @@
 import asyncio
+import codecs
 import json
 import os
 import tempfile
 import uuid
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from boxlite import Box, Boxlite, BoxOptions, BoxStateInfo, CopyOptions, Options
 from boxlite.errors import BoxliteError
 
+if TYPE_CHECKING:
+    from airalogy_engine.sandbox_pool import SandboxPool
+
 # Locate protocol_executor.py relative to this file
 _EXECUTOR_PATH = str(Path(__file__).parent / "protocol_executor.py")
 _WORKING_DIR = "/home/airalogy/protocols"
@@ -24,6 +31,29 @@ _COPY_OPTIONS = CopyOptions(
     include_parent=False,
 )
 _BACKGROUND_CLEANUP_TASKS: set[asyncio.Task[Any]] = set()
+# Must match protocol_executor.SERVE_RESPONSE_PREFIX.
+_SERVE_RESPONSE_PREFIX = "@@airalogy-response "
+# Parameters whose JSON exceeds this many bytes are sent to the executor as a
+# length-prefixed frame on stdin instead of argv, which Linux caps at 128 KiB.
+_ARGV_PARAMS_LIMIT = 64 * 1024
+# Must match protocol_executor.STDIN_PARAMS_ARG and workflow_executor's.
+_STDIN_PARAMS_ARG = "-"
+_STDIN_CHUNK_SIZE = 1024 * 1024
+# With this env var set to "1", executors report output and progress while
+# they run as stderr lines of _EVENT_PREFIX followed by one JSON event.
+# Must match protocol_executor.EVENT_PREFIX and workflow_executor's.
+_EVENTS_ENV = "AIRALOGY_ENGINE_EVENTS"
+_EVENT_PREFIX = "@@airalogy-event "
+# Only the end of stderr is kept for error messages.
+_STDERR_TAIL_LIMIT = 64 * 1024
+# Actions promised to run without injected secrets always get a fresh
+# one-shot executor, never a warm worker that served earlier requests.
+_ONE_SHOT_ACTIONS = frozenset({"migrate_schema"})
+# Receives events of sandbox executions started in the current context; set
+# by _stream_events.
+_execution_events: ContextVar[Callable[[dict[str, Any]], None] | None] = ContextVar(
+    "_execution_events", default=None
+)
 
 
 def _resolve_boxlite_home(boxlite_home: str | None) -> str:
@@ -67,9 +97,17 @@ async def _copy_out_log(box: Box, sandbox_log_file: str, log_file: str) -> None:
         shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
-def _decode_stream_line(line: str | bytes) -> str:
+def _stream_decoder() -> codecs.IncrementalDecoder:
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _decode_stream_line(
+    line: str | bytes,
+    decoder: codecs.IncrementalDecoder,
+) -> str:
+    # Decode incrementally so a character split across chunks stays intact.
     if isinstance(line, bytes):
-        return line.decode("utf-8", errors="replace")
+        return decoder.decode(line)
     return line
 
 
@@ -78,13 +116,135 @@ async def _collect_output_stream(stream: Any, output_lines: list[str]) -> None:
     if stream is None:
         return
 
+    decoder = _stream_decoder()
     try:
         async for line in stream:
-            output_lines.append(_decode_stream_line(line))
+            output_lines.append(_decode_stream_line(line, decoder))
     except Exception:
         # Stream collection is best-effort because cleanup paths may close
         # streams abruptly after a timeout-triggered kill.
         pass
+    output_lines.append(decoder.decode(b"", final=True))
+
+
+async def _collect_stderr_stream(
+    stream: Any,
+    tail: deque[str],
+    on_event: Callable[[dict[str, Any]], None] | None = None,
+) -> None:
+    """Consume a stderr stream, keeping about its last _STDERR_TAIL_LIMIT chars.
+
+    With ``on_event``, every line is also reported: executor event lines as
+    the event they carry and anything else as a ``log`` event.
+    """
+    if stream is None:
+        return
+
+    kept = 0
+
+    def keep(text: str) -> None:
+        nonlocal kept
+        tail.append(text)
+        kept += len(text)
+        while len(tail) > 1 and kept - len(tail[0]) >= _STDERR_TAIL_LIMIT:
+            kept -= len(tail.popleft())
+
+    def report(line: str) -> None:
+        assert on_event is not None
+        if line.startswith(_EVENT_PREFIX):
+            with suppress(ValueError):
+                event = json.loads(line[len(_EVENT_PREFIX) :])
+                if isinstance(event, dict):
+                    on_event(event)
+                    return
+        keep(line + "\n")
+        on_event({"type": "log", "stream": "stderr", "message": line})
+
+    decoder = _stream_decoder()
+    pending = ""
+    try:
+        async for chunk in stream:
+            text = _decode_stream_line(chunk, decoder)
+            if on_event is None:
+                keep(text)
+                continue
+            *lines, pending = (pending + text).split("\n")
+            for line in lines:
+                report(line.rstrip("\r"))
+            if len(pending) > _STDERR_TAIL_LIMIT:
+                report(pending)
+                pending = ""
+    except Exception:
+        # Best-effort, as in _collect_output_stream.
+        pass
+    text = pending + decoder.decode(b"", final=True)
+    if text and on_event is not None:
+        report(text.rstrip("\r"))
+    elif text:
+        keep(text)
+
+
+async def _stream_events(
+    run: Callable[[], Awaitable[dict[str, Any]]],
+    max_buffered_events: int,
+) -> AsyncIterator[dict[str, Any]]:
+    """Run ``run()`` and yield the events it reports, then its result.
+
+    At most ``max_buffered_events`` events wait for the consumer; older ones
+    are dropped beyond that and counted in the final ``result`` event.
+    """
+    if max_buffered_events < 1:
+        raise ValueError("max_buffered_events must be at least 1")
+
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    dropped = 0
+
+    def sink(event: dict[str, Any]) -> None:
+        nonlocal dropped
+        if queue.qsize() >= max_buffered_events:
+            queue.get_nowait()
+            dropped += 1
+        queue.put_nowait(event)
+
+    async def produce() -> dict[str, Any]:
+        _execution_events.set(sink)
+        return await run()
+
+    task = asyncio.create_task(produce())
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                await _cancel_future(getter)
+        while not queue.empty():
+            yield queue.get_nowait()
+        yield {"type": "result", "result": task.result(), "dropped_events": dropped}
+    finally:
+        await _cancel_future(task)
+
+
+def _params_channel(payload: str) -> tuple[str, bytes | None]:
+    """Return the executor argv parameter and stdin data for a JSON payload."""
+    data = payload.encode("utf-8")
+    if len(data) <= _ARGV_PARAMS_LIMIT:
+        return payload, None
+    return _STDIN_PARAMS_ARG, data
+
+
+async def _send_stdin_frame(execution: Any, data: bytes) -> None:
+    """Write ``data`` to the execution stdin behind a decimal length line."""
+    stdin = execution.stdin()
+    view = memoryview(data)
+    # A failed write surfaces as a truncated-frame error from the executor.
+    with suppress(Exception):
+        await stdin.send_input(b"%d\n" % len(data))
+        for start in range(0, len(view), _STDIN_CHUNK_SIZE):
+            await stdin.send_input(bytes(view[start : start + _STDIN_CHUNK_SIZE]))
+    with suppress(Exception):
+        await stdin.close()
 
 
 async def _cancel_future(task: asyncio.Future[Any] | None) -> None:
@@ -114,8 +274,15 @@ async def _exec_command_with_timeout(
     command: list[str],
     timeout: int,
     env: Sequence[tuple[str, str]] | None = None,
+    stdin_data: bytes | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
 ) -> tuple[Any | None, str, str, bool]:
-    """Run a low-level BoxLite execution with explicit timeout kill semantics."""
+    """Run a low-level BoxLite execution with explicit timeout kill semantics.
+
+    ``stdin_data`` is streamed to the command as a length-prefixed frame
+    while its output is collected. Only the tail of stderr is returned, and
+    ``on_event`` receives its lines as they arrive.
+    """
     execution = await box.exec(command[0], command[1:], env=env)
 
     try:
@@ -129,12 +296,17 @@ async def _exec_command_with_timeout(
         stderr_stream = None
 
     stdout_lines: list[str] = []
-    stderr_lines: list[str] = []
+    stderr_tail: deque[str] = deque()
     stdout_task = asyncio.create_task(
         _collect_output_stream(stdout_stream, stdout_lines)
     )
     stderr_task = asyncio.create_task(
-        _collect_output_stream(stderr_stream, stderr_lines)
+        _collect_stderr_stream(stderr_stream, stderr_tail, on_event)
+    )
+    stdin_task = (
+        asyncio.create_task(_send_stdin_frame(execution, stdin_data))
+        if stdin_data is not None
+        else None
     )
     wait_task = asyncio.ensure_future(execution.wait())
 
@@ -153,10 +325,11 @@ async def _exec_command_with_timeout(
                 exec_result = wait_task.result()
     finally:
         await _cancel_future(wait_task)
+        await _cancel_future(stdin_task)
         await _cancel_future(stdout_task)
         await _cancel_future(stderr_task)
 
-    return exec_result, "".join(stdout_lines), "".join(stderr_lines), timed_out
+    return exec_result, "".join(stdout_lines), "".join(stderr_tail), timed_out
 
 
 def _is_running_state(state: BoxStateInfo | None) -> bool:
@@ -171,6 +344,143 @@ def _is_running_state(state: BoxStateInfo | None) -> bool:
     return str(getattr(state, "status", "")).lower() == "running"
 
 
+@dataclass(frozen=True)
+class SandboxSpec:
+    """Hashable description of a sandbox box; pooled boxes are keyed by it."""
+
+    image: str | None
+    rootfs_path: str | None
+    memory_mib: int
+    cpus: int
+    volumes: tuple[tuple[str, str, bool], ...] = ()
+    copy_in: tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        image: str | None,
+        rootfs_path: str | None,
+        memory_mib: int,
+        cpus: int,
+        volumes: Sequence[tuple[str, str, bool]] = (),
+        copy_in: Sequence[str] = (),
+    ) -> "SandboxSpec":
+        """Resolve the default image and rootfs path the way the engines do."""
+        if image is None and rootfs_path is None:
+            image = DEFAULT_IMAGE
+
+        rootfs: Path | None = None
+        if rootfs_path is not None:
+            rootfs = Path(rootfs_path).expanduser().resolve()
+            if not rootfs.is_dir():
+                raise ValueError(f"rootfs_path must be a directory: {rootfs_path}")
+
+        return cls(
+            image=image if rootfs_path is None else None,
+            rootfs_path=str(rootfs) if rootfs is not None else None,
+            memory_mib=memory_mib,
+            cpus=cpus,
+            volumes=tuple(tuple(volume) for volume in volumes),
+            copy_in=tuple(copy_in),
+        )
+
+    def box_options(self) -> BoxOptions:
+        return BoxOptions(
+            image=self.image,
+            rootfs_path=self.rootfs_path,
+            memory_mib=self.memory_mib,
+            cpus=self.cpus,
+            working_dir=_WORKING_DIR,
+            volumes=list(self.volumes),
+        )
+
+
+class _WarmWorker:
+    """A long-lived ``protocol_executor.py serve`` process inside one box.
+
+    Requests are written to the process stdin as JSON lines and answered in
+    order, so callers must hold ``lock`` for the duration of a request.
+    """
+
+    def __init__(self, box: Box, execution: Any) -> None:
+        self.box = box
+        self.execution = execution
+        self.lock = asyncio.Lock()
+        self.closed = False
+        self._stdin = execution.stdin()
+        self._stdout = execution.stdout().__aiter__()
+        self._decoder = _stream_decoder()
+        self._buffer = ""
+        self._stderr_lines: list[str] = []
+        try:
+            stderr_stream = execution.stderr()
+        except Exception:
+            stderr_stream = None
+        # Drain stderr so a chatty protocol cannot block on a full pipe.
+        self._stderr_task = asyncio.create_task(
+            _collect_output_stream(stderr_stream, self._stderr_lines)
+        )
+
+    @classmethod
+    async def start(cls, box: Box) -> "_WarmWorker":
+        execution = await box.exec(
+            "python",
+            ["protocol_executor.py", "serve", "protocol"],
+        )
+        return cls(box, execution)
+
+    async def request(
+        self,
+        action: str,
+        params: dict,
+        env_vars: dict | None,
+    ) -> dict:
+        if self.closed:
+            raise RuntimeError("Warm worker is closed")
+
+        payload = json.dumps(
+            {"action": action, "params": params, "env": env_vars or {}},
+            separators=(",", ":"),
+        )
+        await self._stdin.send_input(f"{payload}\n".encode("utf-8"))
+
+        while True:
+            line = await self._read_line()
+            if line is None:
+                self._stderr_lines = self._stderr_lines[-50:]
+                raise RuntimeError(
+                    "Warm worker exited: " + "".join(self._stderr_lines).strip()
+                )
+            if line.startswith(_SERVE_RESPONSE_PREFIX):
+                return json.loads(line[len(_SERVE_RESPONSE_PREFIX) :])
+
+    async def _read_line(self) -> str | None:
+        # Only newly read text is scanned, so long responses stay linear.
+        pieces: list[str] = []
+        text = self._buffer
+        while (line_end := text.find("\n")) < 0:
+            pieces.append(text)
+            try:
+                chunk = await self._stdout.__anext__()
+            except StopAsyncIteration:
+                self._buffer = "".join(pieces)
+                return None
+            text = _decode_stream_line(chunk, self._decoder)
+
+        pieces.append(text[:line_end])
+        self._buffer = text[line_end + 1 :]
+        return "".join(pieces)
+
+    async def close(self) -> None:
+        self.closed = True
+        with suppress(Exception):
+            await self._stdin.close()
+        with suppress(Exception):
+            await self.execution.kill()
+        await _cancel_future(self._stderr_task)
+
+
 class AiralogyEngine:
     """Protocol execution engine backed by a shared BoxLite runtime."""
 
@@ -184,7 +494,24 @@ class AiralogyEngine:
         memory_mib: int = 512,
         cpus: int = 1,
         auto_stop: bool = True,
+        warm_worker: bool = False,
+        pool: "SandboxPool | None" = None,
     ) -> None:
+        """Create an engine for one protocol package.
+
+        With ``warm_worker=True`` the engine keeps a ``protocol_executor.py
+        serve`` process running in its box, so calls skip interpreter start
+        and protocol imports. The box then stays running between calls, as
+        with ``auto_stop=False``, until ``stop()`` or ``close()``. Calls with
+        ``debug=True`` and ``migrate_schema`` still run in a one-shot process.
+
+        With ``pool``, each call leases a box from the shared ``SandboxPool``
+        instead of owning one, so ``boxlite_home`` and ``auto_stop`` are
+        ignored and ``close()`` leaves the pool running.
+        """
+        if pool is not None and warm_worker:
+            raise ValueError("warm_worker cannot be combined with pool")
+
         proto_path = Path(protocol_path).expanduser().resolve()
         if not proto_path.is_dir():
             raise ValueError(f"protocol_path must be a directory: {protocol_path}")
@@ -201,6 +528,9 @@ class AiralogyEngine:
         self.memory_mib = memory_mib
         self.cpus = cpus
         self.auto_stop = auto_stop
+        self.warm_worker = warm_worker
+        self.pool = pool
+        self._worker: _WarmWorker | None = None
         self._runtime: Boxlite | None = None
         self._box: Box | None = None
         self._box_active_counts: dict[str, int] = {}
@@ -235,27 +565,19 @@ class AiralogyEngine:
             )
         return self._runtime
 
-    def _build_box_options(self) -> BoxOptions:
-        image = self.image
-        rootfs_path = self.rootfs_path
-        if image is None and rootfs_path is None:
-            image = DEFAULT_IMAGE
-
-        rootfs: Path | None = None
-        if rootfs_path is not None:
-            rootfs = Path(rootfs_path).expanduser().resolve()
-            if not rootfs.is_dir():
-                raise ValueError(f"rootfs_path must be a directory: {rootfs_path}")
-
-        return BoxOptions(
-            image=image if rootfs_path is None else None,
-            rootfs_path=str(rootfs) if rootfs is not None else None,
+    def _sandbox_spec(self) -> SandboxSpec:
+        return SandboxSpec.build(
+            image=self.image,
+            rootfs_path=self.rootfs_path,
             memory_mib=self.memory_mib,
             cpus=self.cpus,
-            working_dir=_WORKING_DIR,
             volumes=[(self.protocol_path, _PROTOCOL_DIR, False)],
+            copy_in=[_EXECUTOR_PATH],
         )
 
+    def _build_box_options(self) -> BoxOptions:
+        return self._sandbox_spec().box_options()
+
     async def _create_box(self) -> Box:
         runtime = self._get_runtime()
         box = await runtime.create(self._build_box_options())
@@ -308,6 +630,7 @@ class AiralogyEngine:
 
     async def stop(self) -> None:
         """Stop the current box without closing the engine."""
+        await self._discard_warm_worker()
         box = self._box
         self._box = None
         if box is not None:
@@ -326,6 +649,96 @@ class AiralogyEngine:
         self._box_active_counts[box.id] = active_count - 1
         return active_count - 1
 
+    async def _finish_sandbox_command(self, box: Box, timed_out: bool) -> None:
+        remaining_active = self._finish_box_command(box)
+        if self.auto_stop and remaining_active == 0 and self._box is box:
+            self._box = None
+            if timed_out:
+                _track_background_cleanup(
+                    asyncio.create_task(_stop_box_best_effort(box))
+                )
+            else:
+                await self._stop_box(box)
+
+    async def _ensure_warm_worker(self, box: Box) -> _WarmWorker:
+        worker = self._worker
+        if worker is not None and not worker.closed and worker.box is box:
+            return worker
+
+        await self._discard_warm_worker()
+        new_worker = await _WarmWorker.start(box)
+        current_worker = self._worker
+        if current_worker is not None and not current_worker.closed:
+            await new_worker.close()
+            return current_worker
+
+        self._worker = new_worker
+        return new_worker
+
+    async def _discard_warm_worker(self, worker: _WarmWorker | None = None) -> None:
+        current_worker = self._worker
+        if worker is None:
+            worker = current_worker
+        if worker is None:
+            return
+        if worker is current_worker:
+            self._worker = None
+        await worker.close()
+
+    async def _execute_in_warm_worker(
+        self,
+        action: str,
+        params: dict,
+        env_vars: dict | None,
+        timeout: int,
+    ) -> dict:
+        """Execute an action in the engine's long-lived protocol executor."""
+        box: Box | None = None
+        try:
+            box = await self._ensure_running_box()
+            self._begin_box_command(box)
+            worker = await self._ensure_warm_worker(box)
+            async with worker.lock:
+                try:
+                    return await asyncio.wait_for(
+                        worker.request(action, params, env_vars),
+                        timeout=timeout,
+                    )
+                except asyncio.TimeoutError:
+                    await self._discard_warm_worker(worker)
+                    return {
+                        "success": False,
+                        "message": f"Execution timed out after {timeout} seconds",
+                        "output": "",
+                    }
+                except json.JSONDecodeError as e:
+                    await self._discard_warm_worker(worker)
+                    return {
+                        "success": False,
+                        "message": "Invalid JSON output from protocol executor",
+                        "output": str(e),
+                    }
+                except (BoxliteError, RuntimeError):
+                    await self._discard_warm_worker(worker)
+                    raise
+        except (BoxliteError, RuntimeError) as e:
+            return {
+                "success": False,
+                "message": f"Sandbox error: {str(e)}",
+                "output": "",
+            }
+        except BaseException as e:
+            if not _is_pyo3_panic(e):
+                raise
+            return {
+                "success": False,
+                "message": f"Sandbox runtime error: {str(e)}",
+                "output": "",
+            }
+        finally:
+            if box is not None:
+                self._finish_box_command(box)
+
     async def _execute_in_sandbox(
         self,
         action: str,
@@ -348,27 +761,53 @@ class AiralogyEngine:
             env_pairs.append(("PROTOCOL_DEBUG", "1"))
             env_pairs.append(("PROTOCOL_DEBUG_LOG_FILE", sandbox_log_file))
 
+        on_event = _execution_events.get()
+        if on_event is not None:
+            env_pairs = [(k, v) for k, v in env_pairs if k != _EVENTS_ENV]
+            env_pairs.append((_EVENTS_ENV, "1"))
+
         effective_timeout = self.timeout if timeout is None else timeout
+        if (
+            self.warm_worker
+            and not debug
+            and on_event is None
+            and action not in _ONE_SHOT_ACTIONS
+        ):
+            return await self._execute_in_warm_worker(
+                action,
+                params,
+                env_vars,
+                effective_timeout,
+            )
+
         box: Box | None = None
         result: dict | None = None
 
         timed_out = False
         try:
-            box = await self._ensure_running_box()
-            self._begin_box_command(box)
+            if self.pool is not None:
+                box = await self.pool.acquire(self._sandbox_spec())
+            else:
+                box = await self._ensure_running_box()
+                self._begin_box_command(box)
 
+            params_arg, stdin_data = _params_channel(
+                json.dumps(params, separators=(",", ":"))
+            )
             command = [
                 "python",
                 "protocol_executor.py",
                 action,
                 "protocol",
-                json.dumps(params, separators=(",", ":")),
+                params_arg,
             ]
             exec_result, stdout, stderr, timed_out = await _exec_command_with_timeout(
                 box,
                 command,
                 effective_timeout,
                 env=env_pairs,
+                stdin_data=stdin_data,
+                on_event=on_event,
             )
 
             if timed_out:
@@ -390,14 +829,13 @@ class AiralogyEngine:
                     "output": stderr.strip(),
                 }
             else:
-                output = stdout.strip()
                 try:
-                    result = json.loads(output)
+                    result = json.loads(stdout)
                 except json.JSONDecodeError:
                     result = {
                         "success": False,
                         "message": "Invalid JSON output from protocol executor",
-                        "output": output,
+                        "output": stdout.strip(),
                     }
         except BoxliteError as e:
             result = {
@@ -423,15 +861,10 @@ class AiralogyEngine:
             if box is not None:
                 if debug:
                     await _copy_out_log(box, sandbox_log_file, log_file)
-                remaining_active = self._finish_box_command(box)
-                if self.auto_stop and remaining_active == 0 and self._box is box:
-                    self._box = None
-                    if timed_out:
-                        _track_background_cleanup(
-                            asyncio.create_task(_stop_box_best_effort(box))
-                        )
-                    else:
-                        await self._stop_box(box)
+                if self.pool is not None:
+                    self.pool.release(box, discard=timed_out)
+                else:
+                    await self._finish_sandbox_command(box, timed_out)
 
         if result is None:
             return {
@@ -442,6 +875,33 @@ class AiralogyEngine:
 
         return result
 
+    async def stream(
+        self,
+        action: str,
+        params: dict | None = None,
+        env_vars: dict | None = None,
+        timeout: int | None = None,
+        max_buffered_events: int = 1000,
+    ) -> AsyncIterator[dict]:
+        """Run one executor action and yield events while it runs.
+
+        ``action`` is the name of an engine method such as
+        ``"assign_variable"`` and ``params`` the parameters the executor
+        receives for it. Lines the protocol prints arrive as ``log`` events
+        with ``stream="stdout"``, other executor stderr lines with
+        ``stream="stderr"``, and lines printed as ``PROGRESS_PREFIX`` plus a
+        JSON object as ``progress`` events. The last event has
+        ``type="result"`` and holds the result the method would return.
+        Streamed actions run in a one-shot executor even with ``warm_worker``.
+        """
+        async for event in _stream_events(
+            lambda: self._execute_in_sandbox(
+                action, params or {}, env_vars=env_vars, timeout=timeout
+            ),
+            max_buffered_events,
+        ):
+            yield event
+
     async def parse_protocol(
         self,
         env_vars: dict | None = None,
@@ -482,6 +942,37 @@ class AiralogyEngine:
             log_file=log_file,
         )
 
+    async def assign_cascade(
+        self,
+        changed_fields: list[str],
+        data: dict,
+        max_workers: int = 1,
+        env_vars: dict | None = None,
+        timeout: int | None = None,
+        debug: bool = False,
+        log_file: str = "protocol_debug.log",
+    ) -> dict:
+        """Run every automatic assigner affected by `changed_fields` in one call.
+
+        Assigners run in dependency order inside one sandbox process, and the
+        result holds all assigned fields with per-assigner timings, errors and
+        skipped assigners. With `max_workers` > 1, independent assigners run
+        concurrently in a thread pool inside the sandbox.
+        """
+        params = {
+            "changed_fields": changed_fields,
+            "data": data,
+            "max_workers": max_workers,
+        }
+        return await self._execute_in_sandbox(
+            "assign_cascade",
+            params,
+            env_vars=env_vars,
+            timeout=timeout,
+            debug=debug,
+            log_file=log_file,
+        )
+
     async def validate_variables(
         self,
         variables: dict,
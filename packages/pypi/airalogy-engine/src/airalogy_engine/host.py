@@ -0,0 +1,115 @@
+"""Host many protocol packages over one bounded set of sandbox boxes."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+
+from airalogy_engine.engine import AiralogyEngine
+from airalogy_engine.sandbox_pool import SandboxPool, SandboxPoolMetrics
+
+
+class AiralogyEngineHost:
+    """Serve any number of protocols from a shared ``SandboxPool``.
+
+    ``engine(protocol_path)`` returns an ``AiralogyEngine`` that leases boxes
+    from the host pool. Boxes are keyed by the mounted protocol, so requests
+    for a protocol are routed to a box that already has it mounted, and when
+    ``max_boxes`` is reached the least recently used idle box is stopped to
+    mount another protocol. Sandbox memory is therefore bounded by the pool
+    size rather than the protocol catalog.
+
+    Up to ``max_engines`` engine objects are kept in LRU order; evicting one
+    releases no sandbox resources because the pool owns every box.
+    """
+
+    def __init__(
+        self,
+        boxlite_home: str | None = None,
+        *,
+        pool: SandboxPool | None = None,
+        image: str | None = None,
+        rootfs_path: str | None = None,
+        timeout: int = 300,
+        memory_mib: int = 512,
+        cpus: int = 1,
+        max_boxes: int = 4,
+        max_concurrency_per_box: int = 1,
+        idle_ttl: float = 300.0,
+        max_engines: int = 1024,
+    ) -> None:
+        """Create a host with its own pool, or one sharing ``pool``.
+
+        ``boxlite_home``, ``max_boxes``, ``max_concurrency_per_box`` and
+        ``idle_ttl`` configure the pool the host creates and are ignored when
+        ``pool`` is given; the host then leaves that pool open on ``close()``.
+        """
+        if max_engines < 1:
+            raise ValueError("max_engines must be at least 1")
+
+        self.image = image
+        self.rootfs_path = rootfs_path
+        self.timeout = timeout
+        self.memory_mib = memory_mib
+        self.cpus = cpus
+        self.max_engines = max_engines
+        self._owns_pool = pool is None
+        self.pool = (
+            pool
+            if pool is not None
+            else SandboxPool(
+                boxlite_home,
+                max_boxes=max_boxes,
+                max_concurrency_per_box=max_concurrency_per_box,
+                idle_ttl=idle_ttl,
+            )
+        )
+        self._engines: OrderedDict[str, AiralogyEngine] = OrderedDict()
+        self._closed = False
+
+    async def __aenter__(self) -> "AiralogyEngineHost":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def engine(self, protocol_path: str) -> AiralogyEngine:
+        """Return the pooled engine for ``protocol_path``, creating it on first use."""
+        if self._closed:
+            raise ValueError("AiralogyEngineHost is closed")
+
+        key = str(Path(protocol_path).expanduser().resolve())
+        engine = self._engines.get(key)
+        if engine is not None:
+            self._engines.move_to_end(key)
+            return engine
+
+        engine = AiralogyEngine(
+            key,
+            image=self.image,
+            rootfs_path=self.rootfs_path,
+            timeout=self.timeout,
+            memory_mib=self.memory_mib,
+            cpus=self.cpus,
+            pool=self.pool,
+        )
+        self._engines[key] = engine
+        while len(self._engines) > self.max_engines:
+            self._engines.popitem(last=False)
+        return engine
+
+    @property
+    def protocols(self) -> list[str]:
+        """Resolved protocol paths with a cached engine, least recently used first."""
+        return list(self._engines)
+
+    def metrics(self) -> SandboxPoolMetrics:
+        """Return the metrics of the host pool."""
+        return self.pool.metrics()
+
+    async def close(self) -> None:
+        """Drop cached engines and close the pool when the host created it."""
+        self._closed = True
+        self._engines.clear()
+        if self._owns_pool:
+            await self.pool.close()
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import importlib.util
 import hashlib
@@ -11,6 +12,7 @@ from contextlib import redirect_stdout
 from datetime import timedelta
 from typing import get_args, get_origin
 
+from airalogy import __version__ as airalogy_version
 from airalogy.assigner import DefaultAssigner
 from airalogy.ingest import import_records as import_airalogy_records
 from airalogy.migrations import (
@@ -35,10 +37,26 @@ if _debug_mode:
     _file_handler.setFormatter(formatter)
     logger.addHandler(_file_handler)
 
+# With AIRALOGY_ENGINE_EVENTS=1 the engine is streaming this execution: protocol
+# output is reported as it is printed through stderr lines of EVENT_PREFIX
+# followed by one JSON event. Protocol code reports progress by printing
+# PROGRESS_PREFIX followed by a JSON object, e.g. {"current": 3, "total": 10}.
+EVENT_PREFIX = "@@airalogy-event "
+PROGRESS_PREFIX = "@@airalogy-progress "
+_events_enabled = os.environ.get("AIRALOGY_ENGINE_EVENTS", "0") == "1"
+
 timedelta_adapter = TypeAdapter(timedelta)
 
 _PROTOCOL_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_\-]*$")
 
+# Content hash of the protocol.aimd that aimd_model.py was generated from.
+_AIMD_MODEL_HASH_FILE = ".aimd_model.sha256"
+# Hash each imported aimd_model module was generated from, per protocol.
+_loaded_aimd_model_hashes: dict[str, str] = {}
+# (protocol, assigned key, dependent keys) -> (aimd VarModel, model.py VarModel,
+# TypeAdapter of the dependent data ParamsModel).
+_params_adapter_cache: dict[tuple, tuple] = {}
+
 
 def _validate_protocol_name(protocol_name: str) -> str:
     """Validate protocol_name to prevent path traversal."""
@@ -67,31 +85,58 @@ class RNJSONEncoder(json.JSONEncoder):
             return json.JSONEncoder.default(self, obj)
 
 
+def emit_event(event: dict) -> None:
+    """Report one event to a streaming engine; a no-op when not streaming."""
+    if not _events_enabled:
+        return
+    line = json.dumps(event, default=str, separators=(",", ":"), ensure_ascii=False)
+    sys.__stderr__.write(f"{EVENT_PREFIX}{line}\n")
+    sys.__stderr__.flush()
+
+
+def _stdout_event(line: str) -> dict:
+    if line.startswith(PROGRESS_PREFIX):
+        try:
+            progress = json.loads(line[len(PROGRESS_PREFIX) :])
+        except ValueError:
+            progress = None
+        if isinstance(progress, dict):
+            return {**progress, "type": "progress"}
+    return {"type": "log", "stream": "stdout", "message": line}
+
+
 class ProtocolStdoutLogger:
-    """Capture protocol stdout and forward it into the debug logger."""
+    """Capture protocol stdout into the debug logger and streamed events."""
 
     encoding = "utf-8"
 
-    def __init__(self, enabled: bool):
+    def __init__(self, enabled: bool, events: bool = False):
         self.enabled = enabled
+        self.events = events
         self._buffer = ""
 
+    def _forward(self, line: str) -> None:
+        if self.enabled:
+            logger.debug(f"protocol stdout: {line}")
+        if self.events:
+            emit_event(_stdout_event(line))
+
     def write(self, value: str) -> int:
         if not value:
             return 0
 
-        if not self.enabled:
+        if not self.enabled and not self.events:
             return len(value)
 
         self._buffer += value
         while "\n" in self._buffer:
             line, self._buffer = self._buffer.split("\n", 1)
-            logger.debug(f"protocol stdout: {line.rstrip('\r')}")
+            self._forward(line.rstrip("\r"))
         return len(value)
 
     def flush(self) -> None:
-        if self.enabled and self._buffer:
-            logger.debug(f"protocol stdout: {self._buffer.rstrip('\r')}")
+        if self._buffer:
+            self._forward(self._buffer.rstrip("\r"))
             self._buffer = ""
 
 
@@ -132,19 +177,68 @@ def import_module(module_name, force_reload=False):
         raise ImportError(error_msg) from e
 
 
-def _load_aimd_model(protocol_name: str):
-    """Generate and load the AIMD model module for the protocol."""
+def _aimd_model_hash(aimd: str) -> str:
+    # The generated code also depends on the installed airalogy version.
+    hasher = hashlib.sha256(airalogy_version.encode("utf-8"))
+    hasher.update(aimd.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _sync_aimd_model(protocol_name: str, aimd: str | None = None) -> str:
+    """Regenerate aimd_model.py only when protocol.aimd changed.
+
+    The content hash of the AIMD source is kept next to the generated module,
+    so an unchanged protocol skips parsing and code generation entirely.
+    Returns the hash of the current protocol.aimd.
+    """
     protocol_path = _validate_protocol_name(protocol_name)
-    try:
+    if aimd is None:
         with open(f"{protocol_path}/protocol.aimd", encoding="utf-8") as aimd_file:
             aimd = aimd_file.read()
-        aimd_model_code = generate_model(aimd)
-        with open(f"{protocol_path}/aimd_model.py", "w", encoding="utf-8") as out_file:
-            out_file.write(aimd_model_code)
+    digest = _aimd_model_hash(aimd)
+
+    model_path = f"{protocol_path}/aimd_model.py"
+    hash_path = f"{protocol_path}/{_AIMD_MODEL_HASH_FILE}"
+    try:
+        with open(hash_path, encoding="utf-8") as hash_file:
+            stored_digest = hash_file.read().strip()
+    except OSError:
+        stored_digest = None
+    if stored_digest == digest and os.path.isfile(model_path):
+        return digest
+
+    aimd_model_code = generate_model(aimd)
+    with open(model_path, "w", encoding="utf-8") as out_file:
+        out_file.write(aimd_model_code)
+    # Written last so an interrupted regeneration is redone on the next call.
+    with open(hash_path, "w", encoding="utf-8") as hash_file:
+        hash_file.write(digest)
+    return digest
+
+
+def _import_aimd_model(protocol_name: str, digest: str):
+    """Import aimd_model.py, reusing the loaded module while its hash matches."""
+    module_name = f"{protocol_name}.aimd_model"
+    if (
+        _loaded_aimd_model_hashes.get(protocol_name) == digest
+        and module_name in sys.modules
+    ):
+        return sys.modules[module_name]
+
+    model = import_module(module_name, force_reload=True)
+    if model is not None:
+        _loaded_aimd_model_hashes[protocol_name] = digest
+    return model
+
+
+def _load_aimd_model(protocol_name: str):
+    """Generate (when stale) and load the AIMD model module for the protocol."""
+    try:
+        digest = _sync_aimd_model(protocol_name)
     except AimdParseError as e:
         raise ValueError(f"Error parsing protocol.aimd: {e}") from e
 
-    model = import_module(f"{protocol_name}.aimd_model", force_reload=True)
+    model = _import_aimd_model(protocol_name, digest)
     if model is None or not hasattr(model, "VarModel"):
         raise ValueError(f"Failed to load AIMD model for protocol `{protocol_name}`")
     return model
@@ -172,9 +266,7 @@ def parse_protocol(protocol_name: str):
         with open(f"{protocol_path}/protocol.aimd", encoding="utf-8") as aimd_file:
             aimd = aimd_file.read()
         fields = parse_aimd(aimd)["templates"]
-        aimd_model_code = generate_model(aimd)
-        with open(f"{protocol_path}/aimd_model.py", "w", encoding="utf-8") as out_file:
-            out_file.write(aimd_model_code)
+        aimd_model_digest = _sync_aimd_model(protocol_name, aimd=aimd)
         _ensure_assigner(protocol_name, aimd=aimd)
     except AimdParseError as e:
         raise ValueError(f"Error parsing protocol.aimd: {e}") from e
@@ -219,7 +311,7 @@ def parse_protocol(protocol_name: str):
     }
 
     # load aimd model
-    aimd_model = import_module(f"{protocol_name}.aimd_model", force_reload=True)
+    aimd_model = _import_aimd_model(protocol_name, aimd_model_digest)
     if aimd_model and hasattr(aimd_model, "VarModel"):
         effective_var_model = _merge_protocol_var_model(
             protocol_name,
@@ -298,7 +390,70 @@ def _ensure_assigner(protocol_name: str, aimd: str | None = None) -> None:
             raise ValueError(f"Error parsing protocol.aimd: {e}") from e
 
 
-def assign_variable(protocol_name: str, params: dict) -> dict:
+def _build_params_adapter(fields: dict, dependent_keys) -> TypeAdapter:
+    """Build the validation adapter for one set of dependent data keys."""
+    attrs = {}
+    for k in dependent_keys:
+        if k in fields:
+            attrs[k] = (fields[k].annotation, fields[k].default)
+        elif "." in k:
+            var_table_name, sub_var_name = k.split(".", 1)
+            if var_table_name not in fields:
+                raise ValueError(f"Var: {var_table_name} not defined in VarModel")
+            if get_origin(fields[var_table_name].annotation) is not list:
+                raise ValueError(
+                    f"Var table variable: {var_table_name} must be a list"
+                )
+            table_type = get_args(fields[var_table_name].annotation)[0]
+            if sub_var_name in table_type.model_fields:
+                attrs[k] = (
+                    table_type.model_fields[sub_var_name].annotation,
+                    table_type.model_fields[sub_var_name].default,
+                )
+            else:
+                attrs[k] = (str, ...)
+        else:
+            attrs[k] = (str, ...)
+    ParamsModel = create_model("ParamsModel", **attrs)
+    if _debug_mode:
+        logger.info(f"ParamsModel: {ParamsModel.model_json_schema()}")
+    return TypeAdapter(ParamsModel)
+
+
+def _get_params_adapter(
+    protocol_name: str,
+    var_name: str,
+    dependent_keys: frozenset,
+    aimd_var_model,
+    protocol_var_model,
+) -> TypeAdapter:
+    """Return the cached dependent data adapter for one assigned key.
+
+    Entries are reused while the protocol's VarModel classes are the same
+    objects, so reloading aimd_model.py or model.py rebuilds them.
+    """
+    cache_key = (protocol_name, var_name, dependent_keys)
+    cached = _params_adapter_cache.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] is aimd_var_model
+        and cached[1] is protocol_var_model
+    ):
+        return cached[2]
+
+    fields = aimd_var_model.model_fields
+    if protocol_var_model is not None:
+        fields = deep_merge(fields, protocol_var_model.model_fields)
+    adapter = _build_params_adapter(fields, sorted(dependent_keys))
+    _params_adapter_cache[cache_key] = (aimd_var_model, protocol_var_model, adapter)
+    return adapter
+
+
+def _load_protocol_assigner(protocol_name: str):
+    """Load the protocol's assigner class and the VarModels its data follows.
+
+    Returns (assigner, aimd VarModel, model.py VarModel or None).
+    """
     _validate_protocol_name(protocol_name)
     _ensure_assigner(protocol_name)
 
@@ -314,12 +469,21 @@ def assign_variable(protocol_name: str, params: dict) -> dict:
 
     # load aimd_model
     aimd_model = _load_aimd_model(protocol_name)
-    fields = aimd_model.VarModel.model_fields
 
     # load model
     var_model = import_module(f"{protocol_name}.model")
-    if var_model is not None and hasattr(var_model, "VarModel"):
-        fields = deep_merge(fields, var_model.VarModel.model_fields)
+    protocol_var_model = (
+        var_model.VarModel
+        if var_model is not None and hasattr(var_model, "VarModel")
+        else None
+    )
+    return assigner, aimd_model.VarModel, protocol_var_model
+
+
+def assign_variable(protocol_name: str, params: dict) -> dict:
+    assigner, aimd_var_model, protocol_var_model = _load_protocol_assigner(
+        protocol_name
+    )
 
     try:
         raw_dependent_data = params.get("dependent_data", {})
@@ -335,35 +499,23 @@ def assign_variable(protocol_name: str, params: dict) -> dict:
         }
 
         # dependent_data validation and type convert
-        attrs = {}
-        for k, v in raw_dependent_data.items():
-            if k in fields:
-                attrs[k] = (fields[k].annotation, fields[k].default)
-            elif "." in k:
-                var_table_name, sub_var_name = k.split(".", 1)
-                if var_table_name not in fields:
-                    raise ValueError(f"Var: {var_table_name} not defined in VarModel")
-                if get_origin(fields[var_table_name].annotation) is not list:
-                    raise ValueError(
-                        f"Var table variable: {var_table_name} must be a list"
-                    )
-                table_type = get_args(fields[var_table_name].annotation)[0]
-                if sub_var_name in table_type.model_fields:
-                    attrs[k] = (
-                        table_type.model_fields[sub_var_name].annotation,
-                        table_type.model_fields[sub_var_name].default,
-                    )
-                else:
-                    attrs[k] = (str, ...)
-            else:
-                attrs[k] = (str, ...)
-        ParamsModel = create_model("ParamsModel", **attrs)
-        logger.info(f"ParamsModel: {ParamsModel.model_json_schema()}")
+        params_adapter = _get_params_adapter(
+            protocol_name,
+            params["var_name"],
+            frozenset(raw_dependent_data),
+            aimd_var_model,
+            protocol_var_model,
+        )
         try:
-            dependent_data = ParamsModel(**raw_dependent_data)
+            dependent_data = params_adapter.validate_python(raw_dependent_data)
         except ValidationError as e:
             raise ValueError(f"Dependent data validation failed: {e}") from e
-        res = assigner.assign(params["var_name"], dict(dependent_data))
+        if assigner.is_async_assigner(params["var_name"]):
+            res = asyncio.run(
+                assigner.aassign(params["var_name"], dict(dependent_data))
+            )
+        else:
+            res = assigner.assign(params["var_name"], dict(dependent_data))
         return res.model_dump()
     except ValueError:
         raise
@@ -371,6 +523,54 @@ def assign_variable(protocol_name: str, params: dict) -> dict:
         raise ValueError(f"Assigner function execute fail, error: {e}") from e
 
 
+def assign_cascade(protocol_name: str, params: dict) -> dict:
+    """Run every automatic assigner affected by the changed fields."""
+    assigner, aimd_var_model, protocol_var_model = _load_protocol_assigner(
+        protocol_name
+    )
+
+    changed_fields = params.get("changed_fields", [])
+    if not isinstance(changed_fields, list):
+        raise ValueError("changed_fields must be a list")
+    data = params.get("data", {})
+    if not isinstance(data, dict):
+        raise ValueError("data must be a dict")
+    max_workers = params.get("max_workers", 1)
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    def prepare_dependent_data(assigned_key: str, dependent_data: dict) -> dict:
+        params_adapter = _get_params_adapter(
+            protocol_name,
+            assigned_key,
+            frozenset(dependent_data),
+            aimd_var_model,
+            protocol_var_model,
+        )
+        try:
+            return dict(params_adapter.validate_python(dependent_data))
+        except ValidationError as e:
+            raise ValueError(f"Dependent data validation failed: {e}") from e
+
+    if any(assigner.is_async_assigner(key) for key in assigner.assigned_info):
+        res = asyncio.run(
+            assigner.aassign_cascade(
+                changed_fields,
+                data,
+                prepare_dependent_data=prepare_dependent_data,
+                max_concurrency=max_workers,
+            )
+        )
+    else:
+        res = assigner.assign_cascade(
+            changed_fields,
+            data,
+            prepare_dependent_data=prepare_dependent_data,
+            max_workers=max_workers,
+        )
+    return res.model_dump()
+
+
 def validate_variables(protocol_name: str, variables: dict) -> dict:
     _validate_protocol_name(protocol_name)
     data = {"data": variables}
@@ -479,19 +679,26 @@ def migrate_schema(protocol_name: str, params: dict) -> dict:
     }
 
 
-def main(action: str, protocol_name: str, input_params: str):
-    logger.info(
-        f"action: {action}, protocol_name: {protocol_name}, input_params: {input_params}"
-    )
-    stdout_capture = ProtocolStdoutLogger(enabled=_debug_mode)
+def _execute(
+    action: str,
+    protocol_name: str,
+    input_params: str | bytes | dict,
+) -> str:
+    """Run one action and return the JSON-encoded response envelope."""
+    stdout_capture = ProtocolStdoutLogger(enabled=_debug_mode, events=_events_enabled)
     try:
         with redirect_stdout(stdout_capture):
-            params = json.loads(input_params)
+            if isinstance(input_params, (str, bytes)):
+                params = json.loads(input_params)
+            else:
+                params = input_params
 
             if action == "parse_protocol":
                 result = parse_protocol(protocol_name)
             elif action == "assign_variable":
                 result = assign_variable(protocol_name, params)
+            elif action == "assign_cascade":
+                result = assign_cascade(protocol_name, params)
             elif action == "validate_variables":
                 result = validate_variables(protocol_name, params)
             elif action == "import_records":
@@ -516,12 +723,145 @@ def main(action: str, protocol_name: str, input_params: str):
     finally:
         stdout_capture.flush()
 
-    logger.info(f"output: {output}")
-    print(output)
+    logger.info("output: %s", output)
+    return output
+
+
+def main(action: str, protocol_name: str, input_params: str | bytes):
+    # Lazy formatting: large parameters are only rendered when logging is on.
+    logger.info(
+        "action: %s, protocol_name: %s, input_params: %s",
+        action,
+        protocol_name,
+        input_params,
+    )
+    print(_execute(action, protocol_name, input_params))
+
+
+# Passed in place of the JSON parameter when the engine sends it on stdin as
+# b"<byte length>\n" followed by the JSON bytes, for payloads too large for argv.
+STDIN_PARAMS_ARG = "-"
+
+
+def read_stdin_params(stream=None) -> bytes:
+    """Read one length-prefixed JSON parameter frame from stdin."""
+    stream = sys.stdin.buffer if stream is None else stream
+    header = stream.readline()
+    try:
+        length = int(header)
+    except ValueError:
+        raise ValueError(
+            f"Invalid stdin parameter frame header: {header[:32]!r}"
+        ) from None
+    payload = stream.read(length)
+    if len(payload) != length:
+        raise ValueError(
+            f"Truncated stdin parameters: expected {length} bytes, got {len(payload)}"
+        )
+    return payload
+
+
+# Responses written by `serve` start with this prefix so stray output written
+# straight to the process stdout by protocol code cannot be mistaken for one.
+SERVE_RESPONSE_PREFIX = "@@airalogy-response "
+_SERVE_IGNORED_FILES = {"aimd_model.py", _AIMD_MODEL_HASH_FILE}
+
+
+def _protocol_snapshot(protocol_name: str) -> tuple:
+    """Return a cheap fingerprint of the protocol package's files.
+
+    Covers every top-level file and every ``.py`` file in subpackages, so an
+    edit to a helper module imported by ``model.py`` or ``assigner.py`` also
+    reloads the protocol. Data files below the top level are not stat'ed.
+    """
+    protocol_path = _validate_protocol_name(protocol_name)
+    entries = []
+    for root, dirs, files in os.walk(protocol_path):
+        dirs[:] = [name for name in dirs if name != "__pycache__"]
+        relative_root = os.path.relpath(root, protocol_path)
+        for name in files:
+            if relative_root == ".":
+                if name in _SERVE_IGNORED_FILES:
+                    continue
+                relative_name = name
+            elif name.endswith(".py"):
+                relative_name = os.path.join(relative_root, name)
+            else:
+                continue
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except FileNotFoundError:
+                continue
+            entries.append((relative_name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _unload_protocol_modules(protocol_name: str) -> None:
+    """Forget imported protocol modules and the assigners they registered."""
+    for module_name in list(sys.modules):
+        if module_name == protocol_name or module_name.startswith(f"{protocol_name}."):
+            sys.modules.pop(module_name, None)
+    _loaded_aimd_model_hashes.pop(protocol_name, None)
+    for cache_key in [key for key in _params_adapter_cache if key[0] == protocol_name]:
+        del _params_adapter_cache[cache_key]
+    DefaultAssigner.clear_assigners()
+
+
+def serve(protocol_name: str, stdin=None, stdout=None) -> None:
+    """Answer newline-delimited JSON requests until stdin is closed.
+
+    Each request is ``{"action": ..., "params": ..., "env": {...}}``. The
+    response envelope matches the one-shot output, is written on one line
+    prefixed with ``SERVE_RESPONSE_PREFIX``, and protocol modules stay
+    imported between requests until a protocol file changes.
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    _validate_protocol_name(protocol_name)
+    snapshot = None
+
+    for line in stdin:
+        if not line.strip():
+            continue
+
+        base_env = dict(os.environ)
+        try:
+            request = json.loads(line)
+            action = request["action"]
+            params = request.get("params", {})
+            os.environ.update(
+                {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+            )
+            if snapshot is not None and _protocol_snapshot(protocol_name) != snapshot:
+                _unload_protocol_modules(protocol_name)
+
+            logger.info(f"serve action: {action}, protocol_name: {protocol_name}")
+            output = _execute(action, protocol_name, params)
+            # Taken after the request so files it generates (assigner.py)
+            # do not count as a change on the next one.
+            snapshot = _protocol_snapshot(protocol_name)
+        except Exception as e:
+            logger.exception(e)
+            output = json.dumps(
+                {"success": False, "message": repr(e), "error_type": type(e).__name__},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+        finally:
+            os.environ.clear()
+            os.environ.update(base_env)
+
+        stdout.write(f"{SERVE_RESPONSE_PREFIX}{output}\n")
+        stdout.flush()
 
 
 if __name__ == "__main__":
     action = sys.argv[1]
     protocol_name = sys.argv[2]
+    if action == "serve":
+        serve(protocol_name)
+        sys.exit(0)
     params = sys.argv[3] if len(sys.argv) > 3 else "{}"
+    if params == STDIN_PARAMS_ARG:
+        params = read_stdin_params()
     main(action, protocol_name, params)
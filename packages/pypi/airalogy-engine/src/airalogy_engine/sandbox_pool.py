@@ -0,0 +1,500 @@
+"""Warm BoxLite sandbox pool shared by Airalogy engines."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from boxlite import Box, Boxlite, Options
+
+from airalogy_engine.engine import (
+    _COPY_OPTIONS,
+    _WORKING_DIR,
+    SandboxSpec,
+    _is_running_state,
+    _resolve_boxlite_home,
+    _stop_box_best_effort,
+    _track_background_cleanup,
+)
+
+# Returned by _reserve when the caller may boot a new box.
+_CREATE = object()
+
+
+@dataclass(frozen=True)
+class SandboxPoolMetrics:
+    """Snapshot of a SandboxPool's occupancy and cumulative timings.
+
+    Times are in seconds. ``utilization`` is the share of box lifetime spent
+    with at least one lease, over every box the pool has run.
+    """
+
+    boxes: int
+    busy_boxes: int
+    leases: int
+    waiting: int
+    total_leases: int
+    boxes_created: int
+    boxes_stopped: int
+    unhealthy_boxes: int
+    queue_wait_total: float
+    queue_wait_max: float
+    boot_time_total: float
+    boot_time_max: float
+    utilization: float
+
+
+@dataclass(eq=False)
+class _PooledBox:
+    box: Box
+    spec: SandboxSpec
+    created_at: float
+    last_used: float
+    last_checked: float
+    active: int = 0
+    busy_since: float | None = None
+    busy_time: float = 0.0
+    healthy: bool = True
+
+    def busy_time_at(self, now: float) -> float:
+        if self.busy_since is None:
+            return self.busy_time
+        return self.busy_time + now - self.busy_since
+
+
+@dataclass(eq=False)
+class _Waiter:
+    spec: SandboxSpec
+    future: asyncio.Future[Any] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class SandboxPool:
+    """Pool of warm BoxLite boxes shared across engine instances.
+
+    Boxes are keyed by ``SandboxSpec``, so engines for the same protocol
+    reuse each other's boxes while engines for different protocols or images
+    share the ``max_boxes`` budget. Each box serves up to
+    ``max_concurrency_per_box`` leases at once. When no box can take a lease,
+    callers queue and are served first come, first served; a caller needing a
+    new box may evict an idle box of another spec.
+
+    Idle boxes are stopped after ``idle_ttl`` seconds, keeping ``min_boxes``
+    warm per spec, and are health checked before reuse at most once per
+    ``health_check_interval`` seconds. Lost boxes are booted again only for
+    specs leased or warmed within the last ``idle_ttl`` seconds; a spec with
+    no boxes left after that is forgotten. Pass ``runtime`` to use an existing
+    BoxLite runtime; the pool then leaves it open on ``close()``.
+    """
+
+    def __init__(
+        self,
+        boxlite_home: str | None = None,
+        *,
+        runtime: Boxlite | None = None,
+        min_boxes: int = 0,
+        max_boxes: int = 4,
+        max_concurrency_per_box: int = 1,
+        idle_ttl: float = 300.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        if max_boxes < 1:
+            raise ValueError("max_boxes must be at least 1")
+        if not 0 <= min_boxes <= max_boxes:
+            raise ValueError("min_boxes must be between 0 and max_boxes")
+        if max_concurrency_per_box < 1:
+            raise ValueError("max_concurrency_per_box must be at least 1")
+
+        self.boxlite_home = boxlite_home
+        self.min_boxes = min_boxes
+        self.max_boxes = max_boxes
+        self.max_concurrency_per_box = max_concurrency_per_box
+        self.idle_ttl = idle_ttl
+        self.health_check_interval = health_check_interval
+        self._runtime = runtime
+        self._owns_runtime = runtime is None
+        self._boxes: dict[SandboxSpec, list[_PooledBox]] = {}
+        # Spec -> when it was last leased, released or warmed by a caller.
+        self._specs: dict[SandboxSpec, float] = {}
+        self._leased: dict[str, _PooledBox] = {}
+        self._waiters: deque[_Waiter] = deque()
+        self._creating = 0
+        self._reaper: asyncio.Task[None] | None = None
+        self._closed = False
+        self._total_leases = 0
+        self._boxes_created = 0
+        self._boxes_stopped = 0
+        self._unhealthy_boxes = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._boot_time_total = 0.0
+        self._boot_time_max = 0.0
+        self._retired_lifetime = 0.0
+        self._retired_busy_time = 0.0
+
+    async def __aenter__(self) -> "SandboxPool":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def _get_runtime(self) -> Boxlite:
+        if self._runtime is None:
+            self._runtime = (
+                Boxlite.default()
+                if self.boxlite_home is None
+                else Boxlite(Options(home_dir=_resolve_boxlite_home(self.boxlite_home)))
+            )
+        return self._runtime
+
+    @asynccontextmanager
+    async def lease(self, spec: SandboxSpec) -> AsyncIterator[Box]:
+        """Hold a running box for ``spec`` for the duration of the block."""
+        box = await self.acquire(spec)
+        try:
+            yield box
+        finally:
+            self.release(box)
+
+    async def acquire(self, spec: SandboxSpec) -> Box:
+        """Lease a running box for ``spec``, booting one when none is free.
+
+        Every acquired box must be handed back with ``release()``.
+        """
+        if self._closed:
+            raise ValueError("SandboxPool is closed")
+        self._specs[spec] = time.monotonic()
+        self._ensure_reaper()
+
+        started = time.monotonic()
+        grant = None if self._waiters else self._reserve(spec)
+        if grant is None:
+            waiter = _Waiter(spec)
+            self._waiters.append(waiter)
+            try:
+                grant = await waiter.future
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif (
+                    not waiter.future.cancelled()
+                    and waiter.future.exception() is None
+                ):
+                    self._return_grant(waiter.future.result())
+                raise
+        self._record_queue_wait(time.monotonic() - started)
+
+        if grant is _CREATE:
+            try:
+                pooled = await self._create(spec)
+            except BaseException:
+                self._creating -= 1
+                self._wake_waiters()
+                raise
+            self._creating -= 1
+            pooled.active = 1
+            pooled.busy_since = time.monotonic()
+        else:
+            pooled = grant
+
+        self._total_leases += 1
+        self._leased.setdefault(pooled.box.id, pooled)
+        return pooled.box
+
+    def release(self, box: Box, *, discard: bool = False) -> None:
+        """Return a leased box; with ``discard=True`` it is stopped once idle.
+
+        Discard boxes whose state is uncertain, for example after a command
+        timed out and was killed.
+        """
+        pooled = self._leased.get(box.id)
+        if pooled is None:
+            return
+        if discard and pooled.healthy:
+            pooled.healthy = False
+            self._unhealthy_boxes += 1
+
+        now = time.monotonic()
+        pooled.active -= 1
+        pooled.last_used = now
+        self._specs[pooled.spec] = now
+        if pooled.active == 0:
+            self._leased.pop(box.id, None)
+            if pooled.busy_since is not None:
+                pooled.busy_time += now - pooled.busy_since
+                pooled.busy_since = None
+            if not pooled.healthy or self._closed:
+                self._retire(pooled)
+        self._wake_waiters()
+
+    async def warm(self, spec: SandboxSpec, count: int | None = None) -> None:
+        """Boot idle boxes for ``spec`` until ``count`` (default ``min_boxes``) exist.
+
+        Booting stops early when the pool is at ``max_boxes``.
+        """
+        if self._closed:
+            raise ValueError("SandboxPool is closed")
+        self._specs[spec] = time.monotonic()
+        await self._warm(spec, self.min_boxes if count is None else count)
+
+    async def prune(self) -> None:
+        """Stop idle boxes past ``idle_ttl`` or failing their health check."""
+        now = time.monotonic()
+        for spec, boxes in list(self._boxes.items()):
+            idle = [pooled for pooled in boxes if pooled.active == 0]
+            for pooled in idle:
+                if not self._check_health(pooled, now, force=True):
+                    self._retire(pooled)
+            expired = sorted(
+                (
+                    pooled
+                    for pooled in self._boxes.get(spec, [])
+                    if pooled.active == 0 and now - pooled.last_used >= self.idle_ttl
+                ),
+                key=lambda pooled: pooled.last_used,
+            )
+            surplus = len(self._boxes.get(spec, [])) - self.min_boxes
+            for pooled in expired[: max(surplus, 0)]:
+                self._retire(pooled)
+        self._wake_waiters()
+
+        waiting = {waiter.spec for waiter in self._waiters}
+        for spec, last_seen in list(self._specs.items()):
+            if (
+                spec not in self._boxes
+                and spec not in waiting
+                and now - last_seen >= self.idle_ttl
+            ):
+                del self._specs[spec]
+
+    def metrics(self) -> SandboxPoolMetrics:
+        """Return current occupancy and cumulative queue, boot and busy times."""
+        now = time.monotonic()
+        boxes = [pooled for pool in self._boxes.values() for pooled in pool]
+        lifetime = self._retired_lifetime + sum(
+            now - pooled.created_at for pooled in boxes
+        )
+        busy_time = self._retired_busy_time + sum(
+            pooled.busy_time_at(now) for pooled in boxes
+        )
+        return SandboxPoolMetrics(
+            boxes=len(boxes),
+            busy_boxes=sum(1 for pooled in boxes if pooled.active),
+            leases=sum(pooled.active for pooled in boxes),
+            waiting=len(self._waiters),
+            total_leases=self._total_leases,
+            boxes_created=self._boxes_created,
+            boxes_stopped=self._boxes_stopped,
+            unhealthy_boxes=self._unhealthy_boxes,
+            queue_wait_total=self._queue_wait_total,
+            queue_wait_max=self._queue_wait_max,
+            boot_time_total=self._boot_time_total,
+            boot_time_max=self._boot_time_max,
+            utilization=busy_time / lifetime if lifetime > 0 else 0.0,
+        )
+
+    async def close(self) -> None:
+        """Stop every idle box, fail queued callers and release the runtime.
+
+        Boxes still leased are stopped when they are released.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        reaper = self._reaper
+        self._reaper = None
+        if reaper is not None:
+            reaper.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await reaper
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.future.done():
+                waiter.future.set_exception(ValueError("SandboxPool is closed"))
+
+        idle = [
+            pooled
+            for pool in self._boxes.values()
+            for pooled in pool
+            if pooled.active == 0
+        ]
+        for pooled in idle:
+            self._discard(pooled)
+        await asyncio.gather(
+            *(_stop_box_best_effort(pooled.box) for pooled in idle),
+            return_exceptions=True,
+        )
+
+        runtime = self._runtime
+        self._runtime = None
+        if runtime is not None and self._owns_runtime:
+            with suppress(Exception):
+                runtime.close()
+
+    def _can_create(self) -> bool:
+        total = sum(len(pool) for pool in self._boxes.values())
+        return total + self._creating < self.max_boxes
+
+    def _reserve(self, spec: SandboxSpec) -> Any:
+        """Claim capacity for ``spec``: a pooled box, ``_CREATE`` or None."""
+        now = time.monotonic()
+        candidates = []
+        for pooled in list(self._boxes.get(spec, [])):
+            if pooled.active >= self.max_concurrency_per_box or not pooled.healthy:
+                continue
+            if pooled.active == 0 and not self._check_health(pooled, now):
+                self._retire(pooled)
+                continue
+            candidates.append(pooled)
+        if candidates:
+            # Fill partially busy boxes first so idle ones can expire.
+            pooled = max(candidates, key=lambda candidate: candidate.active)
+            if pooled.active == 0:
+                pooled.busy_since = now
+            pooled.active += 1
+            return pooled
+
+        if not self._can_create():
+            victim = min(
+                (
+                    pooled
+                    for other, pool in self._boxes.items()
+                    if other != spec
+                    for pooled in pool
+                    if pooled.active == 0
+                ),
+                key=lambda pooled: pooled.last_used,
+                default=None,
+            )
+            if victim is None:
+                return None
+            self._retire(victim)
+
+        self._creating += 1
+        return _CREATE
+
+    def _return_grant(self, grant: Any) -> None:
+        if grant is _CREATE:
+            self._creating -= 1
+        else:
+            grant.active -= 1
+            if grant.active == 0 and grant.busy_since is not None:
+                grant.busy_time += time.monotonic() - grant.busy_since
+                grant.busy_since = None
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        if self._closed:
+            return
+        for waiter in list(self._waiters):
+            if waiter.future.done():
+                self._waiters.remove(waiter)
+                continue
+            grant = self._reserve(waiter.spec)
+            if grant is None:
+                continue
+            self._waiters.remove(waiter)
+            waiter.future.set_result(grant)
+
+    def _check_health(
+        self,
+        pooled: _PooledBox,
+        now: float,
+        force: bool = False,
+    ) -> bool:
+        if not force and now - pooled.last_checked < self.health_check_interval:
+            return pooled.healthy
+        pooled.last_checked = now
+        try:
+            healthy = _is_running_state(pooled.box.info().state)
+        except Exception:
+            healthy = False
+        if not healthy and pooled.healthy:
+            pooled.healthy = False
+            self._unhealthy_boxes += 1
+        return pooled.healthy
+
+    async def _create(self, spec: SandboxSpec) -> _PooledBox:
+        started = time.monotonic()
+        box = await self._get_runtime().create(spec.box_options())
+        try:
+            for path in spec.copy_in:
+                await box.copy_in(path, f"{_WORKING_DIR}/", _COPY_OPTIONS)
+        except BaseException:
+            _track_background_cleanup(asyncio.create_task(_stop_box_best_effort(box)))
+            raise
+
+        now = time.monotonic()
+        boot_time = now - started
+        self._boxes_created += 1
+        self._boot_time_total += boot_time
+        self._boot_time_max = max(self._boot_time_max, boot_time)
+        pooled = _PooledBox(
+            box=box,
+            spec=spec,
+            created_at=now,
+            last_used=now,
+            last_checked=now,
+        )
+        self._boxes.setdefault(spec, []).append(pooled)
+        return pooled
+
+    async def _warm(self, spec: SandboxSpec, target: int) -> None:
+        while len(self._boxes.get(spec, [])) < target and self._can_create():
+            await self._boot_idle(spec)
+
+    async def _boot_idle(self, spec: SandboxSpec) -> None:
+        self._creating += 1
+        try:
+            await self._create(spec)
+        finally:
+            self._creating -= 1
+            self._wake_waiters()
+
+    def _discard(self, pooled: _PooledBox) -> None:
+        """Drop a box from the pool and fold its lifetime into the metrics."""
+        pool = self._boxes.get(pooled.spec, [])
+        if pooled not in pool:
+            return
+        pool.remove(pooled)
+        if not pool:
+            self._boxes.pop(pooled.spec, None)
+        now = time.monotonic()
+        self._boxes_stopped += 1
+        self._retired_lifetime += now - pooled.created_at
+        self._retired_busy_time += pooled.busy_time_at(now)
+
+    def _retire(self, pooled: _PooledBox) -> None:
+        self._discard(pooled)
+        _track_background_cleanup(
+            asyncio.create_task(_stop_box_best_effort(pooled.box))
+        )
+
+    def _record_queue_wait(self, waited: float) -> None:
+        self._queue_wait_total += waited
+        self._queue_wait_max = max(self._queue_wait_max, waited)
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def _reap(self) -> None:
+        interval = max(min(self.idle_ttl, self.health_check_interval), 0.01)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            await self.prune()
+            now = time.monotonic()
+            for spec, last_seen in list(self._specs.items()):
+                if now - last_seen >= self.idle_ttl:
+                    continue
+                # A failed boot is retried on the next pass.
+                with suppress(Exception):
+                    await self._warm(spec, self.min_boxes)
@@ -4,44 +4,65 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import hashlib
+import importlib.abc
+import importlib.machinery
 import importlib.util
 import inspect
 import json
 import re
 import sys
+import threading
 import uuid
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from contextlib import suppress
+from contextvars import ContextVar
+from graphlib import TopologicalSorter
+from types import ModuleType
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from airalogy.markdown import parse_aimd, parse_workflow_content
 from boxlite import Box, BoxOptions, BoxStateInfo, Boxlite, Options
 from boxlite.errors import BoxliteError
 
+from airalogy_engine.checkpoint import _encode
 from airalogy_engine.engine import (
-    DEFAULT_IMAGE,
     _COPY_OPTIONS,
+    _EVENTS_ENV,
     _WORKING_DIR,
+    SandboxSpec,
     _copy_out_log,
     _exec_command_with_timeout,
+    _execution_events,
     _is_pyo3_panic,
     _is_running_state,
+    _params_channel,
     _resolve_boxlite_home,
     _stop_box_best_effort,
+    _stream_events,
     _track_background_cleanup,
 )
 
+if TYPE_CHECKING:
+    from airalogy_engine.checkpoint import WorkflowCheckpointStore
+    from airalogy_engine.sandbox_pool import SandboxPool
+
 _WORKFLOW_DIR = f"{_WORKING_DIR}/workflow"
 _WORKFLOW_EXECUTOR_PATH = str(Path(__file__).parent / "workflow_executor.py")
 _SANDBOX_LOG_FILE = "workflow_debug.log"
+# Seconds a batched workflow_executor.py run may take beyond the per-call timeout.
+_BATCH_TIMEOUT_MARGIN = 30
 _REFERENCE_PATTERN = re.compile(
     r"^\$\{(?P<root>[A-Za-z][A-Za-z0-9_]*)(?P<path>(?:\.[A-Za-z][A-Za-z0-9_]*)+)\}$"
 )
 _REFERENCE_FIND_PATTERN = re.compile(
     r"\$\{[A-Za-z][A-Za-z0-9_]*(?:\.[A-Za-z][A-Za-z0-9_]*)+\}"
 )
+# A whole value that starts like a node path is meant as a reference; other
+# ``${...}`` text, such as ``${HOME}``, stays a literal.
+_REFERENCE_LIKE_PATTERN = re.compile(r"^\$\{[A-Za-z][A-Za-z0-9_]*\.[^}]*\}$")
 _WHEN_PATTERN = re.compile(
     r"^\s*(?P<left>\$\{[^}]+\})(?:\s*(?P<op>==|!=|>=|<=|>|<)\s*(?P<right>.+?))?\s*$"
 )
@@ -52,6 +73,10 @@ class WorkflowExecutionError(ValueError):
     """Raised when a workflow transition cannot be executed."""
 
 
+class _CheckpointSaveError(Exception):
+    """Raised when the checkpoint store rejects a checkpoint."""
+
+
 def _success(data: dict[str, Any]) -> dict[str, Any]:
     return {"success": True, "data": data}
 
@@ -79,6 +104,21 @@ def _normalize_outputs(value: Any) -> dict[str, Any]:
     raise WorkflowExecutionError("workflow assigner must return a dict-like value")
 
 
+def _detached(value: Any) -> Any:
+    """Deep-copy ``value`` so that no two places in the copy share an object.
+
+    Unlike ``deepcopy``, mappings and lists reached twice are copied twice, so
+    editing one part of a result never changes another.
+    """
+    if isinstance(value, Mapping):
+        return {key: _detached(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    return deepcopy(value)
+
+
 def _record_template() -> dict[str, Any]:
     return {"data": {section: {} for section in sorted(_RECORD_DATA_SECTIONS)}}
 
@@ -108,30 +148,53 @@ def _record_get(record: Mapping[str, Any], path: Sequence[str], context: str) ->
     return _nested_get(record, path, context)
 
 
-def _record_set(record: dict[str, Any], path: Sequence[str], value: Any) -> None:
+def _record_set(
+    record: Mapping[str, Any],
+    path: Sequence[str],
+    value: Any,
+    owned: set[int],
+) -> dict[str, Any]:
+    """Return ``record`` with ``path`` set to ``value``, copying only that path.
+
+    Records are shared between workflow states, so they are never mutated in
+    place. Each mapping along ``path`` is shallow-copied unless its ``id`` is
+    in ``owned``, the copies already made for the current transition, and
+    every other branch stays shared with ``record``.
+    """
     if not path:
         raise WorkflowExecutionError("assignment field path must not be empty")
 
+    def own(mapping: Mapping[str, Any]) -> dict[str, Any]:
+        if id(mapping) in owned:
+            return mapping  # type: ignore[return-value]
+        copied = dict(mapping)
+        owned.add(id(copied))
+        return copied
+
+    result = own(record)
     first = path[0]
     if first in _RECORD_DATA_SECTIONS:
-        data = record.setdefault("data", {})
+        data = result.get("data")
+        if data is None:
+            data = {}
         if not isinstance(data, dict):
             raise WorkflowExecutionError("record.data must be a mapping/object")
-        current: dict[str, Any] = data
+        current = result["data"] = own(data)
     else:
-        current = record
+        current = result
 
     for part in path[:-1]:
         child = current.get(part)
         if child is None:
             child = {}
-            current[part] = child
         if not isinstance(child, dict):
             raise WorkflowExecutionError(
                 f"Cannot assign {'.'.join(path)} through non-object field {part}"
             )
-        current = child
-    current[path[-1]] = deepcopy(value)
+        current[part] = own(child)
+        current = current[part]
+    current[path[-1]] = value
+    return result
 
 
 def _parse_literal(value: str) -> Any:
@@ -165,6 +228,281 @@ def _compare(left: Any, op: str, right: Any) -> bool:
     raise WorkflowExecutionError(f"Unsupported workflow condition operator: {op}")
 
 
+@dataclasses.dataclass(frozen=True)
+class _Reference:
+    """A parsed ``${root.path}`` workflow reference."""
+
+    text: str
+    root: str
+    path: tuple[str, ...]
+
+    @classmethod
+    def parse(cls, text: str) -> _Reference:
+        match = _REFERENCE_PATTERN.fullmatch(text)
+        if not match:
+            raise WorkflowExecutionError(f"Invalid workflow reference: {text}")
+        path = tuple(match.group("path").lstrip(".").split("."))
+        return cls(text, match.group("root"), path)
+
+    def resolve(
+        self,
+        records: Mapping[str, Any],
+        transition_outputs: Mapping[str, Any],
+        node_iterations: Mapping[str, int],
+    ) -> Any:
+        """Return the referenced object itself, which callers must not mutate."""
+        root, path, context = self.root, self.path, self.text[2:-1]
+        if path[0] == "outputs":
+            if root not in transition_outputs:
+                raise WorkflowExecutionError(
+                    f"Transition output not available: {root}.outputs"
+                )
+            return _nested_get(transition_outputs[root], path[1:], context)
+        if path == ("iteration",):
+            return node_iterations.get(root, 0)
+        if path == ("status",):
+            if root not in records:
+                raise WorkflowExecutionError(f"Record not available for node: {root}")
+            record = records[root]
+            if isinstance(record, Mapping):
+                if "status" in record:
+                    return record["status"]
+                metadata = record.get("metadata")
+                if isinstance(metadata, Mapping) and "status" in metadata:
+                    return metadata["status"]
+            return None
+
+        if root not in records:
+            raise WorkflowExecutionError(f"Record not available for node: {root}")
+        record = records[root]
+        if not isinstance(record, Mapping):
+            raise WorkflowExecutionError(f"Record for node {root} must be a mapping")
+        return _record_get(record, path, context)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledValue:
+    """A workflow value whose references were parsed when the workflow loaded.
+
+    ``reference`` is set when the whole value is one reference, ``parts``
+    holds the text and references of an interpolated string, and anything
+    else is the constant ``raw``.
+    """
+
+    raw: Any
+    reference: _Reference | None = None
+    parts: tuple[str | _Reference, ...] | None = None
+
+    @classmethod
+    def compile(cls, value: Any) -> _CompiledValue:
+        if not isinstance(value, str):
+            return cls(value)
+        if _REFERENCE_LIKE_PATTERN.fullmatch(value.strip()):
+            return cls(value, reference=_Reference.parse(value.strip()))
+
+        parts: list[str | _Reference] = []
+        position = 0
+        for match in _REFERENCE_FIND_PATTERN.finditer(value):
+            parts.append(value[position : match.start()])
+            parts.append(_Reference.parse(match.group(0)))
+            position = match.end()
+        if not parts:
+            return cls(value)
+        parts.append(value[position:])
+        return cls(value, parts=tuple(parts))
+
+    @property
+    def is_constant(self) -> bool:
+        return self.reference is None and self.parts is None
+
+    def references(self) -> list[_Reference]:
+        if self.reference is not None:
+            return [self.reference]
+        return [part for part in self.parts or () if isinstance(part, _Reference)]
+
+    def resolve(
+        self,
+        records: Mapping[str, Any],
+        transition_outputs: Mapping[str, Any],
+        node_iterations: Mapping[str, int],
+    ) -> Any:
+        """Resolve the value; references return the referenced object itself."""
+        if self.reference is not None:
+            return self.reference.resolve(records, transition_outputs, node_iterations)
+        if self.parts is not None:
+            return "".join(
+                part
+                if isinstance(part, str)
+                else str(part.resolve(records, transition_outputs, node_iterations))
+                for part in self.parts
+            )
+        if isinstance(self.raw, str):
+            return self.raw
+        # Constants belong to the workflow definition.
+        return deepcopy(self.raw)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledWhen:
+    """A parsed ``when`` condition: a reference, optionally compared to a value."""
+
+    left: _Reference
+    op: str | None = None
+    right: _CompiledValue | None = None
+
+    @classmethod
+    def compile(cls, when: str | None) -> _CompiledWhen | None:
+        if when is None or not when.strip():
+            return None
+        match = _WHEN_PATTERN.fullmatch(when)
+        if not match:
+            raise WorkflowExecutionError(f"Unsupported workflow condition: {when}")
+        left = _Reference.parse(match.group("left"))
+        op = match.group("op")
+        if op is None:
+            return cls(left)
+
+        right = _CompiledValue.compile(match.group("right"))
+        if right.is_constant:
+            right = _CompiledValue(_parse_literal(right.raw))
+        return cls(left, op, right)
+
+    def references(self) -> list[_Reference]:
+        return [self.left, *(self.right.references() if self.right else [])]
+
+    def evaluate(
+        self,
+        records: Mapping[str, Any],
+        transition_outputs: Mapping[str, Any],
+        node_iterations: Mapping[str, int],
+    ) -> bool:
+        left = self.left.resolve(records, transition_outputs, node_iterations)
+        if self.op is None or self.right is None:
+            return bool(left)
+
+        if self.right.is_constant:
+            right = self.right.raw
+        else:
+            right = self.right.resolve(records, transition_outputs, node_iterations)
+            if isinstance(right, str) and not _REFERENCE_PATTERN.fullmatch(
+                right.strip()
+            ):
+                right = _parse_literal(right)
+        return _compare(left, self.op, right)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledTransition:
+    """The ``when``, ``inputs`` and ``assign`` expressions of one transition."""
+
+    when: _CompiledWhen | None
+    inputs: dict[str, _CompiledValue]
+    assign: dict[str, tuple[tuple[tuple[str, ...], _CompiledValue], ...]]
+
+    @classmethod
+    def compile(cls, transition: Mapping[str, Any]) -> _CompiledTransition:
+        return cls(
+            when=_CompiledWhen.compile(transition.get("when")),
+            inputs={
+                key: _CompiledValue.compile(value)
+                for key, value in transition.get("inputs", {}).items()
+            },
+            assign={
+                target_node: tuple(
+                    (tuple(field_path.split(".")), _CompiledValue.compile(value))
+                    for field_path, value in assignments.items()
+                )
+                for target_node, assignments in transition.get("assign", {}).items()
+            },
+        )
+
+    def references(self) -> list[_Reference]:
+        references = self.when.references() if self.when else []
+        for value in self.inputs.values():
+            references.extend(value.references())
+        for assignments in self.assign.values():
+            for _, value in assignments:
+                references.extend(value.references())
+        return references
+
+
+def _assigner_call_result(result: Any) -> Any:
+    """Return the outputs of one executor call, or the error it reported."""
+    if not isinstance(result, Mapping):
+        return WorkflowExecutionError("Invalid workflow executor result")
+    if not result.get("success"):
+        message = result.get("message") or "Workflow assigner failed"
+        output = result.get("output")
+        if output:
+            message = f"{message}\n{output}"
+        return WorkflowExecutionError(message)
+    try:
+        return _normalize_outputs(result.get("data", {}).get("outputs", {}))
+    except WorkflowExecutionError as exc:
+        return exc
+
+
+def _transition_accesses(
+    transition: Mapping[str, Any],
+    compiled: _CompiledTransition,
+) -> tuple[set[tuple[str, str]], set[tuple[str, str]]]:
+    """Return the node records and transition outputs a transition reads and writes."""
+    reads = {("node", node) for node in transition.get("from", [])}
+    writes = {("node", node) for node in transition.get("to", [])}
+    writes.update(("node", node) for node in transition.get("assign", {}))
+    if transition.get("run"):
+        writes.add(("outputs", transition["id"]))
+
+    for reference in compiled.references():
+        kind = "outputs" if reference.path[0] == "outputs" else "node"
+        reads.add((kind, reference.root))
+    return reads, writes
+
+
+_assigner_search_path: ContextVar[tuple[str, ...]] = ContextVar(
+    "_assigner_search_path", default=()
+)
+_finder_lock = threading.Lock()
+
+
+class _AssignerPathFinder(importlib.abc.MetaPathFinder):
+    """Resolve top-level imports of local assigners against their directories.
+
+    The directories come from a context variable, so concurrent transitions in
+    other threads or tasks never see each other's paths and ``sys.path`` stays
+    untouched.
+    """
+
+    @classmethod
+    def find_spec(
+        cls,
+        fullname: str,
+        path: Sequence[str] | None = None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        search_path = _assigner_search_path.get()
+        if path is not None or not search_path:
+            return None
+        return importlib.machinery.PathFinder.find_spec(fullname, list(search_path))
+
+
+def _install_assigner_path_finder() -> None:
+    # Sit just before PathFinder so assigner directories take precedence over
+    # site-packages, as they did when they were prepended to sys.path.
+    with _finder_lock:
+        if _AssignerPathFinder in sys.meta_path:
+            return
+        index = next(
+            (
+                index
+                for index, finder in enumerate(sys.meta_path)
+                if finder is importlib.machinery.PathFinder
+            ),
+            len(sys.meta_path),
+        )
+        sys.meta_path.insert(index, _AssignerPathFinder)
+
+
 class AiralogyWorkflowEngine:
     """Execute declarative AIMD workflow transitions.
 
@@ -186,7 +524,30 @@ class AiralogyWorkflowEngine:
         memory_mib: int = 512,
         cpus: int = 1,
         auto_stop: bool = True,
+        pool: SandboxPool | None = None,
+        batch_assigners: bool = True,
+        checkpoint_store: WorkflowCheckpointStore | None = None,
+        memoize_assigners: bool = False,
     ) -> None:
+        """Load one workflow from ``workflow_path``.
+
+        With ``pool``, sandbox assigners lease boxes from the shared
+        ``SandboxPool`` instead of this engine owning one, so ``boxlite_home``
+        and ``auto_stop`` are ignored and ``close()`` leaves the pool running.
+
+        With ``batch_assigners``, sandbox assigner calls that start in the same
+        event loop iteration, such as the ready transitions of a DAG pass, run
+        in one ``workflow_executor.py`` process. They run in threads of that
+        process, so they share ``sys.modules``, ``sys.path``, the working
+        directory and environment, and calls to the same assigner file share
+        its module globals. Assigners that keep state in globals should not be
+        batched.
+
+        With ``checkpoint_store``, ``run()`` saves its progress under a run id
+        so ``resume(run_id)`` can continue a failed or interrupted run, and
+        ``memoize_assigners`` reuses stored outputs of assigner calls with the
+        same assigner file and inputs.
+        """
         path = Path(workflow_path).expanduser().resolve()
         if path.is_dir():
             path = path / "workflow.aimd"
@@ -194,10 +555,13 @@ class AiralogyWorkflowEngine:
             raise ValueError(f"workflow_path must be a workflow file: {workflow_path}")
         if assigner_runtime not in {"local", "sandbox"}:
             raise ValueError("assigner_runtime must be 'local' or 'sandbox'")
+        if memoize_assigners and checkpoint_store is None:
+            raise ValueError("memoize_assigners requires a checkpoint_store")
 
         self.workflow_path = str(path)
         self.workflow_root = str(path.parent)
         self.workflow = self._load_workflow(path, workflow_id)
+        self._compiled_transitions = self._compile_transitions(self.workflow)
         self.assigner_runtime = assigner_runtime
         self.boxlite_home = boxlite_home
         self.image = image
@@ -206,10 +570,21 @@ class AiralogyWorkflowEngine:
         self.memory_mib = memory_mib
         self.cpus = cpus
         self.auto_stop = auto_stop
+        self.pool = pool
+        self.batch_assigners = batch_assigners
+        self.checkpoint_store = checkpoint_store
+        self.memoize_assigners = memoize_assigners
         self._runtime: Boxlite | None = None
         self._box: Box | None = None
         self._box_active_counts: dict[str, int] = {}
         self._closed = False
+        self._assigner_modules: dict[Path, tuple[tuple[int, int], ModuleType]] = {}
+        self._assigner_modules_lock = threading.Lock()
+        self._assigner_batches: dict[
+            tuple[tuple[tuple[str, str], ...], int],
+            list[tuple[str, dict[str, Any], asyncio.Future[dict[str, Any]]]],
+        ] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
 
     async def __aenter__(self) -> "AiralogyWorkflowEngine":
         return self
@@ -233,6 +608,21 @@ class AiralogyWorkflowEngine:
             raise ValueError("workflow_path must contain exactly one workflow block")
         return workflows[0]
 
+    @staticmethod
+    def _compile_transitions(
+        workflow: Mapping[str, Any],
+    ) -> dict[str, _CompiledTransition]:
+        """Parse every transition expression so malformed ones fail at load."""
+        compiled: dict[str, _CompiledTransition] = {}
+        for transition in workflow["transitions"]:
+            try:
+                compiled[transition["id"]] = _CompiledTransition.compile(transition)
+            except WorkflowExecutionError as exc:
+                raise ValueError(
+                    f"Invalid workflow transition {transition['id']}: {exc}"
+                ) from exc
+        return compiled
+
     def _assigner_by_id(self) -> dict[str, dict[str, Any]]:
         return {assigner["id"]: assigner for assigner in self.workflow["assigners"]}
 
@@ -250,27 +640,19 @@ class AiralogyWorkflowEngine:
             )
         return self._runtime
 
-    def _build_box_options(self) -> BoxOptions:
-        image = self.image
-        rootfs_path = self.rootfs_path
-        if image is None and rootfs_path is None:
-            image = DEFAULT_IMAGE
-
-        rootfs: Path | None = None
-        if rootfs_path is not None:
-            rootfs = Path(rootfs_path).expanduser().resolve()
-            if not rootfs.is_dir():
-                raise ValueError(f"rootfs_path must be a directory: {rootfs_path}")
-
-        return BoxOptions(
-            image=image if rootfs_path is None else None,
-            rootfs_path=str(rootfs) if rootfs is not None else None,
+    def _sandbox_spec(self) -> SandboxSpec:
+        return SandboxSpec.build(
+            image=self.image,
+            rootfs_path=self.rootfs_path,
             memory_mib=self.memory_mib,
             cpus=self.cpus,
-            working_dir=_WORKING_DIR,
             volumes=[(self.workflow_root, _WORKFLOW_DIR, False)],
+            copy_in=[_WORKFLOW_EXECUTOR_PATH],
         )
 
+    def _build_box_options(self) -> BoxOptions:
+        return self._sandbox_spec().box_options()
+
     async def _create_box(self) -> Box:
         runtime = self._get_runtime()
         box = await runtime.create(self._build_box_options())
@@ -337,6 +719,17 @@ class AiralogyWorkflowEngine:
     def _begin_box_command(self, box: Box) -> None:
         self._box_active_counts[box.id] = self._box_active_counts.get(box.id, 0) + 1
 
+    async def _finish_sandbox_command(self, box: Box, timed_out: bool) -> None:
+        remaining_active = self._finish_box_command(box)
+        if self.auto_stop and remaining_active == 0 and self._box is box:
+            self._box = None
+            if timed_out:
+                _track_background_cleanup(
+                    asyncio.create_task(_stop_box_best_effort(box))
+                )
+            else:
+                await self._stop_box(box)
+
     def _finish_box_command(self, box: Box) -> int:
         active_count = self._box_active_counts.get(box.id, 0)
         if active_count <= 1:
@@ -353,70 +746,11 @@ class AiralogyWorkflowEngine:
         node_iterations: Mapping[str, int] | None = None,
     ) -> Any:
         """Resolve one workflow value, preserving constants as constants."""
-        if not isinstance(value, str):
-            return deepcopy(value)
-
-        match = _REFERENCE_PATTERN.fullmatch(value.strip())
-        if match:
-            return deepcopy(
-                self._resolve_reference(
-                    value.strip(), records, transition_outputs, node_iterations or {}
-                )
-            )
-
-        def replace_reference(match: re.Match[str]) -> str:
-            resolved = self._resolve_reference(
-                match.group(0), records, transition_outputs, node_iterations or {}
-            )
-            return str(resolved)
-
-        if _REFERENCE_FIND_PATTERN.search(value):
-            return _REFERENCE_FIND_PATTERN.sub(replace_reference, value)
-        return value
-
-    def _resolve_reference(
-        self,
-        reference: str,
-        records: Mapping[str, Any],
-        transition_outputs: Mapping[str, Any],
-        node_iterations: Mapping[str, int],
-    ) -> Any:
-        match = _REFERENCE_PATTERN.fullmatch(reference)
-        if not match:
-            raise WorkflowExecutionError(f"Invalid workflow reference: {reference}")
-
-        root = match.group("root")
-        path = match.group("path").lstrip(".").split(".")
-        if path[0] == "outputs":
-            if root not in transition_outputs:
-                raise WorkflowExecutionError(
-                    f"Transition output not available: {root}.outputs"
-                )
-            return _nested_get(
-                transition_outputs[root],
-                path[1:],
-                f"{root}.{'.'.join(path)}",
+        return deepcopy(
+            _CompiledValue.compile(value).resolve(
+                records, transition_outputs, node_iterations or {}
             )
-        if path == ["iteration"]:
-            return node_iterations.get(root, 0)
-        if path == ["status"]:
-            if root not in records:
-                raise WorkflowExecutionError(f"Record not available for node: {root}")
-            record = records[root]
-            if isinstance(record, Mapping):
-                if "status" in record:
-                    return record["status"]
-                metadata = record.get("metadata")
-                if isinstance(metadata, Mapping) and "status" in metadata:
-                    return metadata["status"]
-            return None
-
-        if root not in records:
-            raise WorkflowExecutionError(f"Record not available for node: {root}")
-        record = records[root]
-        if not isinstance(record, Mapping):
-            raise WorkflowExecutionError(f"Record for node {root} must be a mapping")
-        return _record_get(record, path, f"{root}.{'.'.join(path)}")
+        )
 
     def evaluate_when(
         self,
@@ -426,41 +760,10 @@ class AiralogyWorkflowEngine:
         node_iterations: Mapping[str, int] | None = None,
     ) -> bool:
         """Evaluate the limited workflow condition syntax."""
-        if when is None or not when.strip():
+        condition = _CompiledWhen.compile(when)
+        if condition is None:
             return True
-        match = _WHEN_PATTERN.fullmatch(when)
-        if not match:
-            raise WorkflowExecutionError(f"Unsupported workflow condition: {when}")
-
-        left = self.resolve_value(
-            match.group("left"), records, transition_outputs, node_iterations or {}
-        )
-        op = match.group("op")
-        if op is None:
-            return bool(left)
-
-        right_raw = match.group("right")
-        assert right_raw is not None
-        right = self.resolve_value(
-            right_raw, records, transition_outputs, node_iterations or {}
-        )
-        if isinstance(right, str) and not _REFERENCE_PATTERN.fullmatch(right.strip()):
-            right = _parse_literal(right)
-        return _compare(left, op, right)
-
-    def _resolve_inputs(
-        self,
-        transition: Mapping[str, Any],
-        records: Mapping[str, Any],
-        transition_outputs: Mapping[str, Any],
-        node_iterations: Mapping[str, int],
-    ) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        for key, raw_value in transition.get("inputs", {}).items():
-            result[key] = self.resolve_value(
-                raw_value, records, transition_outputs, node_iterations
-            )
-        return result
+        return condition.evaluate(records, transition_outputs, node_iterations or {})
 
     async def _run_local_assigner(
         self,
@@ -485,9 +788,39 @@ class AiralogyWorkflowEngine:
                 "workflow assigner entrypoint must stay inside workflow root"
             )
 
-        sys.path.insert(0, str(workflow_root))
-        sys.path.insert(0, str(module_path.parent))
+        search_path = (str(module_path.parent), str(workflow_root))
+        module = self._assigner_module(module_path, file_path, search_path)
+        func = getattr(module, function_name, None)
+        if not callable(func):
+            raise WorkflowExecutionError(
+                f"workflow assigner function not found: {function_name}"
+            )
+
+        token = _assigner_search_path.set(search_path)
         try:
+            # Inputs may share objects with workflow records.
+            output = func(**deepcopy(inputs))
+            if inspect.isawaitable(output):
+                output = await output
+        finally:
+            _assigner_search_path.reset(token)
+        return _normalize_outputs(output)
+
+    def _assigner_module(
+        self, module_path: Path, file_path: str, search_path: tuple[str, ...]
+    ) -> ModuleType:
+        """Return the loaded assigner module, re-executing it only when it changed.
+
+        Modules are cached per engine by resolved path and the file's mtime and
+        size, so looping workflows import assigner dependencies once.
+        """
+        stat = module_path.stat()
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        with self._assigner_modules_lock:
+            cached = self._assigner_modules.get(module_path)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+
             module_name = f"_airalogy_workflow_assigner_{uuid.uuid4().hex}"
             spec = importlib.util.spec_from_file_location(module_name, module_path)
             if spec is None or spec.loader is None:
@@ -495,22 +828,14 @@ class AiralogyWorkflowEngine:
                     f"workflow assigner file cannot be loaded: {file_path}"
                 )
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            func = getattr(module, function_name, None)
-            if not callable(func):
-                raise WorkflowExecutionError(
-                    f"workflow assigner function not found: {function_name}"
-                )
-
-            output = func(**inputs)
-            if inspect.isawaitable(output):
-                output = await output
-            return _normalize_outputs(output)
-        finally:
-            with suppress(ValueError):
-                sys.path.remove(str(module_path.parent))
-            with suppress(ValueError):
-                sys.path.remove(str(workflow_root))
+            _install_assigner_path_finder()
+            token = _assigner_search_path.set(search_path)
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                _assigner_search_path.reset(token)
+            self._assigner_modules[module_path] = (fingerprint, module)
+            return module
 
     async def _run_sandbox_assigner(
         self,
@@ -526,6 +851,86 @@ class AiralogyWorkflowEngine:
         if not isinstance(entrypoint, str):
             raise WorkflowExecutionError("python workflow assigner requires entrypoint")
 
+        effective_timeout = self.timeout if timeout is None else timeout
+        # Streamed runs keep one process per call so output maps to a transition.
+        streaming = _execution_events.get() is not None
+        if debug or streaming or not self.batch_assigners:
+            result = (
+                await self._exec_sandbox_assigners(
+                    [(entrypoint, inputs)],
+                    env_vars=env_vars,
+                    timeout=effective_timeout,
+                    debug=debug,
+                    log_file=log_file,
+                )
+            )[0]
+            if isinstance(result, WorkflowExecutionError):
+                raise result
+            return result
+
+        # Calls queued before the flush task first runs share one process.
+        key = (tuple(sorted((env_vars or {}).items())), effective_timeout)
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        batch = self._assigner_batches.get(key)
+        if batch is None:
+            batch = self._assigner_batches[key] = []
+            task = asyncio.create_task(self._flush_assigner_batch(key))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+        batch.append((entrypoint, inputs, future))
+        return await future
+
+    async def _flush_assigner_batch(
+        self, key: tuple[tuple[tuple[str, str], ...], int]
+    ) -> None:
+        batch = self._assigner_batches.pop(key)
+        env_vars, timeout = dict(key[0]), key[1]
+        try:
+            results = await self._exec_sandbox_assigners(
+                [(entrypoint, inputs) for entrypoint, inputs, _future in batch],
+                env_vars=env_vars,
+                timeout=timeout,
+                debug=False,
+                log_file=_SANDBOX_LOG_FILE,
+            )
+            if len(results) != len(batch):
+                raise WorkflowExecutionError(
+                    f"Workflow executor returned {len(results)} results "
+                    f"for {len(batch)} assigner calls"
+                )
+            for (_entrypoint, _inputs, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, WorkflowExecutionError):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as exc:
+            for _entrypoint, _inputs, future in batch:
+                if not future.done():
+                    future.set_exception(WorkflowExecutionError(str(exc)))
+        finally:
+            # A cancelled flush must not leave its callers waiting forever.
+            for _entrypoint, _inputs, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _exec_sandbox_assigners(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any]]],
+        *,
+        env_vars: dict[str, str] | None,
+        timeout: int,
+        debug: bool,
+        log_file: str,
+    ) -> list[dict[str, Any] | WorkflowExecutionError]:
+        """Run assigner calls in one executor process.
+
+        Returns each call's outputs or its own error. Errors that affect the
+        whole process, such as sandbox failures, are raised instead.
+        """
         env_pairs = [(key, value) for key, value in (env_vars or {}).items()]
         sandbox_log_file = _SANDBOX_LOG_FILE
         if debug:
@@ -537,25 +942,50 @@ class AiralogyWorkflowEngine:
             ]
             env_pairs.append(("PROTOCOL_DEBUG", "1"))
             env_pairs.append(("PROTOCOL_DEBUG_LOG_FILE", sandbox_log_file))
+        on_event = _execution_events.get()
+        if on_event is not None:
+            env_pairs = [(key, value) for key, value in env_pairs if key != _EVENTS_ENV]
+            env_pairs.append((_EVENTS_ENV, "1"))
+
+        if len(calls) == 1:
+            entrypoint, inputs = calls[0]
+            params: dict[str, Any] = {"entrypoint": entrypoint, "inputs": inputs}
+            command_timeout = timeout
+        else:
+            params = {
+                "batch": [
+                    {"entrypoint": entrypoint, "inputs": inputs}
+                    for entrypoint, inputs in calls
+                ],
+                "timeout": timeout,
+            }
+            # Assigners run concurrently once all are imported, each with its
+            # own ``timeout``; the margin covers interpreter start and imports.
+            command_timeout = timeout + _BATCH_TIMEOUT_MARGIN
 
-        effective_timeout = self.timeout if timeout is None else timeout
         box: Box | None = None
         timed_out = False
         try:
-            box = await self._ensure_running_box()
-            self._begin_box_command(box)
-            params = {"entrypoint": entrypoint, "inputs": inputs}
-            command = [
-                "python",
-                "workflow_executor.py",
-                json.dumps(params, separators=(",", ":"), ensure_ascii=False),
-            ]
+            if self.pool is not None:
+                box = await self.pool.acquire(self._sandbox_spec())
+            else:
+                box = await self._ensure_running_box()
+                self._begin_box_command(box)
+            params_arg, stdin_data = _params_channel(
+                json.dumps(params, separators=(",", ":"), ensure_ascii=False)
+            )
+            command = ["python", "workflow_executor.py", params_arg]
             exec_result, stdout, stderr, timed_out = await _exec_command_with_timeout(
-                box, command, effective_timeout, env=env_pairs
+                box,
+                command,
+                command_timeout,
+                env=env_pairs,
+                stdin_data=stdin_data,
+                on_event=on_event,
             )
             if timed_out:
                 raise WorkflowExecutionError(
-                    f"Execution timed out after {effective_timeout} seconds"
+                    f"Execution timed out after {command_timeout} seconds"
                 )
             if exec_result is None:
                 raise WorkflowExecutionError(
@@ -566,18 +996,19 @@ class AiralogyWorkflowEngine:
                     f"Workflow assigner failed with return code {exec_result.exit_code}: {stderr.strip()}"
                 )
             try:
-                result = json.loads(stdout.strip())
+                result = json.loads(stdout)
             except json.JSONDecodeError as exc:
                 raise WorkflowExecutionError(
                     f"Invalid JSON output from workflow executor: {stdout.strip()}"
                 ) from exc
+            if len(calls) == 1:
+                return [_assigner_call_result(result)]
             if not result.get("success"):
-                message = result.get("message") or "Workflow assigner failed"
-                output = result.get("output")
-                if output:
-                    message = f"{message}\n{output}"
-                raise WorkflowExecutionError(message)
-            return _normalize_outputs(result.get("data", {}).get("outputs", {}))
+                raise _assigner_call_result(result)
+            return [
+                _assigner_call_result(call_result)
+                for call_result in result.get("data", {}).get("results", [])
+            ]
         except BoxliteError as exc:
             raise WorkflowExecutionError(f"Sandbox error: {exc}") from exc
         except RuntimeError as exc:
@@ -590,15 +1021,10 @@ class AiralogyWorkflowEngine:
             if box is not None:
                 if debug:
                     await _copy_out_log(box, sandbox_log_file, log_file)
-                remaining_active = self._finish_box_command(box)
-                if self.auto_stop and remaining_active == 0 and self._box is box:
-                    self._box = None
-                    if timed_out:
-                        _track_background_cleanup(
-                            asyncio.create_task(_stop_box_best_effort(box))
-                        )
-                    else:
-                        await self._stop_box(box)
+                if self.pool is not None:
+                    self.pool.release(box, discard=timed_out)
+                else:
+                    await self._finish_sandbox_command(box, timed_out)
 
     async def _run_assigner(
         self,
@@ -615,16 +1041,53 @@ class AiralogyWorkflowEngine:
             raise WorkflowExecutionError(
                 f"Unsupported workflow assigner runtime: {runtime}"
             )
+        memo_key = self._assigner_memo_key(assigner, inputs)
+        if memo_key is not None:
+            assert self.checkpoint_store is not None
+            cached = self.checkpoint_store.get_outputs(memo_key)
+            if cached is not None:
+                return cached
+
         if self.assigner_runtime == "local":
-            return await self._run_local_assigner(assigner, inputs)
-        return await self._run_sandbox_assigner(
-            assigner,
-            inputs,
-            env_vars=env_vars,
-            timeout=timeout,
-            debug=debug,
-            log_file=log_file,
-        )
+            outputs = await self._run_local_assigner(assigner, inputs)
+        else:
+            outputs = await self._run_sandbox_assigner(
+                assigner,
+                inputs,
+                env_vars=env_vars,
+                timeout=timeout,
+                debug=debug,
+                log_file=log_file,
+            )
+        if memo_key is not None:
+            assert self.checkpoint_store is not None
+            with suppress(TypeError, ValueError):
+                self.checkpoint_store.put_outputs(memo_key, outputs)
+        return outputs
+
+    def _assigner_memo_key(
+        self, assigner: Mapping[str, Any], inputs: Mapping[str, Any]
+    ) -> str | None:
+        """Hash the assigner file and inputs, or None when not memoizing."""
+        if not self.memoize_assigners or self.checkpoint_store is None:
+            return None
+        entrypoint = assigner.get("entrypoint")
+        if not isinstance(entrypoint, str):
+            return None
+        module_path = Path(self.workflow_root) / entrypoint.rsplit(":", 1)[0]
+        try:
+            payload = json.dumps(
+                _encode({"entrypoint": entrypoint, "inputs": dict(inputs)}),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+            source = module_path.read_bytes()
+        except (TypeError, ValueError, OSError):
+            return None
+        digest = hashlib.sha256(source)
+        digest.update(payload.encode("utf-8"))
+        return digest.hexdigest()
 
     async def run_transition(
         self,
@@ -638,21 +1101,107 @@ class AiralogyWorkflowEngine:
         debug: bool = False,
         log_file: str = "workflow_debug.log",
     ) -> dict[str, Any]:
-        """Run one transition and return updated Record drafts."""
+        """Run one transition and return updated Record drafts.
+
+        The result shares no objects with ``records``, ``transition_outputs``
+        or the engine, so it can be edited in place.
+
+        In a ``stream()`` run, this reports ``transition_started`` and
+        ``transition_finished`` events and tags assigner events with the
+        transition id.
+        """
+        return _detached(
+            await self._run_transition_with_events(
+                transition_id,
+                records,
+                transition_outputs=transition_outputs,
+                node_iterations=node_iterations,
+                env_vars=env_vars,
+                timeout=timeout,
+                debug=debug,
+                log_file=log_file,
+            )
+        )
+
+    async def _run_transition_with_events(
+        self,
+        transition_id: str,
+        records: Mapping[str, Any],
+        *,
+        transition_outputs: Mapping[str, Any] | None = None,
+        node_iterations: Mapping[str, int] | None = None,
+        env_vars: dict[str, str] | None = None,
+        timeout: int | None = None,
+        debug: bool = False,
+        log_file: str = "workflow_debug.log",
+    ) -> dict[str, Any]:
+        # Runs share state copy-on-write between transitions; only the public
+        # entry points pay for detaching their results.
+        kwargs = {
+            "transition_outputs": transition_outputs,
+            "node_iterations": node_iterations,
+            "env_vars": env_vars,
+            "timeout": timeout,
+            "debug": debug,
+            "log_file": log_file,
+        }
+        sink = _execution_events.get()
+        if sink is None:
+            return await self._run_transition(transition_id, records, **kwargs)
+
+        token = _execution_events.set(
+            lambda event: sink({**event, "transition": transition_id})
+        )
+        try:
+            sink({"type": "transition_started", "transition": transition_id})
+            result = await self._run_transition(transition_id, records, **kwargs)
+            if not result.get("success"):
+                status = "failed"
+            elif result["data"]["executed_transitions"]:
+                status = "executed"
+            else:
+                status = "skipped"
+            sink(
+                {
+                    "type": "transition_finished",
+                    "transition": transition_id,
+                    "status": status,
+                }
+            )
+            return result
+        finally:
+            _execution_events.reset(token)
+
+    async def _run_transition(
+        self,
+        transition_id: str,
+        records: Mapping[str, Any],
+        *,
+        transition_outputs: Mapping[str, Any] | None = None,
+        node_iterations: Mapping[str, int] | None = None,
+        env_vars: dict[str, str] | None = None,
+        timeout: int | None = None,
+        debug: bool = False,
+        log_file: str = "workflow_debug.log",
+    ) -> dict[str, Any]:
         transition = self._transition_by_id().get(transition_id)
         if transition is None:
             return _failure(f"workflow transition not found: {transition_id}")
+        compiled = self._compiled_transitions[transition_id]
 
-        state_records = deepcopy(dict(records))
-        outputs = deepcopy(dict(transition_outputs or {}))
+        # Records and outputs are shared copy-on-write: only the mappings on
+        # assigned paths are copied, see _record_set.
+        state_records = dict(records)
+        outputs = dict(transition_outputs or {})
         iterations = dict(node_iterations or {})
+        owned: set[int] = set()
         attempts: list[dict[str, Any]] = []
         executed: list[dict[str, Any]] = []
         skipped: list[dict[str, Any]] = []
 
         try:
-            if not self.evaluate_when(
-                transition.get("when"), state_records, outputs, iterations
+            if compiled.when is not None and not compiled.when.evaluate(
+                state_records, outputs, iterations
             ):
                 skipped.append({"id": transition_id, "reason": "when_false"})
                 return _success(
@@ -671,9 +1220,10 @@ class AiralogyWorkflowEngine:
             run_id = transition.get("run")
             if run_id:
                 assigner = self._assigner_by_id()[run_id]
-                inputs = self._resolve_inputs(
-                    transition, state_records, outputs, iterations
-                )
+                inputs = {
+                    key: value.resolve(state_records, outputs, iterations)
+                    for key, value in compiled.inputs.items()
+                }
                 attempt = {
                     "transition": transition_id,
                     "assigner": run_id,
@@ -690,10 +1240,10 @@ class AiralogyWorkflowEngine:
                     log_file=log_file,
                 )
                 attempt["status"] = "succeeded"
-                attempt["outputs"] = deepcopy(assigner_outputs)
-                outputs[transition_id] = deepcopy(assigner_outputs)
+                attempt["outputs"] = assigner_outputs
+                outputs[transition_id] = assigner_outputs
 
-            for target_node, assignments in transition.get("assign", {}).items():
+            for target_node, assignments in compiled.assign.items():
                 target_record = state_records.get(target_node)
                 if target_record is None:
                     target_record = _record_template()
@@ -701,12 +1251,13 @@ class AiralogyWorkflowEngine:
                     raise WorkflowExecutionError(
                         f"Record for target node {target_node} must be a mapping"
                     )
-                target_record = deepcopy(dict(target_record))
-                for field_path, raw_value in assignments.items():
-                    value = self.resolve_value(
-                        raw_value, state_records, outputs, iterations
+                for field_path, value in assignments:
+                    target_record = _record_set(
+                        target_record,
+                        field_path,
+                        value.resolve(state_records, outputs, iterations),
+                        owned,
                     )
-                    _record_set(target_record, field_path.split("."), value)
                 state_records[target_node] = target_record
 
             for target_node in transition.get("to", []):
@@ -757,6 +1308,9 @@ class AiralogyWorkflowEngine:
         transition_outputs: Mapping[str, Any] | None = None,
         node_iterations: Mapping[str, int] | None = None,
         max_passes: int = 1,
+        scheduler: Literal["sequential", "dag"] = "sequential",
+        max_concurrency: int = 4,
+        run_id: str | None = None,
         env_vars: dict[str, str] | None = None,
         timeout: int | None = None,
         debug: bool = False,
@@ -766,9 +1320,25 @@ class AiralogyWorkflowEngine:
 
         ``max_passes`` defaults to ``1``. Higher values let callers model loop
         passes while transition-level ``max_iterations`` limits are enforced.
+
+        With ``scheduler="dag"``, transitions of a pass that do not touch each
+        other's nodes or outputs run concurrently, up to ``max_concurrency`` at
+        a time. Transitions that do keep declaration order, so results and the
+        order of attempts match the sequential scheduler.
+
+        With a ``checkpoint_store``, progress is saved under ``run_id`` (a new
+        id by default, returned as ``data["run_id"]``) after every transition,
+        or after every pass with the DAG scheduler.
+
+        The result shares no objects with ``records``, ``transition_outputs``
+        or the engine, so it can be edited in place.
         """
         if max_passes < 1:
             return _failure("max_passes must be a positive integer")
+        if scheduler not in {"sequential", "dag"}:
+            return _failure("scheduler must be 'sequential' or 'dag'")
+        if max_concurrency < 1:
+            return _failure("max_concurrency must be a positive integer")
 
         known_transitions = self._transition_by_id()
         if transition_ids is None:
@@ -779,24 +1349,236 @@ class AiralogyWorkflowEngine:
                 if transition_id not in known_transitions:
                     return _failure(f"workflow transition not found: {transition_id}")
 
-        state_records = deepcopy(dict(records))
-        outputs = deepcopy(dict(transition_outputs or {}))
-        iterations = dict(node_iterations or {})
-        transition_counts: dict[str, int] = {}
-        executed: list[dict[str, Any]] = []
-        skipped: list[dict[str, Any]] = []
-        attempts: list[dict[str, Any]] = []
+        if self.checkpoint_store is not None and run_id is None:
+            run_id = uuid.uuid4().hex
+        checkpoint: dict[str, Any] = {
+            "workflow_id": self.workflow.get("id"),
+            "status": "running",
+            "options": {
+                "transition_ids": selected,
+                "max_passes": max_passes,
+                "scheduler": scheduler,
+                "max_concurrency": max_concurrency,
+            },
+            "position": {"pass": 0, "index": 0},
+            "state": {
+                "records": dict(records),
+                "transition_outputs": dict(transition_outputs or {}),
+                "node_iterations": dict(node_iterations or {}),
+                "transition_counts": {},
+                "executed_transitions": [],
+                "skipped_transitions": [],
+                "attempts": [],
+            },
+        }
+        return await self._run_from_checkpoint(
+            run_id,
+            checkpoint,
+            env_vars=env_vars,
+            timeout=timeout,
+            debug=debug,
+            log_file=log_file,
+        )
 
-        for _pass_index in range(max_passes):
-            for transition_id in selected:
+    async def stream(
+        self,
+        records: Mapping[str, Any],
+        *,
+        max_buffered_events: int = 1000,
+        **run_kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run the workflow like ``run()`` and yield events while it runs.
+
+        Events are ``transition_started`` and ``transition_finished`` per
+        transition, plus the ``log`` and ``progress`` events of sandbox
+        assigners tagged with their ``transition``. The last event has
+        ``type="result"`` and holds the result ``run()`` would return.
+        """
+        async for event in _stream_events(
+            lambda: self.run(records, **run_kwargs), max_buffered_events
+        ):
+            yield event
+
+    async def resume(
+        self,
+        run_id: str,
+        *,
+        env_vars: dict[str, str] | None = None,
+        timeout: int | None = None,
+        debug: bool = False,
+        log_file: str = "workflow_debug.log",
+    ) -> dict[str, Any]:
+        """Continue a checkpointed run after its last completed transition.
+
+        A failed transition is retried. Resuming a run that already succeeded
+        returns its stored result without executing anything.
+        """
+        if self.checkpoint_store is None:
+            return _failure("resume requires a checkpoint_store")
+        checkpoint = self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            return _failure(f"workflow run not found: {run_id}")
+        if checkpoint.get("workflow_id") != self.workflow.get("id"):
+            return _failure(
+                f"workflow run {run_id} belongs to workflow "
+                f"{checkpoint.get('workflow_id')}, not {self.workflow.get('id')}"
+            )
+        known_transitions = self._transition_by_id()
+        for transition_id in checkpoint["options"]["transition_ids"]:
+            if transition_id not in known_transitions:
+                return _failure(f"workflow transition not found: {transition_id}")
+        return await self._run_from_checkpoint(
+            run_id,
+            checkpoint,
+            env_vars=env_vars,
+            timeout=timeout,
+            debug=debug,
+            log_file=log_file,
+        )
+
+    def _save_checkpoint(self, run_id: str | None, checkpoint: dict[str, Any]) -> None:
+        if run_id is not None and self.checkpoint_store is not None:
+            try:
+                self.checkpoint_store.save(run_id, checkpoint)
+            except (TypeError, ValueError) as exc:
+                raise _CheckpointSaveError(
+                    f"failed to save checkpoint of workflow run {run_id}: {exc}"
+                ) from exc
+
+    async def _run_from_checkpoint(
+        self,
+        run_id: str | None,
+        checkpoint: dict[str, Any],
+        *,
+        env_vars: dict[str, str] | None,
+        timeout: int | None,
+        debug: bool,
+        log_file: str,
+    ) -> dict[str, Any]:
+        """Run the passes of ``checkpoint`` from its position, saving progress.
+
+        The result is detached from the caller's records and outputs.
+        """
+        try:
+            result = await self._run_checkpoint_passes(
+                run_id,
+                checkpoint,
+                env_vars=env_vars,
+                timeout=timeout,
+                debug=debug,
+                log_file=log_file,
+            )
+        except _CheckpointSaveError as exc:
+            return _failure(str(exc), {"run_id": run_id})
+        return _detached(result)
+
+    async def _run_checkpoint_passes(
+        self,
+        run_id: str | None,
+        checkpoint: dict[str, Any],
+        *,
+        env_vars: dict[str, str] | None,
+        timeout: int | None,
+        debug: bool,
+        log_file: str,
+    ) -> dict[str, Any]:
+        options = checkpoint["options"]
+        selected = options["transition_ids"]
+        state = checkpoint["state"]
+        state_records = state["records"]
+        outputs = state["transition_outputs"]
+        iterations = state["node_iterations"]
+        transition_counts = state["transition_counts"]
+        executed = state["executed_transitions"]
+        skipped = state["skipped_transitions"]
+        attempts = state["attempts"]
+        known_transitions = self._transition_by_id()
+
+        def save(status: str, pass_index: int, index: int) -> None:
+            checkpoint["status"] = status
+            checkpoint["position"] = {"pass": pass_index, "index": index}
+            checkpoint["state"] = {
+                "records": state_records,
+                "transition_outputs": outputs,
+                "node_iterations": iterations,
+                "transition_counts": transition_counts,
+                "executed_transitions": executed,
+                "skipped_transitions": skipped,
+                "attempts": attempts,
+            }
+            self._save_checkpoint(run_id, checkpoint)
+
+        def with_run_id(result: dict[str, Any]) -> dict[str, Any]:
+            if run_id is not None:
+                result.setdefault("data", {})["run_id"] = run_id
+            return result
+
+        if checkpoint["status"] == "succeeded":
+            return with_run_id(
+                _success(
+                    {
+                        "workflow": self.workflow,
+                        "records": state_records,
+                        "transition_outputs": outputs,
+                        "executed_transitions": executed,
+                        "skipped_transitions": skipped,
+                        "attempts": attempts,
+                        "node_iterations": iterations,
+                    }
+                )
+            )
+
+        start_pass = checkpoint["position"]["pass"]
+        start_index = checkpoint["position"]["index"]
+        save("running", start_pass, start_index)
+        for pass_index in range(start_pass, options["max_passes"]):
+            if options["scheduler"] == "dag":
+                before_pass = {
+                    "records": dict(state_records),
+                    "transition_outputs": dict(outputs),
+                    "node_iterations": dict(iterations),
+                    "transition_counts": dict(transition_counts),
+                    "executed_transitions": list(executed),
+                    "skipped_transitions": list(skipped),
+                }
+                failure = await self._run_dag_pass(
+                    selected,
+                    state_records,
+                    outputs,
+                    iterations,
+                    transition_counts,
+                    executed=executed,
+                    skipped=skipped,
+                    attempts=attempts,
+                    max_concurrency=options["max_concurrency"],
+                    env_vars=env_vars,
+                    timeout=timeout,
+                    debug=debug,
+                    log_file=log_file,
+                )
+                if failure is not None:
+                    # The whole pass is rerun on resume, so keep the state
+                    # from before it along with every attempt so far.
+                    checkpoint["status"] = "failed"
+                    checkpoint["position"] = {"pass": pass_index, "index": 0}
+                    checkpoint["state"] = {**before_pass, "attempts": list(attempts)}
+                    self._save_checkpoint(run_id, checkpoint)
+                    return with_run_id(failure)
+                save("running", pass_index + 1, 0)
+                continue
+
+            first = start_index if pass_index == start_pass else 0
+            for index in range(first, len(selected)):
+                transition_id = selected[index]
                 transition = known_transitions[transition_id]
                 count = transition_counts.get(transition_id, 0)
                 max_iterations = transition.get("max_iterations")
                 if isinstance(max_iterations, int) and count >= max_iterations:
                     skipped.append({"id": transition_id, "reason": "max_iterations"})
+                    save("running", pass_index, index + 1)
                     continue
 
-                result = await self.run_transition(
+                result = await self._run_transition_with_events(
                     transition_id,
                     state_records,
                     transition_outputs=outputs,
@@ -810,10 +1592,11 @@ class AiralogyWorkflowEngine:
                 attempts.extend(data.get("attempts", []))
                 skipped.extend(data.get("skipped_transitions", []))
                 if not result.get("success"):
+                    save("failed", pass_index, index)
                     data["attempts"] = attempts
                     data["skipped_transitions"] = skipped
                     data["executed_transitions"] = executed
-                    return result
+                    return with_run_id(result)
 
                 state_records = data["records"]
                 outputs = data["transition_outputs"]
@@ -822,18 +1605,191 @@ class AiralogyWorkflowEngine:
                 if transition_executed:
                     transition_counts[transition_id] = count + 1
                     executed.extend(transition_executed)
+                save("running", pass_index, index + 1)
 
-        return _success(
-            {
-                "workflow": self.workflow,
-                "records": state_records,
-                "transition_outputs": outputs,
-                "executed_transitions": executed,
-                "skipped_transitions": skipped,
-                "attempts": attempts,
-                "node_iterations": iterations,
+        save("succeeded", options["max_passes"], 0)
+        return with_run_id(
+            _success(
+                {
+                    "workflow": self.workflow,
+                    "records": state_records,
+                    "transition_outputs": outputs,
+                    "executed_transitions": executed,
+                    "skipped_transitions": skipped,
+                    "attempts": attempts,
+                    "node_iterations": iterations,
+                }
+            )
+        )
+
+    async def _run_dag_pass(
+        self,
+        transition_ids: Sequence[str],
+        records: dict[str, Any],
+        outputs: dict[str, Any],
+        iterations: dict[str, int],
+        transition_counts: dict[str, int],
+        *,
+        executed: list[dict[str, Any]],
+        skipped: list[dict[str, Any]],
+        attempts: list[dict[str, Any]],
+        max_concurrency: int,
+        env_vars: dict[str, str] | None,
+        timeout: int | None,
+        debug: bool,
+        log_file: str,
+    ) -> dict[str, Any] | None:
+        """Run one pass concurrently along the transition dependency graph.
+
+        ``records``, ``outputs``, ``iterations`` and ``transition_counts`` are
+        updated in place. Returns the failure result of the first failed
+        transition in declaration order, or None when the pass succeeded.
+
+        As in the sequential scheduler, a failure stops the transitions
+        declared after it: running ones are cancelled, ready ones are not
+        started, and the state and reports keep only the transitions declared
+        before it, which still run to completion.
+        """
+        known_transitions = self._transition_by_id()
+        accesses = [
+            _transition_accesses(
+                known_transitions[transition_id],
+                self._compiled_transitions[transition_id],
+            )
+            for transition_id in transition_ids
+        ]
+        graph: dict[int, set[int]] = {}
+        for index, (reads, writes) in enumerate(accesses):
+            graph[index] = {
+                earlier
+                for earlier, (earlier_reads, earlier_writes) in enumerate(
+                    accesses[:index]
+                )
+                if writes & (earlier_reads | earlier_writes) or reads & earlier_writes
             }
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+        before_pass = (
+            dict(records),
+            dict(outputs),
+            dict(iterations),
+            dict(transition_counts),
         )
 
+        def merge(index: int, data: dict[str, Any]) -> None:
+            if not data.get("executed_transitions"):
+                return
+            # Concurrent transitions write disjoint state, so only this
+            # transition's own writes are merged back.
+            transition_id = transition_ids[index]
+            transition = known_transitions[transition_id]
+            for node in transition.get("assign", {}):
+                records[node] = data["records"][node]
+            if transition_id in data["transition_outputs"]:
+                outputs[transition_id] = data["transition_outputs"][transition_id]
+            for node in transition.get("to", []):
+                iterations[node] = data["node_iterations"][node]
+            transition_counts[transition_id] = transition_counts.get(transition_id, 0) + 1
+
+        results: dict[int, dict[str, Any]] = {}
+        running: dict[asyncio.Task[dict[str, Any]], int] = {}
+        ready: list[int] = []
+        failed_index: int | None = None
+        while True:
+            ready.extend(sorter.get_ready())
+            ready.sort()
+            while ready and len(running) < max_concurrency:
+                index = ready.pop(0)
+                if failed_index is not None and index > failed_index:
+                    ready.clear()
+                    break
+                transition_id = transition_ids[index]
+                max_iterations = known_transitions[transition_id].get("max_iterations")
+                if (
+                    isinstance(max_iterations, int)
+                    and transition_counts.get(transition_id, 0) >= max_iterations
+                ):
+                    results[index] = _success(
+                        {
+                            "skipped_transitions": [
+                                {"id": transition_id, "reason": "max_iterations"}
+                            ]
+                        }
+                    )
+                    sorter.done(index)
+                    ready.extend(sorter.get_ready())
+                    ready.sort()
+                    continue
+                task = asyncio.create_task(
+                    self._run_transition_with_events(
+                        transition_id,
+                        dict(records),
+                        transition_outputs=dict(outputs),
+                        node_iterations=dict(iterations),
+                        env_vars=env_vars,
+                        timeout=timeout,
+                        debug=debug,
+                        log_file=log_file,
+                    )
+                )
+                running[task] = index
+            if not running:
+                break
+
+            done, _pending = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=running.__getitem__):
+                index = running.pop(task)
+                if failed_index is not None and index > failed_index:
+                    continue  # Cancelled, or finished after an earlier failure.
+                result = task.result()
+                results[index] = result
+                if not result.get("success"):
+                    failed_index = index
+                    for other, other_index in running.items():
+                        if other_index > failed_index:
+                            other.cancel()
+                    continue
+                merge(index, result["data"])
+                sorter.done(index)
+
+        if failed_index is not None:
+            # Transitions declared after the failure may have been merged
+            # before it was seen, so the state is rebuilt from the ones the
+            # sequential scheduler would have run.
+            for target, snapshot in zip(
+                (records, outputs, iterations, transition_counts), before_pass
+            ):
+                target.clear()
+                target.update(snapshot)
+            for index in sorted(results):
+                if index < failed_index:
+                    merge(index, results[index]["data"])
+
+        failure: dict[str, Any] | None = None
+        for index in sorted(results):
+            if failed_index is not None and index > failed_index:
+                break
+            result = results[index]
+            data = result.get("data", {})
+            attempts.extend(data.get("attempts", []))
+            skipped.extend(data.get("skipped_transitions", []))
+            executed.extend(data.get("executed_transitions", []))
+            if not result.get("success"):
+                failure = result
+        if failure is not None:
+            failure.setdefault("data", {}).update(
+                {
+                    "records": records,
+                    "transition_outputs": outputs,
+                    "executed_transitions": executed,
+                    "skipped_transitions": skipped,
+                    "attempts": attempts,
+                    "node_iterations": iterations,
+                }
+            )
+        return failure
+
 
 __all__ = ["AiralogyWorkflowEngine", "WorkflowExecutionError"]
@@ -9,14 +9,62 @@ import inspect
 import json
 import os
 import sys
+import threading
+import time
 import traceback
 from collections.abc import Mapping
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 WORKFLOW_DIR = Path(
     os.environ.get("AIRALOGY_WORKFLOW_DIR", "/home/airalogy/protocols/workflow")
 ).resolve()
+_MODULES: dict[Path, ModuleType] = {}
+# Must match protocol_executor's streaming conventions: with
+# AIRALOGY_ENGINE_EVENTS=1, assigner output is reported as stderr event lines.
+EVENT_PREFIX = "@@airalogy-event "
+PROGRESS_PREFIX = "@@airalogy-progress "
+_events_enabled = os.environ.get("AIRALOGY_ENGINE_EVENTS", "0") == "1"
+
+
+def _emit_event(event: dict[str, Any]) -> None:
+    line = json.dumps(event, default=str, separators=(",", ":"), ensure_ascii=False)
+    sys.__stderr__.write(f"{EVENT_PREFIX}{line}\n")
+    sys.__stderr__.flush()
+
+
+class _StdoutEvents:
+    """Report assigner stdout lines as log or progress events."""
+
+    encoding = "utf-8"
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def _forward(self, line: str) -> None:
+        event: dict[str, Any] = {"type": "log", "stream": "stdout", "message": line}
+        if line.startswith(PROGRESS_PREFIX):
+            try:
+                progress = json.loads(line[len(PROGRESS_PREFIX) :])
+            except ValueError:
+                progress = None
+            if isinstance(progress, dict):
+                event = {**progress, "type": "progress"}
+        _emit_event(event)
+
+    def write(self, value: str) -> int:
+        self._buffer += value
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self._forward(line.rstrip("\r"))
+        return len(value)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._forward(self._buffer.rstrip("\r"))
+            self._buffer = ""
 
 
 def _normalize_outputs(value: Any) -> dict[str, Any]:
@@ -49,29 +97,35 @@ def _load_entrypoint(entrypoint: str) -> Any:
     if not module_path.is_relative_to(WORKFLOW_DIR):
         raise ValueError("workflow assigner entrypoint must stay inside workflow root")
 
-    sys.path.insert(0, str(WORKFLOW_DIR))
-    sys.path.insert(0, str(module_path.parent))
-    module_name = f"_airalogy_workflow_assigner_{abs(hash(str(module_path)))}"
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    if spec is None or spec.loader is None:
-        raise ValueError(f"workflow assigner file cannot be loaded: {file_path}")
+    module = _MODULES.get(module_path)
+    if module is None:
+        sys.path.insert(0, str(WORKFLOW_DIR))
+        sys.path.insert(0, str(module_path.parent))
+        module_name = f"_airalogy_workflow_assigner_{abs(hash(str(module_path)))}"
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        if spec is None or spec.loader is None:
+            raise ValueError(f"workflow assigner file cannot be loaded: {file_path}")
 
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _MODULES[module_path] = module
     func = getattr(module, function_name, None)
     if not callable(func):
         raise ValueError(f"workflow assigner function not found: {function_name}")
     return func
 
 
-async def _run_assigner(entrypoint: str, inputs: dict[str, Any]) -> dict[str, Any]:
-    func = _load_entrypoint(entrypoint)
+async def _call_assigner(func: Any, inputs: dict[str, Any]) -> dict[str, Any]:
     result = func(**inputs)
     if inspect.isawaitable(result):
         result = await result
     return _normalize_outputs(result)
 
 
+async def _run_assigner(entrypoint: str, inputs: dict[str, Any]) -> dict[str, Any]:
+    return await _call_assigner(_load_entrypoint(entrypoint), inputs)
+
+
 def _success(data: dict[str, Any]) -> dict[str, Any]:
     return {"success": True, "data": data}
 
@@ -80,20 +134,127 @@ def _failure(message: str, output: str = "") -> dict[str, Any]:
     return {"success": False, "message": message, "output": output}
 
 
+def _validate_call(params: Any) -> tuple[str, dict[str, Any]]:
+    if not isinstance(params, Mapping):
+        raise ValueError("assigner call must be a mapping")
+    entrypoint = params["entrypoint"]
+    inputs = params.get("inputs") or {}
+    if not isinstance(entrypoint, str):
+        raise ValueError("entrypoint must be a string")
+    if not isinstance(inputs, dict):
+        raise ValueError("inputs must be a dict")
+    return entrypoint, inputs
+
+
+def _run_batch(calls: list[Any], timeout: float | None) -> list[dict[str, Any]]:
+    """Run several assigners in this process, isolating failures and timeouts.
+
+    Entrypoints are loaded one after another on the main thread, then every
+    assigner runs in its own daemon thread and event loop. The assigners share
+    this interpreter: ``sys.modules``, ``sys.path``, the working directory and
+    the module globals of calls to the same assigner file. An assigner still
+    running ``timeout`` seconds after the calls started is reported as timed
+    out while the others keep their results; its thread is abandoned when the
+    process exits. Callers must keep stdout away from the result JSON, since
+    abandoned threads may still print.
+    """
+    results: list[dict[str, Any] | None] = [None] * len(calls)
+    threads: list[tuple[int, threading.Thread]] = []
+
+    def run(index: int, func: Any, inputs: dict[str, Any]) -> None:
+        try:
+            outputs = asyncio.run(_call_assigner(func, inputs))
+            results[index] = _success({"outputs": outputs})
+        except Exception as exc:
+            results[index] = _failure(str(exc), traceback.format_exc())
+
+    for index, call in enumerate(calls):
+        try:
+            entrypoint, inputs = _validate_call(call)
+            func = _load_entrypoint(entrypoint)
+        except Exception as exc:
+            results[index] = _failure(str(exc), traceback.format_exc())
+            continue
+        thread = threading.Thread(target=run, args=(index, func, inputs), daemon=True)
+        threads.append((index, thread))
+
+    started = time.monotonic()
+    for _index, thread in threads:
+        thread.start()
+    for index, thread in threads:
+        remaining = None if timeout is None else timeout - (time.monotonic() - started)
+        thread.join(None if remaining is None else max(remaining, 0))
+        if thread.is_alive():
+            results[index] = _failure(f"Execution timed out after {timeout:g} seconds")
+    return [
+        result or _failure("workflow assigner returned no result") for result in results
+    ]
+
+
+# Passed in place of the JSON parameter when the engine sends it on stdin as
+# b"<byte length>\n" followed by the JSON bytes, for payloads too large for argv.
+STDIN_PARAMS_ARG = "-"
+
+
+def _read_stdin_params() -> bytes:
+    header = sys.stdin.buffer.readline()
+    try:
+        length = int(header)
+    except ValueError:
+        raise ValueError(
+            f"Invalid stdin parameter frame header: {header[:32]!r}"
+        ) from None
+    payload = sys.stdin.buffer.read(length)
+    if len(payload) != length:
+        raise ValueError(
+            f"Truncated stdin parameters: expected {length} bytes, got {len(payload)}"
+        )
+    return payload
+
+
 def main() -> None:
     if len(sys.argv) != 2:
         print(json.dumps(_failure("workflow executor expects one JSON parameter")))
         raise SystemExit(0)
 
     try:
-        params = json.loads(sys.argv[1])
-        entrypoint = params["entrypoint"]
-        inputs = params.get("inputs") or {}
-        if not isinstance(entrypoint, str):
-            raise ValueError("entrypoint must be a string")
-        if not isinstance(inputs, dict):
-            raise ValueError("inputs must be a dict")
-        outputs = asyncio.run(_run_assigner(entrypoint, inputs))
+        raw_params = sys.argv[1]
+        if raw_params == STDIN_PARAMS_ARG:
+            raw_params = _read_stdin_params()
+        params = json.loads(raw_params)
+        if isinstance(params, Mapping) and "batch" in params:
+            calls = params["batch"]
+            timeout = params.get("timeout")
+            if not isinstance(calls, list):
+                raise ValueError("batch must be a list")
+            if timeout is not None and not isinstance(timeout, (int, float)):
+                raise ValueError("timeout must be a number")
+            # Assigner output goes to stderr for the rest of the process, so
+            # threads that outlive their timeout cannot write after the result.
+            result_stdout = sys.stdout
+            sys.stdout = sys.stderr
+            results = _run_batch(calls, timeout)
+            result_stdout.write(
+                json.dumps(_success({"results": results}), ensure_ascii=False) + "\n"
+            )
+            result_stdout.flush()
+            if threading.active_count() > 1:
+                # Skip interpreter shutdown, which would wait on the streams
+                # that timed-out threads are still writing to.
+                sys.stderr.flush()
+                os._exit(0)
+            return
+
+        entrypoint, inputs = _validate_call(params)
+        if _events_enabled:
+            stdout_events = _StdoutEvents()
+            try:
+                with redirect_stdout(stdout_events):
+                    outputs = asyncio.run(_run_assigner(entrypoint, inputs))
+            finally:
+                stdout_events.flush()
+        else:
+            outputs = asyncio.run(_run_assigner(entrypoint, inputs))
         print(json.dumps(_success({"outputs": outputs}), ensure_ascii=False))
     except Exception as exc:
         print(
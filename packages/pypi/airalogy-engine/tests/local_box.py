@@ -0,0 +1,175 @@
+"""Local stand-ins for BoxLite boxes used by sandbox-free engine tests.
+
+``LocalBox`` runs commands as host subprocesses inside a temporary working
+directory laid out like the sandbox (``protocol_executor.py`` next to a
+``protocol/`` package), so executor protocols can be exercised end to end
+without a BoxLite runtime. ``LocalBoxlite`` stands in for the runtime itself,
+creating ``LocalBox`` boxes for code that drives ``Boxlite.create``.
+"""
+
+import asyncio
+import itertools
+import os
+import shutil
+import sys
+from pathlib import Path
+
+_BOX_IDS = itertools.count(1)
+
+
+class LocalState:
+    def __init__(self, running: bool):
+        self.running = running
+        self.status = "Running" if running else "Stopped"
+
+
+class LocalInfo:
+    def __init__(self, running: bool):
+        self.state = LocalState(running)
+
+
+class LocalExecResult:
+    def __init__(self, exit_code: int):
+        self.exit_code = exit_code
+
+
+class LocalStdin:
+    def __init__(self, process: asyncio.subprocess.Process):
+        self._process = process
+
+    async def send_input(self, data: bytes) -> None:
+        self._process.stdin.write(data)
+        await self._process.stdin.drain()
+
+    async def close(self) -> None:
+        self._process.stdin.close()
+
+
+async def _iter_chunks(stream: asyncio.StreamReader):
+    # Like BoxLite streams, chunks need not end on a line boundary.
+    while True:
+        chunk = await stream.read(64 * 1024)
+        if not chunk:
+            return
+        yield chunk
+
+
+class LocalExecution:
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+
+    def stdin(self) -> LocalStdin:
+        return LocalStdin(self.process)
+
+    def stdout(self):
+        return _iter_chunks(self.process.stdout)
+
+    def stderr(self):
+        return _iter_chunks(self.process.stderr)
+
+    async def wait(self) -> LocalExecResult:
+        return LocalExecResult(await self.process.wait())
+
+    async def kill(self) -> None:
+        if self.process.returncode is None:
+            self.process.kill()
+            await self.process.wait()
+
+
+class LocalBox:
+    """A box whose commands run as host subprocesses in ``working_dir``."""
+
+    def __init__(
+        self,
+        working_dir: Path,
+        protocol_path: str | Path | None = None,
+        mount_name: str = "protocol",
+        env: dict[str, str] | None = None,
+    ):
+        self.id = f"local-box-{next(_BOX_IDS)}"
+        self.working_dir = Path(working_dir)
+        self.working_dir.mkdir(parents=True, exist_ok=True)
+        if protocol_path is not None:
+            shutil.copytree(protocol_path, self.working_dir / mount_name)
+        self.env = dict(env or {})
+        self.running = True
+        self.exec_count = 0
+        self.commands: list[list[str]] = []
+        self.executions: list[LocalExecution] = []
+
+    def info(self) -> LocalInfo:
+        return LocalInfo(self.running)
+
+    async def exec(self, command: str, args=None, env=None) -> LocalExecution:
+        if not self.running:
+            raise RuntimeError(f"box {self.id} is stopped")
+        self.exec_count += 1
+        self.commands.append([command, *(args or [])])
+        program = sys.executable if command == "python" else command
+        process = await asyncio.create_subprocess_exec(
+            program,
+            *(args or []),
+            cwd=self.working_dir,
+            env={**os.environ, **self.env, **dict(env or [])},
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        execution = LocalExecution(process)
+        self.executions.append(execution)
+        return execution
+
+    async def copy_in(self, source: str, destination: str, options=None) -> None:
+        shutil.copy(source, self.working_dir / Path(source).name)
+
+    async def copy_out(self, source: str, destination: str, options=None) -> None:
+        path = self.working_dir / Path(source).name
+        if path.exists():
+            shutil.copy(path, destination)
+
+    async def stop(self) -> None:
+        self.running = False
+        for execution in self.executions:
+            await execution.kill()
+
+
+class LocalBoxlite:
+    """A BoxLite runtime whose ``create`` returns ``LocalBox`` boxes.
+
+    BoxLite options do not expose their volumes, so every box gets a copy of
+    ``mount_path`` under ``mount_name`` instead of the requested mounts.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        mount_path: str | Path | None = None,
+        mount_name: str = "protocol",
+        env: dict[str, str] | None = None,
+        boot_delay: float = 0.0,
+    ):
+        self.root = Path(root)
+        self.mount_path = mount_path
+        self.mount_name = mount_name
+        self.env = env
+        self.boot_delay = boot_delay
+        self.boxes: list[LocalBox] = []
+        self.options: list = []
+        self.closed = False
+
+    async def create(self, options) -> LocalBox:
+        if self.closed:
+            raise RuntimeError("runtime is closed")
+        await asyncio.sleep(self.boot_delay)
+        box = LocalBox(
+            self.root / f"box-{len(self.boxes)}",
+            self.mount_path,
+            mount_name=self.mount_name,
+            env=self.env,
+        )
+        self.boxes.append(box)
+        self.options.append(options)
+        return box
+
+    def close(self) -> None:
+        self.closed = True
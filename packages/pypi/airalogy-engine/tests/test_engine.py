@@ -14,6 +14,7 @@ from pathlib import Path
 import pytest
 
 from airalogy_engine import AiralogyEngine
+from tests.local_box import LocalBox
 
 _MONOREPO_ROOT = Path(__file__).resolve().parents[4]
 _EXAMPLE_PROTOCOL = str(_MONOREPO_ROOT / "examples/airalogy-engine")
@@ -726,11 +727,522 @@ class TestSandboxExecutionHelper:
             await engine.close()
 
 
+# ---------------------------------------------------------------------------
+# warm worker
+# ---------------------------------------------------------------------------
+
+
+def _local_box_engine(
+    monkeypatch,
+    tmp_path: Path,
+    protocol_path: str = _EXAMPLE_PROTOCOL,
+    **kwargs,
+) -> AiralogyEngine:
+    """Return an engine whose boxes are LocalBox subprocess stand-ins."""
+    import airalogy_engine.engine as engine_module
+
+    engine = AiralogyEngine(protocol_path, **kwargs)
+    boxes: list[LocalBox] = []
+
+    async def create_local_box():
+        box = LocalBox(tmp_path / f"box-{len(boxes)}", protocol_path)
+        await box.copy_in(engine_module._EXECUTOR_PATH, "")
+        boxes.append(box)
+        return box
+
+    monkeypatch.setattr(engine, "_create_box", create_local_box)
+    engine.local_boxes = boxes
+    return engine
+
+
+class TestWarmWorker:
+    """Tests for the opt-in long-lived protocol executor."""
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_serves_calls_from_one_process(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        engine = _local_box_engine(monkeypatch, tmp_path, warm_worker=True)
+
+        try:
+            first = await engine.assign_variable(
+                "endpoint",
+                {"seconds": 60},
+                env_vars={"ENDPOINT": _VALID_ENDPOINT},
+            )
+            second = await engine.assign_variable("duration", {"seconds": 30})
+            validated = await engine.validate_variables(variables=_VALID_VARIABLES)
+        finally:
+            await engine.close()
+
+        assert first["success"] is True
+        assert first["data"]["assigned_fields"]["endpoint"] == _VALID_ENDPOINT
+        assert second["success"] is True
+        assert second["data"]["assigned_fields"]["duration"] == "PT30S"
+        # Per-request env vars do not leak into later requests.
+        assert second["data"]["assigned_fields"]["endpoint"] == ""
+        assert validated["success"] is True
+        assert "errors" not in validated["data"]
+        assert len(engine.local_boxes) == 1
+        assert engine.local_boxes[0].exec_count == 1
+        assert engine.local_boxes[0].running is False
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_reloads_changed_protocol_files(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        engine = _local_box_engine(monkeypatch, tmp_path, warm_worker=True)
+
+        try:
+            first = await engine.assign_variable("endpoint", {"seconds": 1})
+            assigner_path = engine.local_boxes[0].working_dir / "protocol/assigner.py"
+            assigner_path.write_text(
+                assigner_path.read_text(encoding="utf-8").replace(
+                    'os.environ.get("ENDPOINT", "")',
+                    '"reloaded"',
+                ),
+                encoding="utf-8",
+            )
+            os.utime(assigner_path, ns=(0, 0))
+            second = await engine.assign_variable("endpoint", {"seconds": 1})
+        finally:
+            await engine.close()
+
+        assert first["data"]["assigned_fields"]["endpoint"] == ""
+        assert second["success"] is True
+        assert second["data"]["assigned_fields"]["endpoint"] == "reloaded"
+        assert engine.local_boxes[0].exec_count == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_timeout_restarts_process(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        engine = _local_box_engine(monkeypatch, tmp_path, warm_worker=True)
+
+        try:
+            timed_out = await engine.assign_variable(
+                "duration",
+                {"seconds": 60},
+                env_vars={"PROTOCOL_SLEEP_TIME": "5"},
+                timeout=1,
+            )
+            recovered = await engine.assign_variable("duration", {"seconds": 60})
+        finally:
+            await engine.close()
+
+        assert timed_out["success"] is False
+        assert "timed out" in timed_out["message"]
+        assert recovered["success"] is True
+        assert engine.local_boxes[0].exec_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_worker_runs_migrations_in_a_one_shot_process(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        engine = _local_box_engine(monkeypatch, tmp_path, warm_worker=True)
+
+        try:
+            await engine.assign_variable(
+                "endpoint",
+                {"seconds": 60},
+                env_vars={"ENDPOINT": _VALID_ENDPOINT},
+            )
+            migrated = await engine.migrate_schema(
+                {"var": {"old_name": "pUC19"}},
+                {
+                    "version": "airalogy.migration.v1",
+                    "from": "1.0.0",
+                    "to": "2.0.0",
+                    "operations": [
+                        {"op": "rename", "from": "var.old_name", "to": "var.name"}
+                    ],
+                },
+            )
+            served = await engine.assign_variable("duration", {"seconds": 30})
+        finally:
+            await engine.close()
+
+        assert migrated["success"] is True, migrated
+        assert migrated["data"]["data"]["var"] == {"name": "pUC19"}
+        assert served["success"] is True
+        # The warm worker served both assigner calls; the migration got its own.
+        assert engine.local_boxes[0].exec_count == 2
+
+    def test_protocol_snapshot_covers_nested_python_modules(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        from airalogy_engine import protocol_executor
+
+        protocol_dir = tmp_path / "protocol"
+        (protocol_dir / "helpers" / "__pycache__").mkdir(parents=True)
+        (protocol_dir / "protocol.aimd").write_text("# Test", encoding="utf-8")
+        helper = protocol_dir / "helpers" / "units.py"
+        helper.write_text("FACTOR = 1\n", encoding="utf-8")
+        (protocol_dir / "helpers" / "data.csv").write_text("a\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        before = protocol_executor._protocol_snapshot("protocol")
+        (protocol_dir / "helpers" / "data.csv").write_text("a,b\n", encoding="utf-8")
+        (protocol_dir / "helpers" / "__pycache__" / "units.pyc").write_bytes(b"x")
+        assert protocol_executor._protocol_snapshot("protocol") == before
+
+        helper.write_text("FACTOR = 60\n", encoding="utf-8")
+        assert protocol_executor._protocol_snapshot("protocol") != before
+
+
+# ---------------------------------------------------------------------------
+# assigner cascade
+# ---------------------------------------------------------------------------
+
+
+def _write_cascade_protocol(protocol_dir: Path) -> None:
+    protocol_dir.mkdir()
+    (protocol_dir / "protocol.aimd").write_text(
+        "Seconds: {{var|seconds: int}}\n"
+        "Minutes: {{var|minutes: float}}\n"
+        "Label: {{var|label: str}}\n",
+        encoding="utf-8",
+    )
+    (protocol_dir / "assigner.py").write_text(
+        """from airalogy.assigner import AssignerResult, assigner
+
+
+@assigner(assigned_fields=["minutes"], dependent_fields=["seconds"], mode="auto")
+def seconds_to_minutes(dep: dict) -> AssignerResult:
+    return AssignerResult(assigned_fields={"minutes": dep["seconds"] / 60})
+
+
+@assigner(assigned_fields=["label"], dependent_fields=["minutes"], mode="auto")
+def minutes_label(dep: dict) -> AssignerResult:
+    return AssignerResult(assigned_fields={"label": f"{dep['minutes']:.1f} min"})
+""",
+        encoding="utf-8",
+    )
+
+
+class TestAssignCascade:
+    """Tests for running a whole assigner cascade in one sandbox call."""
+
+    @pytest.mark.asyncio
+    async def test_assign_cascade_runs_downstream_assigners_in_one_exec(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        protocol_dir = tmp_path / "cascade_protocol"
+        _write_cascade_protocol(protocol_dir)
+        engine = _local_box_engine(
+            monkeypatch,
+            tmp_path,
+            protocol_path=str(protocol_dir),
+            auto_stop=False,
+        )
+
+        try:
+            result = await engine.assign_cascade(
+                ["seconds"], {"seconds": "90"}, max_workers=2
+            )
+            invalid = await engine.assign_cascade(["seconds"], {"seconds": "soon"})
+        finally:
+            await engine.close()
+
+        assert result["success"] is True
+        data = result["data"]
+        assert data["success"] is True
+        assert data["assigned_fields"] == {"minutes": 1.5, "label": "1.5 min"}
+        assert list(data["timings"]) == ["seconds_to_minutes", "minutes_label"]
+        assert engine.local_boxes[0].exec_count == 2
+
+        assert invalid["success"] is True
+        assert invalid["data"]["success"] is False
+        assert "Dependent data validation failed" in (
+            invalid["data"]["errors"]["seconds_to_minutes"]
+        )
+        assert invalid["data"]["skipped"] == ["minutes_label"]
+
+
+def test_executor_awaits_async_assigners(monkeypatch, tmp_path):
+    from airalogy_engine import protocol_executor
+
+    protocol_dir = tmp_path / "protocol"
+    _write_cascade_protocol(protocol_dir)
+    assigner_path = protocol_dir / "assigner.py"
+    assigner_path.write_text(
+        assigner_path.read_text(encoding="utf-8").replace(
+            "def minutes_label", "async def minutes_label"
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        assigned = protocol_executor.assign_variable(
+            "protocol",
+            {"var_name": "label", "dependent_data": {"minutes": "2"}},
+        )
+        cascade = protocol_executor.assign_cascade(
+            "protocol",
+            {"changed_fields": ["seconds"], "data": {"seconds": 30}, "max_workers": 2},
+        )
+    finally:
+        protocol_executor._unload_protocol_modules("protocol")
+
+    assert assigned["assigned_fields"] == {"label": "2.0 min"}
+    assert cascade["success"] is True
+    assert cascade["assigned_fields"] == {"minutes": 0.5, "label": "0.5 min"}
+
+
+# ---------------------------------------------------------------------------
+# generated aimd model reuse
+# ---------------------------------------------------------------------------
+
+
+class TestAimdModelReuse:
+    """aimd_model.py is only regenerated when protocol.aimd changes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("warm_worker", [False, True])
+    async def test_aimd_model_regenerated_only_on_change(
+        self,
+        monkeypatch,
+        tmp_path,
+        warm_worker,
+    ):
+        engine = _local_box_engine(
+            monkeypatch,
+            tmp_path,
+            auto_stop=False,
+            warm_worker=warm_worker,
+        )
+
+        try:
+            first = await engine.assign_variable("duration", {"seconds": 60})
+            protocol_dir = engine.local_boxes[0].working_dir / "protocol"
+            model_path = protocol_dir / "aimd_model.py"
+            assert (protocol_dir / ".aimd_model.sha256").is_file()
+            os.utime(model_path, ns=(0, 0))
+
+            second = await engine.validate_variables(variables=_VALID_VARIABLES)
+            assert model_path.stat().st_mtime_ns == 0
+
+            aimd_path = protocol_dir / "protocol.aimd"
+            aimd_path.write_text(
+                aimd_path.read_text(encoding="utf-8")
+                + "\nNote: {{var|extra_note: str = \"n/a\"}}\n",
+                encoding="utf-8",
+            )
+            third = await engine.validate_variables(variables=_VALID_VARIABLES)
+        finally:
+            await engine.close()
+
+        assert first["success"] is True
+        assert second["success"] is True
+        assert third["success"] is True
+        assert model_path.stat().st_mtime_ns != 0
+        assert "extra_note" in model_path.read_text(encoding="utf-8")
+
+
+def test_params_adapter_is_built_once_per_dependent_keys(monkeypatch, tmp_path):
+    from airalogy_engine import protocol_executor
+
+    shutil.copytree(_EXAMPLE_PROTOCOL, tmp_path / "protocol")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    built = []
+    build_params_adapter = protocol_executor._build_params_adapter
+
+    def counting_build(fields, dependent_keys):
+        built.append(list(dependent_keys))
+        return build_params_adapter(fields, dependent_keys)
+
+    monkeypatch.setattr(protocol_executor, "_build_params_adapter", counting_build)
+    try:
+        results = [
+            protocol_executor.assign_variable(
+                "protocol",
+                {"var_name": "duration", "dependent_data": {"seconds": seconds}},
+            )
+            for seconds in ("60", 30)
+        ]
+        with pytest.raises(ValueError, match="Dependent data validation failed"):
+            protocol_executor.assign_variable(
+                "protocol",
+                {"var_name": "duration", "dependent_data": {"seconds": "soon"}},
+            )
+    finally:
+        protocol_executor._unload_protocol_modules("protocol")
+
+    assert [r["assigned_fields"]["duration"] for r in results] == ["PT1M", "PT30S"]
+    assert built == [["seconds"]]
+
+
 # ---------------------------------------------------------------------------
 # concurrency / runtime homes
 # ---------------------------------------------------------------------------
 
 
+class TestLargePayloads:
+    """Parameters too large for argv travel on stdin as a length-prefixed frame."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("warm_worker", [False, True])
+    async def test_large_parameters_round_trip(
+        self,
+        monkeypatch,
+        tmp_path,
+        warm_worker,
+    ):
+        engine = _local_box_engine(
+            monkeypatch,
+            tmp_path,
+            auto_stop=False,
+            warm_worker=warm_worker,
+        )
+        user_name = "\u00e9" * (1024 * 1024)
+
+        try:
+            result = await engine.validate_variables(
+                variables={**_VALID_VARIABLES, "user_name": user_name}
+            )
+        finally:
+            await engine.close()
+
+        assert result["success"] is True, result
+        assert "errors" not in result["data"]
+        if not warm_worker:
+            assert engine.local_boxes[0].commands[-1][-1] == "-"
+
+    @pytest.mark.asyncio
+    async def test_small_parameters_stay_on_argv(self, monkeypatch, tmp_path):
+        engine = _local_box_engine(monkeypatch, tmp_path)
+
+        try:
+            result = await engine.assign_variable("duration", {"seconds": 60})
+        finally:
+            await engine.close()
+
+        assert result["success"] is True
+        assert engine.local_boxes[0].commands[-1][-1] == (
+            '{"var_name":"duration","dependent_data":{"seconds":60}}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_output_stream_keeps_characters_split_across_chunks(self):
+        import airalogy_engine.engine as engine_module
+
+        text = '{"name":"\u4f60\u597d"}'
+
+        async def chunks():
+            encoded = text.encode("utf-8")
+            for index in range(len(encoded)):
+                yield encoded[index : index + 1]
+
+        lines: list[str] = []
+        await engine_module._collect_output_stream(chunks(), lines)
+
+        assert "".join(lines) == text
+
+
+def test_truncated_stdin_parameters_are_rejected():
+    import io
+
+    from airalogy_engine import protocol_executor
+
+    frame = io.BytesIO(b'12\n{"a": 1}')
+    with pytest.raises(ValueError, match="expected 12 bytes, got 8"):
+        protocol_executor.read_stdin_params(frame)
+    with pytest.raises(ValueError, match="Invalid stdin parameter frame header"):
+        protocol_executor.read_stdin_params(io.BytesIO(b"{}"))
+    assert protocol_executor.read_stdin_params(io.BytesIO(b"2\n{}\n")) == b"{}"
+
+
+class TestStreaming:
+    """``stream()`` yields executor output as events before the result."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_progress_and_logs_before_the_result(
+        self, monkeypatch, tmp_path
+    ):
+        protocol = tmp_path / "protocol"
+        shutil.copytree(_EXAMPLE_PROTOCOL, protocol)
+        assigner_file = protocol / "assigner.py"
+        assigner_file.write_text(
+            assigner_file.read_text().replace(
+                "    if os.environ.get(\"PROTOCOL_SLEEP_TIME\"):",
+                "    print('@@airalogy-progress {\"current\": 1, \"total\": 2}',"
+                " flush=True)\n"
+                "    if os.environ.get(\"PROTOCOL_SLEEP_TIME\"):",
+            )
+        )
+        # The warm worker is bypassed so output can be streamed.
+        engine = _local_box_engine(
+            monkeypatch, tmp_path / "boxes", str(protocol), warm_worker=True
+        )
+
+        events = []
+        try:
+            async for event in engine.stream(
+                "assign_variable",
+                {"var_name": "duration", "dependent_data": {"seconds": 60}},
+                env_vars={"PROTOCOL_SLEEP_TIME": "0.5"},
+            ):
+                events.append((asyncio.get_running_loop().time(), event))
+        finally:
+            await engine.close()
+
+        kinds = [event["type"] for _, event in events]
+        assert kinds[0] == "progress" and kinds[-1] == "result"
+        assert events[0][1] == {"type": "progress", "current": 1, "total": 2}
+        assert events[-1][0] - events[0][0] >= 0.4
+        messages = [
+            event["message"] for _, event in events if event["type"] == "log"
+        ]
+        assert messages == [
+            "This is debug log",
+            "Converting 60 seconds to duration: 0:01:00",
+        ]
+        result = events[-1][1]
+        assert result["dropped_events"] == 0
+        assert result["result"]["success"] is True
+        assert result["result"]["data"]["assigned_fields"]["duration"] == "PT1M"
+        assert engine.local_boxes[0].commands[-1][1] == "protocol_executor.py"
+
+    @pytest.mark.asyncio
+    async def test_stderr_tail_is_bounded_and_lines_become_events(self):
+        import airalogy_engine.engine as engine_module
+
+        async def chunks():
+            yield b'@@airalogy-event {"type":"progress","current":1}\nwarn'
+            yield b"ing: slow\n"
+            for _ in range(200):
+                yield b"x" * 1023 + b"\n"
+
+        events: list[dict] = []
+        tail = engine_module.deque()
+        await engine_module._collect_stderr_stream(chunks(), tail, events.append)
+
+        assert events[0] == {"type": "progress", "current": 1}
+        assert events[1] == {
+            "type": "log",
+            "stream": "stderr",
+            "message": "warning: slow",
+        }
+        assert len(events) == 202
+        text = "".join(tail)
+        assert engine_module._STDERR_TAIL_LIMIT <= len(text) < 80 * 1024
+        assert "warning" not in text
+
+
 class TestConcurrency:
     """Tests for async concurrency and runtime ownership."""
 
@@ -782,7 +1294,9 @@ class TestConcurrency:
         async def fake_ensure_running_box():
             return fake_box
 
-        async def fake_exec_command_with_timeout(box, command, timeout, env=None):
+        async def fake_exec_command_with_timeout(
+            box, command, timeout, env=None, stdin_data=None, on_event=None
+        ):
             nonlocal running, max_running
             running += 1
             max_running = max(max_running, running)
@@ -0,0 +1,69 @@
+"""Tests for AiralogyEngineHost, run against the LocalBoxlite runtime."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from airalogy_engine import AiralogyEngineHost, SandboxPool
+from tests.local_box import LocalBoxlite
+
+_MONOREPO_ROOT = Path(__file__).resolve().parents[4]
+_EXAMPLE_PROTOCOL = _MONOREPO_ROOT / "examples/airalogy-engine"
+
+
+def _copy_protocols(tmp_path: Path, *names: str) -> list[str]:
+    paths = []
+    for name in names:
+        shutil.copytree(_EXAMPLE_PROTOCOL, tmp_path / name)
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_the_box_that_has_the_protocol_mounted(tmp_path):
+    first, second, third = _copy_protocols(tmp_path, "first", "second", "third")
+    # LocalBoxlite mounts one protocol into every box, so the copies share code.
+    runtime = LocalBoxlite(tmp_path / "boxes", _EXAMPLE_PROTOCOL)
+    pool = SandboxPool(runtime=runtime, max_boxes=2)
+
+    async with AiralogyEngineHost(pool=pool) as host:
+        for path in (first, second, first):
+            result = await host.engine(path).assign_variable(
+                "duration", {"seconds": 60}
+            )
+            assert result["success"] is True, result
+
+        first_box, second_box = runtime.boxes
+        assert first_box.exec_count == 2
+        assert second_box.exec_count == 1
+
+        # A third protocol evicts the least recently used idle box.
+        result = await host.engine(third).parse_protocol()
+        assert result["success"] is True, result
+        assert len(runtime.boxes) == 3
+        assert second_box.running is False
+        assert first_box.running is True
+        assert host.metrics().boxes == 2
+
+    # The host leaves a pool it did not create running.
+    assert first_box.running is True
+    await pool.close()
+    assert first_box.running is False
+
+
+def test_engines_are_cached_per_protocol_in_lru_order(tmp_path):
+    first, second, third = _copy_protocols(tmp_path, "first", "second", "third")
+    host = AiralogyEngineHost(max_engines=2)
+
+    engine = host.engine(first)
+    assert host.engine(str(Path(first) / ".." / "first")) is engine
+    assert engine.pool is host.pool
+
+    host.engine(second)
+    host.engine(first)
+    host.engine(third)
+    assert host.protocols == [first, third]
+
+    with pytest.raises(ValueError, match="protocol.aimd not found"):
+        host.engine(str(tmp_path))
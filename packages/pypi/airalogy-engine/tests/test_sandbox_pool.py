@@ -0,0 +1,290 @@
+"""Tests for the shared warm sandbox pool, run against the LocalBoxlite runtime."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from airalogy_engine import (
+    AiralogyEngine,
+    AiralogyWorkflowEngine,
+    SandboxPool,
+    SandboxSpec,
+)
+from tests.local_box import LocalBoxlite
+from tests.test_workflow_engine import _write_workflow_project
+
+_MONOREPO_ROOT = Path(__file__).resolve().parents[4]
+_EXAMPLE_PROTOCOL = str(_MONOREPO_ROOT / "examples/airalogy-engine")
+_SPEC_A = SandboxSpec(image="image-a", rootfs_path=None, memory_mib=512, cpus=1)
+_SPEC_B = SandboxSpec(image="image-b", rootfs_path=None, memory_mib=512, cpus=1)
+
+
+async def _settle() -> None:
+    # Let queued acquires and background box stops run.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_leases_share_boxes_up_to_the_concurrency_cap(tmp_path):
+    runtime = LocalBoxlite(tmp_path, boot_delay=0.01)
+    pool = SandboxPool(runtime=runtime, max_boxes=2, max_concurrency_per_box=2)
+
+    try:
+        boxes = [await pool.acquire(_SPEC_A) for _ in range(4)]
+        blocked = asyncio.create_task(pool.acquire(_SPEC_A))
+        await _settle()
+
+        busy = pool.metrics()
+        assert len(runtime.boxes) == 2
+        assert {box.id for box in boxes} == {box.id for box in runtime.boxes}
+        assert (busy.leases, busy.busy_boxes, busy.waiting) == (4, 2, 1)
+        assert not blocked.done()
+
+        pool.release(boxes[0])
+        reused = await blocked
+        assert reused is boxes[0]
+        for box in [*boxes[1:], reused]:
+            pool.release(box)
+    finally:
+        await pool.close()
+
+    metrics = pool.metrics()
+    assert metrics.total_leases == 5
+    assert metrics.boxes_created == 2
+    assert metrics.boot_time_max >= 0.01
+    assert metrics.queue_wait_max > 0
+    assert 0 < metrics.utilization <= 1
+    assert metrics.boxes_stopped == 2
+    assert all(box.running is False for box in runtime.boxes)
+    assert runtime.closed is False
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order(tmp_path):
+    pool = SandboxPool(runtime=LocalBoxlite(tmp_path), max_boxes=1)
+    served: list[int] = []
+
+    async def lease(index: int) -> None:
+        async with pool.lease(_SPEC_A):
+            served.append(index)
+            await asyncio.sleep(0)
+
+    try:
+        async with pool.lease(_SPEC_A):
+            tasks = []
+            for index in range(4):
+                tasks.append(asyncio.create_task(lease(index)))
+                await _settle()
+            assert pool.metrics().waiting == 4
+        await asyncio.gather(*tasks)
+    finally:
+        await pool.close()
+
+    assert served == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_idle_boxes_expire_down_to_min_boxes(tmp_path):
+    runtime = LocalBoxlite(tmp_path)
+    pool = SandboxPool(runtime=runtime, min_boxes=1, max_boxes=3, idle_ttl=0)
+
+    try:
+        boxes = [await pool.acquire(_SPEC_A) for _ in range(3)]
+        for box in boxes:
+            pool.release(box)
+        await pool.prune()
+        await _settle()
+
+        assert pool.metrics().boxes == 1
+        assert [box.running for box in runtime.boxes].count(True) == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_boots_min_boxes_ahead_of_leases(tmp_path):
+    runtime = LocalBoxlite(tmp_path)
+    pool = SandboxPool(runtime=runtime, min_boxes=2, max_boxes=2)
+
+    try:
+        await pool.warm(_SPEC_A)
+        assert len(runtime.boxes) == 2
+
+        async with pool.lease(_SPEC_A) as box:
+            assert box in runtime.boxes
+        assert pool.metrics().boxes_created == 2
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_specs_idle_past_ttl_are_not_warmed_again(tmp_path):
+    runtime = LocalBoxlite(tmp_path)
+    pool = SandboxPool(runtime=runtime, min_boxes=1, max_boxes=2, idle_ttl=0.05)
+
+    try:
+        async with pool.lease(_SPEC_A) as box:
+            pass
+        await asyncio.sleep(0.2)
+        # The min_boxes box outlives the TTL, but once it is lost the
+        # unused spec is forgotten instead of booted again.
+        assert pool.metrics().boxes == 1
+        box.running = False
+        await asyncio.sleep(0.2)
+
+        assert pool.metrics().boxes == 0
+        assert len(runtime.boxes) == 1
+        assert _SPEC_A not in pool._specs
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_and_discarded_boxes_are_replaced(tmp_path):
+    runtime = LocalBoxlite(tmp_path)
+    pool = SandboxPool(runtime=runtime, health_check_interval=0)
+
+    try:
+        first = await pool.acquire(_SPEC_A)
+        pool.release(first)
+        first.running = False
+
+        second = await pool.acquire(_SPEC_A)
+        assert second is not first
+        pool.release(second, discard=True)
+        await _settle()
+
+        third = await pool.acquire(_SPEC_A)
+        pool.release(third)
+        assert third not in (first, second)
+        assert second.running is False
+        assert pool.metrics().unhealthy_boxes == 2
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_box_of_another_spec_is_evicted_at_capacity(tmp_path):
+    runtime = LocalBoxlite(tmp_path)
+    pool = SandboxPool(runtime=runtime, max_boxes=1)
+
+    try:
+        async with pool.lease(_SPEC_A) as box_a:
+            pass
+        async with pool.lease(_SPEC_B) as box_b:
+            await _settle()
+            assert box_a.running is False
+            assert pool.metrics().boxes == 1
+    finally:
+        await pool.close()
+
+    assert box_b is not box_a
+    assert runtime.options[0].image == "image-a"
+    assert runtime.options[1].image == "image-b"
+
+
+@pytest.mark.asyncio
+async def test_closed_pool_rejects_leases_and_fails_waiters(tmp_path):
+    pool = SandboxPool(runtime=LocalBoxlite(tmp_path), max_boxes=1)
+    box = await pool.acquire(_SPEC_A)
+    waiter = asyncio.create_task(pool.acquire(_SPEC_A))
+    await _settle()
+
+    await pool.close()
+    pool.release(box)
+    await _settle()
+
+    with pytest.raises(ValueError, match="SandboxPool is closed"):
+        await waiter
+    with pytest.raises(ValueError, match="SandboxPool is closed"):
+        await pool.acquire(_SPEC_A)
+    assert box.running is False
+
+
+def test_warm_worker_cannot_use_pool():
+    with pytest.raises(ValueError, match="warm_worker cannot be combined with pool"):
+        AiralogyEngine(_EXAMPLE_PROTOCOL, warm_worker=True, pool=SandboxPool())
+
+
+@pytest.mark.asyncio
+async def test_engines_share_pooled_boxes(tmp_path):
+    runtime = LocalBoxlite(tmp_path, _EXAMPLE_PROTOCOL)
+    pool = SandboxPool(runtime=runtime, max_boxes=1, max_concurrency_per_box=2)
+    engines = [AiralogyEngine(_EXAMPLE_PROTOCOL, pool=pool) for _ in range(3)]
+
+    try:
+        results = await asyncio.gather(
+            *(
+                engine.assign_variable("duration", {"seconds": 60})
+                for engine in engines
+            )
+        )
+        for engine in engines:
+            await engine.close()
+
+        assert [result["success"] for result in results] == [True, True, True]
+        assert len(runtime.boxes) == 1
+        assert runtime.boxes[0].running is True
+        assert runtime.boxes[0].exec_count == 3
+        assert pool.metrics().total_leases == 3
+    finally:
+        await pool.close()
+
+    assert runtime.boxes[0].running is False
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_leases_from_pool(tmp_path):
+    (tmp_path / "project").mkdir()
+    workflow_path = _write_workflow_project(
+        tmp_path / "project",
+        """
+version: airalogy.workflow.v1
+id: pooled_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: double
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:double
+transitions:
+  - id: prepare_target
+    from: source
+    to: target
+    run: double
+    inputs:
+      value: ${source.var.value}
+    assign:
+      target:
+        var.value: ${prepare_target.outputs.value}
+""",
+        """
+def double(value):
+    return {"value": value * 2}
+""",
+    )
+    runtime = LocalBoxlite(
+        tmp_path / "boxes",
+        workflow_path.parent,
+        mount_name="workflow",
+        env={"AIRALOGY_WORKFLOW_DIR": "workflow"},
+    )
+    pool = SandboxPool(runtime=runtime)
+
+    try:
+        for _ in range(2):
+            engine = AiralogyWorkflowEngine(str(workflow_path), pool=pool)
+            result = await engine.run({"source": {"data": {"var": {"value": 21}}}})
+            await engine.close()
+            assert result["success"] is True, result
+            assert result["data"]["records"]["target"]["data"]["var"]["value"] == 42
+    finally:
+        await pool.close()
+
+    assert len(runtime.boxes) == 1
+    assert runtime.boxes[0].exec_count == 2
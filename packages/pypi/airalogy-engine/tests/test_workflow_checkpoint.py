@@ -0,0 +1,306 @@
+"""Tests for checkpointed and resumable workflow runs."""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from airalogy_engine import AiralogyWorkflowEngine, SQLiteCheckpointStore
+from tests.test_workflow_engine import _write_workflow_project
+
+_CHAIN_WORKFLOW = """
+version: airalogy.workflow.v1
+id: chain_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: middle
+    protocol: ./protocols/middle/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: double
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:double
+  - id: finish
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:finish
+transitions:
+  - id: to_middle
+    from: source
+    to: middle
+    run: double
+    inputs:
+      value: ${source.var.value}
+    assign:
+      middle:
+        var.value: ${to_middle.outputs.value}
+  - id: to_target
+    from: middle
+    to: target
+    run: finish
+    inputs:
+      value: ${middle.var.value}
+    assign:
+      target:
+        var.value: ${to_target.outputs.value}
+"""
+
+_CHAIN_ASSIGNERS = """
+import json
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+
+def _log(name):
+    with open(ROOT / "calls.log", "a", encoding="utf-8") as log:
+        log.write(name + "\\n")
+
+
+def double(value):
+    _log("double")
+    return {"value": value * 2}
+
+
+def finish(value):
+    _log("finish")
+    if (ROOT / "fail").exists():
+        raise RuntimeError("target unavailable")
+    return {"value": value + 1}
+"""
+
+
+def _calls(workflow_path: Path) -> list[str]:
+    log = workflow_path.parent / "assigners" / "calls.log"
+    return log.read_text(encoding="utf-8").split() if log.exists() else []
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_transitions(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(tmp_path, _CHAIN_WORKFLOW, _CHAIN_ASSIGNERS)
+    fail_flag = tmp_path / "assigners" / "fail"
+    fail_flag.touch()
+    store = SQLiteCheckpointStore(tmp_path / "checkpoints.sqlite")
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path), assigner_runtime="local", checkpoint_store=store
+    )
+
+    failed = await engine.run({"source": {"data": {"var": {"value": 5}}}})
+    assert failed["success"] is False
+    assert "target unavailable" in failed["message"]
+    run_id = failed["data"]["run_id"]
+    assert store.run_ids(status="failed") == [run_id]
+
+    fail_flag.unlink()
+    # A new engine and store connection, as after a process restart.
+    store.close()
+    store = SQLiteCheckpointStore(tmp_path / "checkpoints.sqlite")
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path), assigner_runtime="local", checkpoint_store=store
+    )
+    resumed = await engine.resume(run_id)
+
+    assert resumed["success"] is True, resumed
+    data = resumed["data"]
+    assert data["run_id"] == run_id
+    assert data["records"]["target"]["data"]["var"]["value"] == 11
+    assert [item["id"] for item in data["executed_transitions"]] == [
+        "to_middle",
+        "to_target",
+    ]
+    assert [attempt["status"] for attempt in data["attempts"]] == [
+        "succeeded",
+        "failed",
+        "succeeded",
+    ]
+    assert _calls(workflow_path) == ["double", "finish", "finish"]
+
+    again = await engine.resume(run_id)
+    assert again["data"]["records"] == data["records"]
+    assert _calls(workflow_path) == ["double", "finish", "finish"]
+    assert store.load(run_id)["status"] == "succeeded"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_memoized_assigners_reuse_outputs_for_identical_inputs(
+    tmp_path: Path,
+) -> None:
+    workflow_path = _write_workflow_project(tmp_path, _CHAIN_WORKFLOW, _CHAIN_ASSIGNERS)
+    store = SQLiteCheckpointStore(":memory:")
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path),
+        assigner_runtime="local",
+        checkpoint_store=store,
+        memoize_assigners=True,
+    )
+
+    first = await engine.run({"source": {"data": {"var": {"value": 5}}}})
+    second = await engine.run({"source": {"data": {"var": {"value": 5}}}})
+    third = await engine.run({"source": {"data": {"var": {"value": 6}}}})
+
+    assert first["data"]["run_id"] != second["data"]["run_id"]
+    assert first["data"]["records"] == second["data"]["records"]
+    assert third["data"]["records"]["target"]["data"]["var"]["value"] == 13
+    assert _calls(workflow_path) == ["double", "finish", "double", "finish"]
+
+
+@pytest.mark.asyncio
+async def test_resume_rejects_unknown_runs(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(tmp_path, _CHAIN_WORKFLOW, _CHAIN_ASSIGNERS)
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path),
+        assigner_runtime="local",
+        checkpoint_store=SQLiteCheckpointStore(":memory:"),
+    )
+
+    result = await engine.resume("missing")
+
+    assert result == {"success": False, "message": "workflow run not found: missing"}
+    with pytest.raises(ValueError, match="memoize_assigners requires"):
+        AiralogyWorkflowEngine(str(workflow_path), memoize_assigners=True)
+
+
+_TYPED_ASSIGNERS = """
+import datetime
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+
+def double(value):
+    with open(ROOT / "calls.log", "a", encoding="utf-8") as log:
+        log.write("double\\n")
+    if (ROOT / "fraction").exists():
+        return {"value": Fraction(1, 3)}
+    return {
+        "value": {
+            "measured_at": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "day": datetime.date(2026, 1, 2),
+            "amount": Decimal("1.50"),
+            "tags": {"a", "b"},
+            "shape": (2, 3),
+            "wells": {1: "A1", 2: "A2"},
+            "raw": b"\\x00\\xff",
+        }
+    }
+
+
+def finish(value):
+    return {"value": [value["amount"] * 2, value["shape"]]}
+"""
+
+
+@pytest.mark.asyncio
+async def test_memoized_and_resumed_outputs_keep_their_types(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(tmp_path, _CHAIN_WORKFLOW, _TYPED_ASSIGNERS)
+    records = {"source": {"data": {"var": {"value": 5}}}}
+    fresh = await AiralogyWorkflowEngine(
+        str(workflow_path), assigner_runtime="local"
+    ).run(records)
+    store = SQLiteCheckpointStore(":memory:")
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path),
+        assigner_runtime="local",
+        checkpoint_store=store,
+        memoize_assigners=True,
+    )
+
+    first = await engine.run(records)
+    memoized = await engine.run(records)
+
+    assert fresh["success"] is True, fresh
+    assert _calls(workflow_path) == ["double", "double"]
+    for result in (first, memoized):
+        for key in ("records", "transition_outputs"):
+            assert result["data"][key] == fresh["data"][key]
+    value = memoized["data"]["records"]["middle"]["data"]["var"]["value"]
+    assert type(value["tags"]) is set
+    assert type(value["shape"]) is tuple
+    assert memoized["data"]["records"]["target"]["data"]["var"]["value"] == [
+        Decimal("3.00"),
+        (2, 3),
+    ]
+    stored = store.load(memoized["data"]["run_id"])
+    assert stored["state"]["records"] == fresh["data"]["records"]
+    assert stored["state"]["transition_outputs"] == fresh["data"]["transition_outputs"]
+
+
+class _StrictStore(SQLiteCheckpointStore):
+    def save(self, run_id, checkpoint):
+        json.dumps(checkpoint)
+        super().save(run_id, checkpoint)
+
+
+@pytest.mark.asyncio
+async def test_outputs_that_cannot_be_stored_losslessly_are_refused(
+    tmp_path: Path,
+) -> None:
+    workflow_path = _write_workflow_project(tmp_path, _CHAIN_WORKFLOW, _TYPED_ASSIGNERS)
+    (tmp_path / "assigners" / "fraction").touch()
+    engine = AiralogyWorkflowEngine(
+        str(workflow_path),
+        assigner_runtime="local",
+        checkpoint_store=SQLiteCheckpointStore(":memory:"),
+        memoize_assigners=True,
+    )
+
+    for _ in range(2):
+        failed = await engine.run({"source": {"data": {"var": {"value": 5}}}})
+        assert failed["success"] is False
+        assert failed["message"].startswith("failed to save checkpoint of workflow run")
+        assert "Fraction values cannot be stored losslessly" in failed["message"]
+        assert failed["data"]["run_id"]
+    # Outputs that would not round-trip are not memoized either.
+    assert _calls(workflow_path) == ["double", "double"]
+
+    strict = AiralogyWorkflowEngine(
+        str(workflow_path),
+        assigner_runtime="local",
+        checkpoint_store=_StrictStore(":memory:"),
+    )
+    (tmp_path / "assigners" / "fraction").unlink()
+    failed = await strict.run({"source": {"data": {"var": {"value": 5}}}})
+    assert failed["success"] is False
+    assert failed["message"].startswith("failed to save checkpoint of workflow run")
+
+
+def test_checkpoint_saves_store_only_changes(tmp_path: Path) -> None:
+    store = SQLiteCheckpointStore(tmp_path / "checkpoints.sqlite")
+    rows = [{"well": index, "value": index / 3} for index in range(5000)]
+    records = {"plate": {"data": {"var": {"rows": rows, "step": 0}}}}
+    state = {"records": records, "transition_outputs": {}, "attempts": []}
+    checkpoint = {"workflow_id": "w", "status": "running", "state": state}
+    store.save("run", checkpoint)
+
+    for step in range(1, 4):
+        # Copy-on-write, as the engine does: only the assigned path is new.
+        plate = records["plate"]
+        records = {
+            **records,
+            "plate": {
+                **plate,
+                "data": {"var": {**plate["data"]["var"], "step": step}},
+            },
+        }
+        state["attempts"].append({"transition": f"t{step}", "status": "succeeded"})
+        state = {**state, "records": records, "transition_outputs": {f"t{step}": step}}
+        checkpoint["state"] = state
+        store.save("run", checkpoint)
+
+    changes = store._connection.execute(
+        "SELECT changes FROM workflow_checkpoint_changes ORDER BY seq"
+    ).fetchall()
+    assert len(changes) == 4
+    assert all(len(payload) < 300 for (payload,) in changes[1:])
+
+    reopened = SQLiteCheckpointStore(tmp_path / "checkpoints.sqlite")
+    loaded = reopened.load("run")
+    assert loaded == {"workflow_id": "w", "status": "running", "state": state}
+    reopened.close()
+    store.close()
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
+import sys
 import tempfile
 from copy import deepcopy
 from pathlib import Path
 
 import pytest
 
-from airalogy_engine import AiralogyWorkflowEngine
+from airalogy_engine import AiralogyWorkflowEngine, SandboxPool
+from tests.local_box import LocalBoxlite
 
 
 def _write_workflow_project(tmp_path: Path, workflow_body: str, assigner_code: str) -> Path:
@@ -123,6 +126,110 @@ transitions:
     assert records == original
 
 
+@pytest.mark.asyncio
+async def test_assignments_copy_only_the_written_record_paths(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path,
+        """
+version: airalogy.workflow.v1
+id: copy_on_write_workflow
+nodes:
+  - id: prep
+    protocol: ./protocols/prep/protocol.aimd
+  - id: measurement
+    protocol: ./protocols/measurement/protocol.aimd
+transitions:
+  - id: update_measurement
+    from: prep
+    to: measurement
+    assign:
+      measurement:
+        var.sample.id: ${prep.var.sample_id}
+        var.sample.batch: B-7
+""",
+        "def unused():\n    return {}\n",
+    )
+    rows = [{"well": index} for index in range(3)]
+    records = {
+        "prep": {"data": {"var": {"sample_id": "S-001"}}},
+        "measurement": {
+            "data": {"var": {"sample": {"id": "old"}, "rows": rows}},
+            "metadata": {"operator": "A"},
+        },
+    }
+    original = deepcopy(records)
+
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    result = await engine.run(records)
+
+    assert result["success"] is True, result
+    measurement = result["data"]["records"]["measurement"]
+    assert measurement["data"]["var"]["sample"] == {"id": "S-001", "batch": "B-7"}
+    assert records == original
+
+    measurement["data"]["var"]["rows"].append({"well": 99})
+    measurement["metadata"]["operator"] = "B"
+    result["data"]["records"]["prep"]["data"]["var"]["sample_id"] = "S-002"
+    assert records == original
+    assert rows == [{"well": index} for index in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_run_transition_results_share_no_objects(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path,
+        """
+version: airalogy.workflow.v1
+id: detached_result_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: collect
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:collect
+transitions:
+  - id: to_target
+    from: source
+    to: target
+    run: collect
+    inputs:
+      values: ${source.var.values}
+    assign:
+      target:
+        var.values: ${to_target.outputs.values}
+""",
+        """
+def collect(values):
+    return {"values": list(values)}
+""",
+    )
+    records = {"source": {"data": {"var": {"values": [1, 2]}}}}
+    transition_outputs = {"earlier": {"items": ["a"]}}
+    original_records = deepcopy(records)
+    original_outputs = deepcopy(transition_outputs)
+
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    result = await engine.run_transition(
+        "to_target", records, transition_outputs=transition_outputs
+    )
+
+    assert result["success"] is True, result
+    data = result["data"]
+    data["records"]["target"]["data"]["var"]["values"].append(3)
+    data["records"]["source"]["data"]["var"]["values"].append(3)
+    data["transition_outputs"]["earlier"]["items"].append("b")
+    data["attempts"][0]["outputs"]["values"].append(4)
+    data["workflow"]["transitions"].clear()
+
+    assert records == original_records
+    assert transition_outputs == original_outputs
+    assert data["transition_outputs"]["to_target"] == {"values": [1, 2]}
+    assert engine.workflow["transitions"]
+
+
 @pytest.mark.asyncio
 async def test_when_false_skips_transition(tmp_path: Path) -> None:
     workflow_path = _write_workflow_project(
@@ -261,6 +368,146 @@ def produce():
     assert result["data"]["attempts"][0]["status"] == "succeeded"
 
 
+@pytest.mark.asyncio
+async def test_local_assigner_modules_are_cached_until_the_file_changes(
+    tmp_path: Path,
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path,
+        """
+version: airalogy.workflow.v1
+id: cached_assigner_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: count
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:count
+transitions:
+  - id: count_loads
+    from: source
+    to: target
+    run: count
+    assign:
+      target:
+        var.calls: ${count_loads.outputs.calls}
+        var.label: ${count_loads.outputs.label}
+""",
+        """
+import cached_assigner_helper
+
+CALLS = []
+
+
+def count():
+    CALLS.append(1)
+    return {"calls": len(CALLS), "label": cached_assigner_helper.LABEL}
+""",
+    )
+    assigner_file = tmp_path / "assigners" / "workflow_assigners.py"
+    (assigner_file.parent / "cached_assigner_helper.py").write_text(
+        "LABEL = 'sibling'\n", encoding="utf-8"
+    )
+    sys_path = list(sys.path)
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+
+    results = [await engine.run({"source": {}}) for _ in range(3)]
+    assigner_file.write_text(
+        assigner_file.read_text(encoding="utf-8").replace("CALLS = []", "CALLS = [0]"),
+        encoding="utf-8",
+    )
+    results.append(await engine.run({"source": {}}))
+
+    target_vars = [
+        result["data"]["records"]["target"]["data"]["var"] for result in results
+    ]
+    assert [var["calls"] for var in target_vars] == [1, 2, 3, 2]
+    assert {var["label"] for var in target_vars} == {"sibling"}
+    assert sys.path == sys_path
+    assert len(engine._assigner_modules) == 1
+
+
+@pytest.mark.parametrize(
+    ("when", "note", "message"),
+    [
+        ("${source.var.ready} ~= true", "ok", "Unsupported workflow condition"),
+        ("${source} == true", "ok", "Invalid workflow reference: ${source}"),
+        (None, "${source.var.1id}", "Invalid workflow reference"),
+    ],
+)
+def test_malformed_expressions_fail_when_the_workflow_loads(
+    tmp_path: Path, when: str | None, note: str, message: str
+) -> None:
+    when_line = f"    when: {when}\n" if when else ""
+    workflow_path = _write_workflow_project(
+        tmp_path,
+        f"""
+version: airalogy.workflow.v1
+id: malformed_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+transitions:
+  - id: prepare_target
+    from: source
+    to: target
+{when_line}    assign:
+      target:
+        var.note: "{note}"
+""",
+        "def unused():\n    return {}\n",
+    )
+
+    with pytest.raises(ValueError, match="Invalid workflow transition prepare_target") as exc:
+        AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    assert message in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_non_reference_placeholders_stay_literal_text(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path,
+        """
+version: airalogy.workflow.v1
+id: literal_placeholder_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+transitions:
+  - id: prepare_target
+    from: source
+    to: target
+    when: ${source.var.ready} == ${HOME}
+    assign:
+      target:
+        var.home: "${HOME}"
+        var.price: "cost ${price} USD for ${source.var.name}"
+        var.odd: "sample ${source.var.1id}"
+""",
+        "def unused():\n    return {}\n",
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+
+    result = await engine.run(
+        {"source": {"data": {"var": {"ready": "${HOME}", "name": "alpha"}}}}
+    )
+
+    assert result["success"] is True, result["message"]
+    assert result["data"]["records"]["target"]["data"]["var"] == {
+        "home": "${HOME}",
+        "price": "cost ${price} USD for alpha",
+        "odd": "sample ${source.var.1id}",
+    }
+    assert engine.resolve_value("${HOME}", {}, {}) == "${HOME}"
+
+
 @pytest.mark.asyncio
 async def test_sandbox_runtime_executes_assigner(
     tmp_path: Path,
@@ -310,3 +557,532 @@ def double(value):
 
     assert result["success"] is True, result
     assert result["data"]["records"]["target"]["data"]["var"]["value"] == 42
+
+
+@pytest.mark.asyncio
+async def test_sandbox_assigner_receives_large_inputs_on_stdin(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    workflow_path = _write_workflow_project(
+        project,
+        """
+version: airalogy.workflow.v1
+id: large_input_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: measure
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:measure
+transitions:
+  - id: prepare_target
+    from: source
+    to: target
+    run: measure
+    inputs:
+      text: ${source.var.text}
+    assign:
+      target:
+        var.length: ${prepare_target.outputs.length}
+""",
+        """
+def measure(text):
+    return {"length": len(text)}
+""",
+    )
+    runtime = LocalBoxlite(
+        tmp_path / "boxes",
+        project,
+        mount_name="workflow",
+        env={"AIRALOGY_WORKFLOW_DIR": "workflow"},
+    )
+    text = "实验" * (512 * 1024)
+
+    async with SandboxPool(runtime=runtime) as pool:
+        engine = AiralogyWorkflowEngine(str(workflow_path), pool=pool)
+        result = await engine.run({"source": {"data": {"var": {"text": text}}}})
+
+    assert result["success"] is True, result
+    assert result["data"]["records"]["target"]["data"]["var"]["length"] == len(text)
+    assert runtime.boxes[0].commands[-1][-1] == "-"
+
+
+_DIAMOND_WORKFLOW = """
+version: airalogy.workflow.v1
+id: diamond_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: left
+    protocol: ./protocols/left/protocol.aimd
+  - id: right
+    protocol: ./protocols/right/protocol.aimd
+  - id: joined
+    protocol: ./protocols/joined/protocol.aimd
+assigners:
+  - id: slow_double
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:slow_double
+  - id: add
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:add
+transitions:
+  - id: to_left
+    from: source
+    to: left
+    run: slow_double
+    inputs:
+      value: ${source.var.value}
+    assign:
+      left:
+        var.value: ${to_left.outputs.value}
+  - id: to_right
+    from: source
+    to: right
+    run: slow_double
+    max_iterations: 1
+    inputs:
+      value: ${source.var.offset}
+    assign:
+      right:
+        var.value: ${to_right.outputs.value}
+  - id: join
+    from:
+      - left
+      - right
+    to: joined
+    run: add
+    when: ${left.var.value} > 0
+    inputs:
+      left: ${left.var.value}
+      right: ${to_right.outputs.value}
+    assign:
+      joined:
+        var.total: ${join.outputs.total}
+"""
+
+_DIAMOND_ASSIGNERS = """
+import asyncio
+
+
+async def slow_double(value):
+    await asyncio.sleep(0.3)
+    if value < 0:
+        raise ValueError("negative value")
+    return {"value": value * 2}
+
+
+def add(left, right):
+    return {"total": left + right}
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_passes", [1, 2])
+async def test_dag_scheduler_matches_sequential_results(
+    tmp_path: Path,
+    max_passes: int,
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    records = {"source": {"data": {"var": {"value": 1, "offset": 10}}}}
+
+    sequential = await engine.run(records, max_passes=max_passes)
+    dag = await engine.run(records, max_passes=max_passes, scheduler="dag")
+
+    assert dag == sequential
+    assert dag["data"]["records"]["joined"]["data"]["var"]["total"] == 22
+    if max_passes == 2:
+        assert dag["data"]["skipped_transitions"] == [
+            {"id": "to_right", "reason": "max_iterations"}
+        ]
+        assert dag["data"]["node_iterations"] == {"left": 2, "right": 1, "joined": 2}
+
+
+@pytest.mark.asyncio
+async def test_dag_scheduler_runs_independent_transitions_concurrently(
+    tmp_path: Path,
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    records = {"source": {"data": {"var": {"value": 1, "offset": 10}}}}
+
+    started = asyncio.get_running_loop().time()
+    result = await engine.run(records, scheduler="dag")
+    concurrent_elapsed = asyncio.get_running_loop().time() - started
+
+    started = asyncio.get_running_loop().time()
+    await engine.run(records, scheduler="dag", max_concurrency=1)
+    serial_elapsed = asyncio.get_running_loop().time() - started
+
+    assert result["success"] is True, result
+    assert concurrent_elapsed < 0.55
+    assert serial_elapsed >= 0.6
+    assert [attempt["transition"] for attempt in result["data"]["attempts"]] == [
+        "to_left",
+        "to_right",
+        "join",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dag_scheduler_stops_after_failed_transition(tmp_path: Path) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    records = {"source": {"data": {"var": {"value": 1, "offset": -1}}}}
+
+    result = await engine.run(records, scheduler="dag")
+
+    assert result["success"] is False
+    assert result["message"] == "negative value"
+    data = result["data"]
+    assert [
+        (attempt["transition"], attempt["status"]) for attempt in data["attempts"]
+    ] == [("to_left", "succeeded"), ("to_right", "failed")]
+    assert [transition["id"] for transition in data["executed_transitions"]] == [
+        "to_left"
+    ]
+    assert data["records"]["left"]["data"]["var"]["value"] == 2
+    assert "joined" not in data["records"]
+
+
+_BRANCHES_WORKFLOW = """
+version: airalogy.workflow.v1
+id: failing_branch_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: first
+    protocol: ./protocols/first/protocol.aimd
+  - id: second
+    protocol: ./protocols/second/protocol.aimd
+assigners:
+  - id: fail_after
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:fail_after
+  - id: succeed_after
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:succeed_after
+transitions:
+  - id: to_first
+    from: source
+    to: first
+    run: fail_after
+    inputs:
+      delay: ${source.var.fail_delay}
+  - id: to_second
+    from: source
+    to: second
+    run: succeed_after
+    inputs:
+      delay: ${source.var.succeed_delay}
+    assign:
+      second:
+        var.value: ${to_second.outputs.value}
+"""
+
+_BRANCHES_ASSIGNERS = """
+import asyncio
+
+
+async def fail_after(delay):
+    await asyncio.sleep(delay)
+    raise RuntimeError("first branch failed")
+
+
+async def succeed_after(delay):
+    await asyncio.sleep(delay)
+    return {"value": "second"}
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("fail_delay", "succeed_delay"), [(0.0, 0.2), (0.2, 0.0)]
+)
+async def test_dag_failure_discards_later_independent_branches(
+    tmp_path: Path, fail_delay: float, succeed_delay: float
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _BRANCHES_WORKFLOW, _BRANCHES_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path), assigner_runtime="local")
+    records = {
+        "source": {
+            "data": {"var": {"fail_delay": fail_delay, "succeed_delay": succeed_delay}}
+        }
+    }
+
+    sequential = await engine.run(records)
+    dag = await engine.run(records, scheduler="dag")
+
+    assert dag["success"] is False
+    assert dag["message"] == sequential["message"] == "first branch failed"
+    for key in ("records", "transition_outputs", "executed_transitions", "attempts"):
+        assert dag["data"][key] == sequential["data"][key], key
+    assert "second" not in dag["data"]["records"]
+    assert [attempt["transition"] for attempt in dag["data"]["attempts"]] == [
+        "to_first"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dag_ready_transitions_share_one_sandbox_process(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    workflow_path = _write_workflow_project(
+        project, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    runtime = LocalBoxlite(
+        tmp_path / "boxes",
+        project,
+        mount_name="workflow",
+        env={"AIRALOGY_WORKFLOW_DIR": "workflow"},
+    )
+
+    async with SandboxPool(runtime=runtime) as pool:
+        engine = AiralogyWorkflowEngine(str(workflow_path), pool=pool)
+        result = await engine.run(
+            {"source": {"data": {"var": {"value": 3, "offset": 4}}}}, scheduler="dag"
+        )
+
+    assert result["success"] is True, result
+    assert result["data"]["records"]["joined"]["data"]["var"]["total"] == 14
+    # to_left and to_right run in one batch, join in a second process.
+    assert runtime.boxes[0].exec_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_assigners_isolate_failures_and_timeouts(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    workflow_path = _write_workflow_project(
+        project,
+        """
+version: airalogy.workflow.v1
+id: batch_isolation_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: ok
+    protocol: ./protocols/ok/protocol.aimd
+  - id: broken
+    protocol: ./protocols/broken/protocol.aimd
+  - id: stuck
+    protocol: ./protocols/stuck/protocol.aimd
+assigners:
+  - id: succeed
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:succeed
+  - id: fail
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:fail
+  - id: hang
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:hang
+transitions:
+  - id: to_ok
+    from: source
+    to: ok
+    run: succeed
+    assign:
+      ok:
+        var.value: ${to_ok.outputs.value}
+  - id: to_stuck
+    from: source
+    to: stuck
+    run: hang
+  - id: to_broken
+    from: source
+    to: broken
+    run: fail
+""",
+        """
+import time
+
+
+def succeed():
+    print("succeeding")
+    return {"value": "done"}
+
+
+def fail():
+    raise RuntimeError("assigner exploded")
+
+
+def hang():
+    for _ in range(600):
+        print("still waiting", flush=True)
+        time.sleep(0.05)
+    return {}
+""",
+    )
+    runtime = LocalBoxlite(
+        tmp_path / "boxes",
+        project,
+        mount_name="workflow",
+        env={"AIRALOGY_WORKFLOW_DIR": "workflow"},
+    )
+
+    async with SandboxPool(runtime=runtime) as pool:
+        engine = AiralogyWorkflowEngine(str(workflow_path), pool=pool)
+        result = await engine.run({"source": {}}, scheduler="dag", timeout=1)
+
+    # to_broken fails first, but to_stuck is declared before it and fails on
+    # its own timeout; the run reports the first failure in declaration order.
+    assert result["success"] is False
+    assert "timed out after 1 seconds" in result["message"]
+    assert "assigner exploded" not in result["message"]
+    assert [
+        (attempt["transition"], attempt["status"])
+        for attempt in result["data"]["attempts"]
+    ] == [("to_ok", "succeeded"), ("to_stuck", "failed")]
+    assert result["data"]["records"]["ok"]["data"]["var"]["value"] == "done"
+    assert runtime.boxes[0].exec_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_assigners_fail_when_executor_drops_results(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path))
+    batch_sizes = []
+
+    async def exec_sandbox_assigners(calls, **_options):
+        batch_sizes.append(len(calls))
+        return [{"value": 0}]
+
+    monkeypatch.setattr(engine, "_exec_sandbox_assigners", exec_sandbox_assigners)
+
+    result = await asyncio.wait_for(
+        engine.run(
+            {"source": {"data": {"var": {"value": 3, "offset": 4}}}}, scheduler="dag"
+        ),
+        timeout=5,
+    )
+
+    assert batch_sizes == [2]
+    assert result["success"] is False
+    assert "returned 1 results for 2 assigner calls" in result["message"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_assigner_batch_releases_waiting_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workflow_path = _write_workflow_project(
+        tmp_path, _DIAMOND_WORKFLOW, _DIAMOND_ASSIGNERS
+    )
+    engine = AiralogyWorkflowEngine(str(workflow_path))
+    started = asyncio.Event()
+
+    async def exec_sandbox_assigners(calls, **_options):
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(engine, "_exec_sandbox_assigners", exec_sandbox_assigners)
+    run = asyncio.create_task(
+        engine.run(
+            {"source": {"data": {"var": {"value": 3, "offset": 4}}}}, scheduler="dag"
+        )
+    )
+    await asyncio.wait_for(started.wait(), timeout=5)
+    for task in list(engine._batch_tasks):
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(run, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_transition_and_assigner_events(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    workflow_path = _write_workflow_project(
+        project,
+        """
+version: airalogy.workflow.v1
+id: streamed_workflow
+nodes:
+  - id: source
+    protocol: ./protocols/source/protocol.aimd
+  - id: target
+    protocol: ./protocols/target/protocol.aimd
+assigners:
+  - id: double
+    runtime: python
+    entrypoint: ./assigners/workflow_assigners.py:double
+transitions:
+  - id: prepare_target
+    from: source
+    to: target
+    run: double
+    inputs:
+      value: ${source.var.value}
+    assign:
+      target:
+        var.value: ${prepare_target.outputs.value}
+  - id: never
+    from: source
+    to: target
+    when: ${source.var.value} < 0
+    assign:
+      target:
+        var.value: 0
+""",
+        """
+def double(value):
+    print('@@airalogy-progress {"message": "doubling"}')
+    print("doubled", value)
+    return {"value": value * 2}
+""",
+    )
+    runtime = LocalBoxlite(
+        tmp_path / "boxes",
+        project,
+        mount_name="workflow",
+        env={"AIRALOGY_WORKFLOW_DIR": "workflow"},
+    )
+
+    async with SandboxPool(runtime=runtime) as pool:
+        engine = AiralogyWorkflowEngine(str(workflow_path), pool=pool)
+        events = [
+            event
+            async for event in engine.stream(
+                {"source": {"data": {"var": {"value": 21}}}}
+            )
+        ]
+
+    result = events.pop()
+    assert result["type"] == "result"
+    assert result["result"]["success"] is True, result
+    assert result["result"]["data"]["records"]["target"]["data"]["var"]["value"] == 42
+    assert events == [
+        {"type": "transition_started", "transition": "prepare_target"},
+        {"type": "progress", "message": "doubling", "transition": "prepare_target"},
+        {
+            "type": "log",
+            "stream": "stdout",
+            "message": "doubled 21",
+            "transition": "prepare_target",
+        },
+        {
+            "type": "transition_finished",
+            "transition": "prepare_target",
+            "status": "executed",
+        },
+        {"type": "transition_started", "transition": "never"},
+        {"type": "transition_finished", "transition": "never", "status": "skipped"},
+    ]
@@ -0,0 +1,78 @@
+"""
+Benchmark AIMD parsing on large synthetic protocols.
+
+Parse time should grow linearly with document size. Run from
+``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_aimd_parse.py
+    uv run python benchmarks/bench_aimd_parse.py --sizes-mb 1 10
+"""
+
+import argparse
+import time
+
+from airalogy.markdown import AimdParser
+
+SECTION_TEMPLATE = """## Section {index}
+
+Sample name: {{{{var|sample_{index}: str}}}}, volume {{{{var|volume_{index}: float = 1.5}}}}
+and inline code `{{{{var|ignored_{index}}}}}` that must be skipped.
+
+{{{{step|step_{index}}}}} Mix the reagents and check {{{{check|check_{index}}}}}.
+See {{{{ref_var|sample_{index}}}}}.
+
+```python
+# {{{{var|not_a_var_{index}}}}}
+for value in range({index}):
+    print(value)
+```
+
+"""
+
+
+def build_document(target_bytes: int) -> str:
+    sections = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        section = SECTION_TEMPLATE.format(index=index)
+        sections.append(section)
+        size += len(section)
+        index += 1
+    return "".join(sections)
+
+
+def bench(size_mb: float) -> tuple[int, float]:
+    content = build_document(int(size_mb * 1024 * 1024))
+    started = time.perf_counter()
+    result = AimdParser(content).parse()
+    elapsed = time.perf_counter() - started
+    return len(result["templates"]["var"]), elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="+",
+        default=[1, 10],
+        help="Synthetic document sizes in MiB",
+    )
+    args = arg_parser.parse_args()
+
+    baseline = None
+    for size_mb in args.sizes_mb:
+        var_count, elapsed = bench(size_mb)
+        per_mb = elapsed / size_mb
+        if baseline is None:
+            baseline = per_mb
+        print(
+            f"{size_mb:>6.1f} MiB  vars={var_count:>7}  "
+            f"parse={elapsed:8.3f}s  per MiB={per_mb:.3f}s  "
+            f"scaling={per_mb / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
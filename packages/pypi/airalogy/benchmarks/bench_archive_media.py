@@ -0,0 +1,117 @@
+"""
+Benchmark packing a media-heavy records archive with and without store-only members.
+
+Writes ``--media-mib`` MiB of already-compressed payloads (random bytes named
+``.jpg``, ``.png``, ``.mp4`` and ``.pdf``) and ``--csv-mib`` MiB of CSV
+exports, then packs them with ``pack_records_archive``. The default policy
+stores the media files as-is and deflates the rest; ``--compare`` also times
+the previous behaviour of deflating every member. Run from
+``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_archive_media.py
+    uv run python benchmarks/bench_archive_media.py --media-mib 1024 --compare
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from airalogy import archive
+
+_MEDIA_SUFFIXES = (".jpg", ".png", ".mp4", ".pdf")
+
+
+def _write_payloads(root: Path, media_mib: int, csv_mib: int) -> list[dict]:
+    payloads = []
+    media_size = 8 * 1024 * 1024
+    for index in range(max(1, media_mib * 1024 * 1024 // media_size)):
+        path = root / f"media-{index:03d}{_MEDIA_SUFFIXES[index % len(_MEDIA_SUFFIXES)]}"
+        with path.open("wb") as handle:
+            for _ in range(media_size // (1024 * 1024)):
+                handle.write(os.urandom(1024 * 1024))
+        payloads.append(path)
+
+    rng = random.Random(0)
+    rows = "".join(
+        f"{index},{rng.random():.6f},{rng.randint(0, 4095)}\n" for index in range(20000)
+    ).encode()
+    csv_path = root / "export.csv"
+    with csv_path.open("wb") as handle:
+        for _ in range(max(1, csv_mib * 1024 * 1024 // len(rows))):
+            handle.write(rows)
+    payloads.append(csv_path)
+    return [
+        {
+            "path": str(path),
+            "file_id": f"airalogy.id.file.{path.name}",
+            "record_id": "bench-record",
+        }
+        for path in payloads
+    ]
+
+
+def _pack(records_file: Path, output: Path, payloads: list[dict], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        archive.pack_records_archive(
+            [records_file], output, file_payloads=payloads, force=True
+        )
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench(media_mib: int, csv_mib: int, runs: int, compare: bool) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        root_path = Path(root)
+        records_file = root_path / "records.json"
+        records_file.write_text(
+            json.dumps(
+                {
+                    "record_id": "bench-record",
+                    "metadata": {"protocol_id": "bench_protocol"},
+                    "data": {"var": {}},
+                }
+            )
+        )
+        payloads = _write_payloads(root_path, media_mib, csv_mib)
+        output = root_path / "records.aira"
+        total_mib = media_mib + csv_mib
+
+        results = [("store media", _pack(records_file, output, payloads, runs))]
+        sizes = [output.stat().st_size]
+        if compare:
+            # Every member deflated, as before store-only members existed.
+            with mock.patch.object(
+                archive,
+                "_member_compress_type",
+                lambda source, compress_type, **_hints: compress_type,
+            ):
+                results.append(("deflate all", _pack(records_file, output, payloads, runs)))
+            sizes.append(output.stat().st_size)
+
+    for (label, best), size in zip(results, sizes):
+        print(
+            f"{label:<12} media={media_mib} MiB csv={csv_mib} MiB  "
+            f"best={best:6.2f} s  throughput={total_mib / best:7.1f} MiB/s  "
+            f"archive={size / 1024**2:.0f} MiB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--media-mib", type=int, default=512)
+    parser.add_argument("--csv-mib", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--compare", action="store_true")
+    args = parser.parse_args()
+    bench(args.media_mib, args.csv_mib, args.runs, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark packing and validating a records archive with large file payloads.
+
+Writes ``--blobs`` synthetic instrument files totalling ``--total-gib`` GiB,
+then packs them with ``pack_records_archive`` and checks the result with
+``validate_archive`` in a child process whose address space is limited to
+``--memory-cap-mib`` MiB (``RLIMIT_AS``). Blob payloads are hashed, copied
+and verified in fixed-size chunks, so both steps should succeed under a cap
+far smaller than the blob set. Reports throughput and the child's peak RSS.
+Needs about twice ``--total-gib`` of free disk space in ``--work-dir``. Run
+from ``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_archive_pack.py
+    uv run python benchmarks/bench_archive_pack.py --total-gib 0.5 --memory-cap-mib 512
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy.archive import pack_records_archive, validate_archive
+
+_BLOCK_SIZE = 1024 * 1024
+
+
+def _write_blobs(root: Path, blobs: int, total_bytes: int) -> list[dict]:
+    # One random block repeated, with a per-blob header so every blob hashes
+    # differently; deflate still has to scan every byte.
+    block = os.urandom(_BLOCK_SIZE)
+    blob_size = total_bytes // blobs
+    payloads = []
+    for index in range(blobs):
+        path = root / f"scan-{index:03d}.bin"
+        with path.open("wb") as handle:
+            handle.write(f"scan {index}\n".encode())
+            remaining = blob_size
+            while remaining > 0:
+                handle.write(block[:remaining])
+                remaining -= _BLOCK_SIZE
+        payloads.append(
+            {
+                "path": str(path),
+                "file_id": f"airalogy.id.file.scan-{index:03d}.bin",
+                "record_id": "bench-record",
+            }
+        )
+    return payloads
+
+
+def _pack(
+    records_file: str, output: str, payloads: list[dict], memory_cap: int, queue
+) -> None:
+    resource.setrlimit(resource.RLIMIT_AS, (memory_cap, memory_cap))
+    started = time.perf_counter()
+    pack_records_archive([records_file], output, file_payloads=payloads, force=True)
+    packed = time.perf_counter()
+    ok, issues = validate_archive(output)
+    assert ok, issues
+    validated = time.perf_counter()
+    queue.put(
+        (
+            packed - started,
+            validated - packed,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        )
+    )
+
+
+def bench(blobs: int, total_gib: float, memory_cap_mib: int, work_dir: str | None) -> None:
+    total_bytes = int(total_gib * 1024**3)
+    with tempfile.TemporaryDirectory(dir=work_dir) as root:
+        root_path = Path(root)
+        records_file = root_path / "records.json"
+        records_file.write_text(
+            json.dumps(
+                {
+                    "record_id": "bench-record",
+                    "metadata": {"protocol_id": "bench_protocol"},
+                    "data": {"var": {}},
+                }
+            )
+        )
+        payloads = _write_blobs(root_path, blobs, total_bytes)
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(
+            target=_pack,
+            args=(
+                str(records_file),
+                str(root_path / "records.aira"),
+                payloads,
+                memory_cap_mib * 1024 * 1024,
+                queue,
+            ),
+        )
+        process.start()
+        process.join()
+        if process.exitcode != 0:
+            raise SystemExit(
+                f"benchmark failed under a {memory_cap_mib} MiB cap "
+                f"(exit code {process.exitcode})"
+            )
+        pack_time, validate_time, peak_rss_kib = queue.get()
+        archive_size = (root_path / "records.aira").stat().st_size
+
+    print(
+        f"blobs={blobs} total={total_bytes / 1024**3:.2f} GiB "
+        f"cap={memory_cap_mib} MiB  "
+        f"pack={pack_time:.1f} s ({total_bytes / 1024**2 / pack_time:.0f} MiB/s)  "
+        f"validate={validate_time:.1f} s ({total_bytes / 1024**2 / validate_time:.0f} MiB/s)  "
+        f"peak_rss={peak_rss_kib / 1024:.0f} MiB  "
+        f"archive={archive_size / 1024**2:.0f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blobs", type=int, default=20)
+    parser.add_argument("--total-gib", type=float, default=5.0)
+    parser.add_argument("--memory-cap-mib", type=int, default=1024)
+    parser.add_argument("--work-dir", default=None)
+    args = parser.parse_args()
+    bench(args.blobs, args.total_gib, args.memory_cap_mib, args.work_dir)
+
+
+if __name__ == "__main__":
+    main()
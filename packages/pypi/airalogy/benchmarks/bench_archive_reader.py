@@ -0,0 +1,91 @@
+"""
+Benchmark single-record lookups in a large records archive.
+
+Packs ``--records`` small records into one ``.aira`` archive, then reads
+``--lookups`` random records by ``record_id``, either the way callers had to
+before ``ArchiveReader`` (``read_archive_manifest``, a scan of the manifest
+for the id, then ``zipfile`` access, for every lookup) or through one
+``ArchiveReader`` that keeps the zip open and the manifest indexed. Run from
+``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_archive_reader.py
+    uv run python benchmarks/bench_archive_reader.py --records 100000 --lookups 200
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from airalogy.archive import ArchiveReader, pack_records_archive, read_archive_manifest
+
+
+def _record_id(index: int) -> str:
+    return f"00000000-0000-4000-8000-{index:012d}"
+
+
+def _manual_lookup(archive_path: Path, record_id: str) -> dict:
+    manifest = read_archive_manifest(archive_path)
+    entry = next(item for item in manifest["records"] if item["record_id"] == record_id)
+    with zipfile.ZipFile(archive_path) as archive:
+        return json.loads(archive.read(entry["path"]))
+
+
+def bench(records: int, lookups: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        root_path = Path(root)
+        records_file = root_path / "records.json"
+        records_file.write_text(
+            json.dumps(
+                [
+                    {
+                        "record_id": _record_id(index),
+                        "record_version": 1,
+                        "metadata": {"protocol_id": f"protocol_{index % 10}"},
+                        "data": {"var": {"sample_name": f"sample-{index}", "value": index}},
+                    }
+                    for index in range(records)
+                ]
+            )
+        )
+        archive_path = root_path / "records.aira"
+        started = time.perf_counter()
+        pack_records_archive([records_file], archive_path)
+        pack_time = time.perf_counter() - started
+
+        wanted = [_record_id(index) for index in random.Random(0).sample(range(records), lookups)]
+
+        started = time.perf_counter()
+        for record_id in wanted:
+            assert _manual_lookup(archive_path, record_id)["record_id"] == record_id
+        manual = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ArchiveReader(archive_path) as reader:
+            opened = time.perf_counter() - started
+            for record_id in wanted:
+                assert reader.get_record(record_id)["record_id"] == record_id
+        indexed = time.perf_counter() - started
+
+    print(
+        f"records={records} lookups={lookups} pack={pack_time:.1f} s  "
+        f"manual={manual / lookups * 1000:8.2f} ms/lookup  "
+        f"reader={(indexed - opened) / lookups * 1000:6.3f} ms/lookup "
+        f"after a {opened * 1000:.0f} ms open  "
+        f"total speedup={manual / indexed:6.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+    bench(args.records, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark records archive packing throughput with hashing and compression workers.
+
+Writes a synthetic records archive input: one record, an embedded protocol
+with ``--protocol-files`` small files, and ``--blobs`` CSV-like instrument
+exports totalling ``--total-mib`` MiB. Packs it with
+``pack_records_archive(..., workers=n)`` for every ``--workers`` value;
+``workers=1`` is the single-threaded ``zipfile`` path. Speedups need as many
+free cores as workers. Run from
+``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_archive_workers.py
+    uv run python benchmarks/bench_archive_workers.py --workers 1 4 8 --total-mib 2048
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from airalogy.archive import pack_records_archive
+
+
+def _write_inputs(
+    root: Path, protocol_files: int, blobs: int, total_mib: int
+) -> tuple[Path, Path, list[dict]]:
+    protocol_dir = root / "bench_protocol"
+    (protocol_dir / "files").mkdir(parents=True)
+    (protocol_dir / "protocol.aimd").write_text("# Bench Protocol\n\n{{var|sample_name}}\n")
+    (protocol_dir / "protocol.toml").write_text(
+        '[airalogy_protocol]\nid = "bench_protocol"\nversion = "0.0.1"\n'
+    )
+    for index in range(protocol_files):
+        (protocol_dir / "files" / f"asset-{index:04d}.txt").write_text(
+            f"asset {index}\n" * 200
+        )
+
+    records_file = root / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "bench-record",
+                "metadata": {"protocol_id": "bench_protocol", "protocol_version": "0.0.1"},
+                "data": {"var": {"sample_name": "bench"}, "step": {}, "check": {}, "quiz": {}},
+            }
+        )
+    )
+
+    # Instrument exports: numeric rows that deflate to roughly half their size.
+    rng = random.Random(0)
+    rows = "".join(
+        f"{index},{rng.random():.6f},{rng.random():.6f},{rng.randint(0, 4095)}\n"
+        for index in range(20000)
+    ).encode()
+    blob_size = total_mib * 1024 * 1024 // blobs
+    payloads = []
+    for index in range(blobs):
+        path = root / f"export-{index:03d}.csv"
+        with path.open("wb") as handle:
+            handle.write(f"export,{index}\n".encode())
+            written = 0
+            while written < blob_size:
+                handle.write(rows[: blob_size - written])
+                written += len(rows)
+        payloads.append(
+            {
+                "path": str(path),
+                "file_id": f"airalogy.id.file.export-{index:03d}.csv",
+                "record_id": "bench-record",
+            }
+        )
+    return records_file, protocol_dir, payloads
+
+
+def bench(
+    workers_list: list[int], protocol_files: int, blobs: int, total_mib: int, runs: int
+) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        root_path = Path(root)
+        records_file, protocol_dir, payloads = _write_inputs(
+            root_path, protocol_files, blobs, total_mib
+        )
+        output = root_path / "records.aira"
+        baseline = None
+        for workers in workers_list:
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                pack_records_archive(
+                    [records_file],
+                    output,
+                    protocol_dirs=[protocol_dir],
+                    file_payloads=payloads,
+                    force=True,
+                    workers=workers,
+                )
+                timings.append(time.perf_counter() - started)
+            best = min(timings)
+            baseline = baseline or best
+            print(
+                f"workers={workers:<3} best={best:7.2f} s  "
+                f"throughput={total_mib / best:7.1f} MiB/s  "
+                f"speedup={baseline / best:4.1f}x  "
+                f"archive={output.stat().st_size / 1024**2:.0f} MiB"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    parser.add_argument("--protocol-files", type=int, default=500)
+    parser.add_argument("--blobs", type=int, default=16)
+    parser.add_argument("--total-mib", type=int, default=512)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    print(f"cpu_count={os.cpu_count()}")
+    bench(args.workers, args.protocol_files, args.blobs, args.total_mib, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark assigner cascades of slow, I/O-bound assigners.
+
+Builds a layered cascade (each assigner depends on every field of the layer
+before it) where each assigner sleeps to simulate an LLM or literature lookup,
+and compares sequential, thread-pool and asyncio execution. Parallel runs
+should take about ``depth * delay`` instead of ``depth * width * delay``. Run
+from ``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_assigner_cascade.py
+    uv run python benchmarks/bench_assigner_cascade.py --width 8 --depth 4
+"""
+
+import argparse
+import asyncio
+import time
+
+from airalogy.assigner import AssignerBase, AssignerResult
+
+
+def build_assigner(width: int, depth: int, delay: float) -> type[AssignerBase]:
+    previous = ["input"]
+    for layer in range(depth):
+        current = [f"field_{layer}_{index}" for index in range(width)]
+        for field in current:
+
+            def assign(dep: dict, field=field) -> AssignerResult:
+                time.sleep(delay)
+                return AssignerResult(assigned_fields={field: sum(dep.values()) + 1})
+
+            assign.__name__ = f"assign_{field}"
+            AssignerBase.assigner(
+                assigned_fields=[field],
+                dependent_fields=previous,
+                mode="auto",
+            )(assign)
+        previous = current
+    return type("BenchAssigner", (AssignerBase,), {})
+
+
+def measure(label: str, run) -> None:
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    assert result.success, result.errors
+    print(f"{label:<22} assigners={len(result.timings):>4}  elapsed={elapsed:8.3f}s")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--width", type=int, default=4)
+    arg_parser.add_argument("--depth", type=int, default=3)
+    arg_parser.add_argument("--delay", type=float, default=0.1)
+    arg_parser.add_argument("--workers", type=int, default=8)
+    args = arg_parser.parse_args()
+
+    assigner_cls = build_assigner(args.width, args.depth, args.delay)
+    data = {"input": 1}
+    print(
+        f"critical path={args.depth * args.delay:.3f}s  "
+        f"summed={args.depth * args.width * args.delay:.3f}s"
+    )
+    measure(
+        "sequential",
+        lambda: assigner_cls.assign_cascade(["input"], data),
+    )
+    measure(
+        f"threads (max={args.workers})",
+        lambda: assigner_cls.assign_cascade(
+            ["input"], data, max_workers=args.workers
+        ),
+    )
+    measure(
+        "asyncio",
+        lambda: asyncio.run(assigner_cls.aassign_cascade(["input"], data)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark assigner registration and dependency queries on large protocols.
+
+Registers synthetic assigners shaped like a tree (each assigned field depends
+on one raw input and on the field of its parent assigner), then queries every
+field's transitive dependencies through ``all_assigned_fields``. Registration
+should grow linearly with the number of assigners. ``--compare-up-to`` also
+times the previous behaviour of rebuilding and re-validating the whole graph
+after every registration. Run from ``packages/pypi/airalogy``:
+
+    uv run python benchmarks/bench_assigner_graph.py
+    uv run python benchmarks/bench_assigner_graph.py --counts 1000 5000 --compare-up-to 1000
+"""
+
+import argparse
+import time
+
+from airalogy.assigner import AssignerBase, AssignerResult
+
+
+class BenchAssigner(AssignerBase):
+    pass
+
+
+def register(count: int, full_rebuild: bool) -> float:
+    BenchAssigner.clear_assigners()
+    started = time.perf_counter()
+    for index in range(count):
+        dependent_fields = [f"raw_{index}"]
+        if index > 0:
+            dependent_fields.append(f"field_{(index - 1) // 2}")
+
+        def assign(dep: dict, index=index) -> AssignerResult:
+            return AssignerResult(assigned_fields={f"field_{index}": index})
+
+        assign.__name__ = f"assign_{index}"
+        BenchAssigner.assigner(
+            assigned_fields=[f"field_{index}"],
+            dependent_fields=dependent_fields,
+            mode="auto",
+        )(assign)
+        if full_rebuild:
+            BenchAssigner.build_dependency_graph()
+            BenchAssigner.validate_dependency_graph()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[500, 1000, 5000],
+        help="Numbers of synthetic assigners",
+    )
+    arg_parser.add_argument(
+        "--compare-up-to",
+        type=int,
+        default=1000,
+        help="Largest count also timed with a full rebuild per registration",
+    )
+    args = arg_parser.parse_args()
+
+    for count in args.counts:
+        incremental = register(count, full_rebuild=False)
+        started = time.perf_counter()
+        fields = BenchAssigner.all_assigned_fields()
+        query = time.perf_counter() - started
+        assert len(fields) == count
+
+        line = (
+            f"{count:>6} assigners  register={incremental:8.3f}s  "
+            f"per assigner={incremental / count * 1e6:7.1f}us  "
+            f"all_assigned_fields={query:7.3f}s"
+        )
+        if count <= args.compare_up_to:
+            line += f"  full rebuild={register(count, full_rebuild=True):8.3f}s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
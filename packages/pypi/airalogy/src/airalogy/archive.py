@@ -3,11 +3,19 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+import shutil
+import struct
+import time
 import tomllib
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
-from typing import Any, Iterable
+from typing import IO, Any, Callable, Iterable, Iterator
 
 from .markdown import AimdParser, validate_aimd
 from .migrations import validate_migration_manifest
@@ -22,13 +30,94 @@ ARCHIVE_SUFFIX = ".aira"
 ARCHIVE_KINDS = {"protocol", "protocols", "records"}
 BLOB_HASH_ALGORITHM = "sha256"
 BLOBS_ROOT = "blobs"
+# The Airalogy Reader inflates members in the browser and supports only these.
+ARCHIVE_COMPRESSIONS = {"deflate": zipfile.ZIP_DEFLATED, "store": zipfile.ZIP_STORED}
 
 _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+_COPY_CHUNK_SIZE = 1024 * 1024
+_COMPRESSION_PROBE_SIZE = 64 * 1024
+_COMPRESSION_PROBE_MIN_SIZE = 4 * 1024
+_INCOMPRESSIBLE_RATIO = 0.95
+# Deflate looks back at most 32 KiB, so priming each pool chunk with the
+# previous chunk's tail keeps split members about as small as whole ones.
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+# The limits and versions zipfile uses when it writes an archive.
+_ZIP64_LIMIT = (1 << 31) - 1
+_ZIP_MAX_COUNT = 0xFFFF
+_ZIP_VERSION = 20
+_ZIP64_VERSION = 45
+_PRECOMPRESSED_SUFFIXES = {
+    ".7z",
+    ".aira",
+    ".avif",
+    ".br",
+    ".bz2",
+    ".docx",
+    ".epub",
+    ".flac",
+    ".gif",
+    ".gz",
+    ".heic",
+    ".jar",
+    ".jpeg",
+    ".jpg",
+    ".lz4",
+    ".m4a",
+    ".mkv",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".npz",
+    ".odp",
+    ".ods",
+    ".odt",
+    ".ogg",
+    ".opus",
+    ".pdf",
+    ".png",
+    ".pptx",
+    ".rar",
+    ".tgz",
+    ".webm",
+    ".webp",
+    ".whl",
+    ".xlsx",
+    ".xz",
+    ".zip",
+    ".zst",
+}
+_PRECOMPRESSED_MIME_TYPES = {
+    "application/gzip",
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/x-7z-compressed",
+    "application/x-bzip2",
+    "application/x-xz",
+    "application/zip",
+    "application/zstd",
+    "audio/aac",
+    "audio/flac",
+    "audio/mp4",
+    "audio/mpeg",
+    "audio/ogg",
+    "audio/opus",
+    "audio/webm",
+    "image/avif",
+    "image/gif",
+    "image/heic",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+}
 _FILE_PAYLOAD_PATH_KEYS = ("path", "local_path", "file_path")
 
 _EXCLUDED_FILE_NAMES = {
     ".DS_Store",
     ".env",
+    # Written next to aimd_model.py by airalogy-engine's protocol executor.
+    ".aimd_model.sha256",
 }
 _EXCLUDED_DIR_NAMES = {
     ".git",
@@ -54,11 +143,17 @@ def _sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def _read_file_bytes(path: Path) -> bytes:
+def _sha256_file(path: Path) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
     try:
-        return path.read_bytes()
+        with path.open("rb") as handle:
+            while chunk := handle.read(_COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                size += len(chunk)
     except OSError as exc:
         raise ArchiveError(f"Failed to read '{path}': {exc}") from exc
+    return digest.hexdigest(), size
 
 
 def _as_non_empty_string(value: Any) -> str | None:
@@ -167,7 +262,7 @@ def _validate_protocol_migrations(protocol_dir: Path) -> None:
                 f"Migration transform '{relative_source}' does not exist inside "
                 f"Protocol '{protocol_dir}'."
             )
-        actual_hash = _sha256_bytes(_read_file_bytes(source_path))
+        actual_hash, _size = _sha256_file(source_path)
         if actual_hash != transform["code_hash"].lower():
             raise ArchiveError(
                 f"Migration transform '{relative_source}' SHA-256 does not match "
@@ -250,10 +345,25 @@ def _collect_protocol_files(protocol_dir: Path, output_path: Path | None = None)
     return files
 
 
-def _relative_protocol_file_hashes(protocol_dir: Path, files: Iterable[Path]) -> dict[str, str]:
+def _hash_files(
+    paths: Iterable[Path],
+    executor: Executor | None = None,
+) -> list[tuple[str, int]]:
+    paths = list(paths)
+    if executor is None:
+        return [_sha256_file(path) for path in paths]
+    return list(executor.map(_sha256_file, paths))
+
+
+def _relative_protocol_file_hashes(
+    protocol_dir: Path,
+    files: Iterable[Path],
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    files = list(files)
     return {
-        path.relative_to(protocol_dir).as_posix(): _sha256_bytes(_read_file_bytes(path))
-        for path in files
+        path.relative_to(protocol_dir).as_posix(): sha256
+        for path, (sha256, _size) in zip(files, _hash_files(files, executor))
     }
 
 
@@ -412,17 +522,31 @@ def _resolve_file_record_path(
 def _normalize_file_payloads(
     file_payloads: Iterable[dict[str, Any]] | None,
     record_descriptors: list[dict[str, Any]],
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, bytes]]:
+    executor: Executor | None = None,
+) -> tuple[
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+    dict[str, tuple[Path, str | None, str | None]],
+]:
     blob_entries_by_id: dict[str, dict[str, Any]] = {}
-    blob_payloads: dict[str, bytes] = {}
+    blob_sources: dict[str, tuple[Path, str | None, str | None]] = {}
     file_entries: list[dict[str, Any]] = []
     valid_record_paths = {
         descriptor["archive_path"]
         for descriptor in record_descriptors
         if isinstance(descriptor.get("archive_path"), str)
     }
+    file_payloads = list(file_payloads or [])
+    local_paths = {
+        local_path
+        for spec in file_payloads
+        if isinstance(spec, dict)
+        and (local_path := _file_payload_local_path(spec)) is not None
+        and local_path.is_file()
+    }
+    file_digests = dict(zip(local_paths, _hash_files(local_paths, executor)))
 
-    for index, spec in enumerate(file_payloads or [], start=1):
+    for index, spec in enumerate(file_payloads, start=1):
         if not isinstance(spec, dict):
             raise ArchiveError(f"File payload #{index} must be an object.")
 
@@ -435,12 +559,13 @@ def _normalize_file_payloads(
                 raise ArchiveError(f"File payload path '{local_path}' not found.")
             if not local_path.is_file():
                 raise ArchiveError(f"File payload path '{local_path}' must be a file.")
-            payload = _read_file_bytes(local_path)
-            sha256 = _sha256_bytes(payload)
+            sha256, blob_size = file_digests.get(local_path) or _sha256_file(local_path)
             blob_id = f"{BLOB_HASH_ALGORITHM}:{sha256}"
-            blob_size = len(payload)
             archive_path = _blob_archive_path(sha256)
-            blob_payloads.setdefault(archive_path, payload)
+            blob_sources.setdefault(
+                archive_path,
+                (local_path, filename, _as_non_empty_string(spec.get("mime_type"))),
+            )
             blob_entries_by_id.setdefault(
                 blob_id,
                 {
@@ -476,7 +601,7 @@ def _normalize_file_payloads(
             )
         file_entries.append(file_entry)
 
-    return list(blob_entries_by_id.values()), file_entries, blob_payloads
+    return list(blob_entries_by_id.values()), file_entries, blob_sources
 
 
 def _normalize_record_descriptor(
@@ -661,7 +786,10 @@ def _collect_protocol_archive_descriptors(
     return descriptors
 
 
-def _protocol_bundle_manifest_entry(protocol: dict[str, Any]) -> dict[str, Any]:
+def _protocol_bundle_manifest_entry(
+    protocol: dict[str, Any],
+    executor: Executor | None = None,
+) -> dict[str, Any]:
     protocol_dir = protocol["protocol_dir"]
     return {
         **protocol["metadata"],
@@ -673,22 +801,491 @@ def _protocol_bundle_manifest_entry(protocol: dict[str, Any]) -> dict[str, Any]:
         "file_hashes": _relative_protocol_file_hashes(
             protocol_dir,
             protocol["files"],
+            executor,
         ),
     }
 
 
-def _write_protocol_bundle_files(
-    archive: zipfile.ZipFile,
+@dataclass(frozen=True, slots=True)
+class _ArchiveMember:
+    """One zip member: in-memory bytes or a local file.
+
+    Files with an ``expected_sha256`` are blob payloads and are checked while
+    they are copied.
+    """
+
+    arcname: str
+    source: Path | bytes
+    expected_sha256: str | None = None
+    compress_type: int = zipfile.ZIP_DEFLATED
+
+
+def _archive_compression(compression: str, compression_level: int | None) -> int:
+    if compression not in ARCHIVE_COMPRESSIONS:
+        supported = ", ".join(sorted(ARCHIVE_COMPRESSIONS))
+        raise ArchiveError(
+            f"Unsupported archive compression '{compression}'. Use one of: {supported}."
+        )
+    if compression_level is not None and (
+        not isinstance(compression_level, int)
+        or isinstance(compression_level, bool)
+        or not 0 <= compression_level <= 9
+    ):
+        raise ArchiveError("compression_level must be an integer from 0 to 9.")
+    return ARCHIVE_COMPRESSIONS[compression]
+
+
+def _looks_incompressible(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            sample = handle.read(_COMPRESSION_PROBE_SIZE)
+    except OSError as exc:
+        raise ArchiveError(f"Failed to read '{path}': {exc}") from exc
+    if len(sample) < _COMPRESSION_PROBE_MIN_SIZE:
+        return False
+    return len(zlib.compress(sample, 1)) >= len(sample) * _INCOMPRESSIBLE_RATIO
+
+
+def _member_compress_type(
+    source: Path | bytes,
+    compress_type: int,
+    *,
+    filename: str | None = None,
+    mime_type: str | None = None,
+) -> int:
+    """Store already-compressed files; use ``compress_type`` for the rest."""
+    if compress_type == zipfile.ZIP_STORED or isinstance(source, bytes):
+        return compress_type
+    suffix = PurePosixPath(filename or source.name).suffix.lower()
+    media_type = (mime_type or "").split(";", 1)[0].strip().lower()
+    if (
+        suffix in _PRECOMPRESSED_SUFFIXES
+        or media_type in _PRECOMPRESSED_MIME_TYPES
+        or media_type.startswith("video/")
+        or _looks_incompressible(source)
+    ):
+        return zipfile.ZIP_STORED
+    return compress_type
+
+
+def _protocol_bundle_members(
     protocols: Iterable[dict[str, Any]],
-) -> None:
+    compress_type: int,
+) -> list[_ArchiveMember]:
+    members: list[_ArchiveMember] = []
     for protocol in protocols:
         protocol_dir_path = protocol["protocol_dir"]
         for file_path in protocol["files"]:
             relative_path = file_path.relative_to(protocol_dir_path).as_posix()
+            members.append(
+                _ArchiveMember(
+                    f"{protocol['archive_root']}/{relative_path}",
+                    file_path,
+                    compress_type=_member_compress_type(file_path, compress_type),
+                )
+            )
+    return members
+
+
+def _archive_executor(workers: int | None) -> Any:
+    if workers is None:
+        return nullcontext()
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ArchiveError("workers must be a positive integer.")
+    if workers == 1:
+        return nullcontext()
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="airalogy-archive")
+
+
+def _manifest_bytes(manifest: dict[str, Any]) -> bytes:
+    return (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_blob_file(
+    archive: zipfile.ZipFile,
+    archive_path: str,
+    source: Path,
+    compress_type: int = zipfile.ZIP_DEFLATED,
+) -> None:
+    """Copy ``source`` into ``archive`` in chunks and check it still has its hash."""
+    expected_hash = archive_path.rsplit("/", 1)[-1]
+    try:
+        member = zipfile.ZipInfo.from_file(
+            source, arcname=archive_path, strict_timestamps=False
+        )
+        member.compress_type = compress_type
+        member.compress_level = archive.compresslevel
+        digest = hashlib.sha256()
+        with source.open("rb") as handle, archive.open(member, "w") as target:
+            while chunk := handle.read(_COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                target.write(chunk)
+    except OSError as exc:
+        raise ArchiveError(f"Failed to read '{source}': {exc}") from exc
+    if digest.hexdigest() != expected_hash:
+        raise ArchiveError(f"File payload path '{source}' changed while packing.")
+
+
+def _write_archive_members(
+    archive: zipfile.ZipFile,
+    members: list[_ArchiveMember],
+) -> None:
+    """Write ``members`` in order, compressing them in this thread."""
+    for member in members:
+        if isinstance(member.source, bytes):
+            archive.writestr(
+                member.arcname, member.source, compress_type=member.compress_type
+            )
+        elif member.expected_sha256 is not None:
+            _write_blob_file(archive, member.arcname, member.source, member.compress_type)
+        else:
             archive.write(
-                file_path,
-                arcname=f"{protocol['archive_root']}/{relative_path}",
+                member.source, arcname=member.arcname, compress_type=member.compress_type
+            )
+
+
+def _member_info(member: _ArchiveMember) -> zipfile.ZipInfo:
+    """Build the ``ZipInfo`` that ``ZipFile.writestr``/``write`` would use."""
+    source = member.source
+    if isinstance(source, bytes):
+        info = zipfile.ZipInfo(member.arcname, date_time=time.localtime(time.time())[:6])
+        info.external_attr = 0o600 << 16
+        info.file_size = len(source)
+    else:
+        try:
+            info = zipfile.ZipInfo.from_file(
+                source,
+                arcname=member.arcname,
+                strict_timestamps=member.expected_sha256 is None,
+            )
+        except OSError as exc:
+            raise ArchiveError(f"Failed to read '{source}': {exc}") from exc
+    info.compress_type = member.compress_type
+    return info
+
+
+def _dos_date_time(date_time: tuple[int, ...]) -> tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return (
+        (hour << 11) | (minute << 5) | (second // 2),
+        ((year - 1980) << 9) | (month << 5) | day,
+    )
+
+
+class _ZipWriter:
+    """Assemble a zip file from member data compressed outside ``zipfile``.
+
+    ``zipfile`` only writes data it compresses itself, so archives packed with
+    several workers are written here. Each member gets a local header with
+    placeholder CRC and sizes, then its data, then the header is patched in
+    place, which is what ``zipfile`` does for seekable outputs. Zip64 extras
+    follow the same limits as ``zipfile``. ``close`` writes the central
+    directory.
+    """
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._entries: list[tuple[zipfile.ZipInfo, int, bool]] = []
+        self._current: tuple[zipfile.ZipInfo, int, bool] | None = None
+        self._crc = 0
+        self._file_size = 0
+        self._compress_size = 0
+
+    @staticmethod
+    def _encoded_name(info: zipfile.ZipInfo) -> tuple[bytes, int]:
+        try:
+            return info.filename.encode("ascii"), 0
+        except UnicodeEncodeError:
+            return info.filename.encode("utf-8"), 0x800
+
+    def start(self, info: zipfile.ZipInfo) -> None:
+        """Write the local header of ``info``, sized by its ``file_size``."""
+        zip64 = info.file_size * 1.05 > _ZIP64_LIMIT
+        name, flags = self._encoded_name(info)
+        extra = struct.pack("<HHQQ", 1, 16, 0, 0) if zip64 else b""
+        dos_time, dos_date = _dos_date_time(info.date_time)
+        offset = self._handle.tell()
+        self._handle.write(
+            struct.pack(
+                "<4s2B4HL2L2H",
+                b"PK\x03\x04",
+                _ZIP64_VERSION if zip64 else _ZIP_VERSION,
+                0,
+                flags,
+                info.compress_type,
+                dos_time,
+                dos_date,
+                0,
+                0xFFFFFFFF if zip64 else 0,
+                0xFFFFFFFF if zip64 else 0,
+                len(name),
+                len(extra),
             )
+        )
+        self._handle.write(name)
+        self._handle.write(extra)
+        self._current = (info, offset, zip64)
+        self._crc = 0
+        self._file_size = 0
+        self._compress_size = 0
+
+    def write(self, raw: bytes, data: bytes) -> None:
+        """Append ``data``, the stored or deflated form of ``raw``."""
+        self._handle.write(data)
+        self._crc = zlib.crc32(raw, self._crc)
+        self._file_size += len(raw)
+        self._compress_size += len(data)
+
+    def finish(self) -> None:
+        """Patch the CRC and sizes into the current member's local header."""
+        assert self._current is not None
+        info, offset, zip64 = self._current
+        if not zip64 and max(self._file_size, self._compress_size) > _ZIP64_LIMIT:
+            raise ArchiveError(f"Archive member '{info.filename}' grew while packing.")
+        end = self._handle.tell()
+        self._handle.seek(offset + 14)
+        if zip64:
+            self._handle.write(struct.pack("<L", self._crc))
+            self._handle.seek(offset + 30 + len(self._encoded_name(info)[0]) + 4)
+            self._handle.write(struct.pack("<QQ", self._file_size, self._compress_size))
+        else:
+            self._handle.write(
+                struct.pack("<3L", self._crc, self._compress_size, self._file_size)
+            )
+        self._handle.seek(end)
+        info.CRC = self._crc
+        info.file_size = self._file_size
+        info.compress_size = self._compress_size
+        self._entries.append((info, offset, zip64))
+        self._current = None
+
+    def close(self) -> None:
+        """Write the central directory and the end-of-archive records."""
+        handle = self._handle
+        directory_offset = handle.tell()
+        for info, offset, zip64 in self._entries:
+            name, flags = self._encoded_name(info)
+            file_size = info.file_size
+            compress_size = info.compress_size
+            header_offset = offset
+            extra_values = []
+            if file_size > _ZIP64_LIMIT:
+                extra_values.append(file_size)
+                file_size = 0xFFFFFFFF
+            if compress_size > _ZIP64_LIMIT:
+                extra_values.append(compress_size)
+                compress_size = 0xFFFFFFFF
+            if header_offset > _ZIP64_LIMIT:
+                extra_values.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            extra = (
+                struct.pack(
+                    f"<HH{len(extra_values)}Q",
+                    1,
+                    8 * len(extra_values),
+                    *extra_values,
+                )
+                if extra_values
+                else b""
+            )
+            version = _ZIP64_VERSION if zip64 or extra_values else _ZIP_VERSION
+            dos_time, dos_date = _dos_date_time(info.date_time)
+            handle.write(
+                struct.pack(
+                    "<4s4B4HL2L5H2L",
+                    b"PK\x01\x02",
+                    version,
+                    info.create_system,
+                    version,
+                    0,
+                    flags,
+                    info.compress_type,
+                    dos_time,
+                    dos_date,
+                    info.CRC,
+                    compress_size,
+                    file_size,
+                    len(name),
+                    len(extra),
+                    0,
+                    0,
+                    0,
+                    info.external_attr,
+                    header_offset,
+                )
+            )
+            handle.write(name)
+            handle.write(extra)
+
+        directory_end = handle.tell()
+        count = len(self._entries)
+        directory_size = directory_end - directory_offset
+        if (
+            count > _ZIP_MAX_COUNT
+            or directory_offset > _ZIP64_LIMIT
+            or directory_size > _ZIP64_LIMIT
+        ):
+            handle.write(
+                struct.pack(
+                    "<4sQ2H2L4Q",
+                    b"PK\x06\x06",
+                    44,
+                    _ZIP64_VERSION,
+                    _ZIP64_VERSION,
+                    0,
+                    0,
+                    count,
+                    count,
+                    directory_size,
+                    directory_offset,
+                )
+            )
+            handle.write(struct.pack("<4sLQL", b"PK\x06\x07", 0, directory_end, 1))
+            count = min(count, _ZIP_MAX_COUNT)
+            directory_size = min(directory_size, 0xFFFFFFFF)
+            directory_offset = min(directory_offset, 0xFFFFFFFF)
+        handle.write(
+            struct.pack(
+                "<4s4H2LH",
+                b"PK\x05\x06",
+                0,
+                0,
+                count,
+                count,
+                directory_size,
+                directory_offset,
+                0,
+            )
+        )
+
+
+def _deflate_chunk(data: bytes, zdict: bytes, last: bool, level: int) -> bytes:
+    # Each chunk is its own raw deflate stream, primed with the previous
+    # chunk's tail. Non-final chunks end with a sync flush, which leaves them
+    # byte-aligned, so the concatenation is a single valid deflate stream
+    # (the pigz approach).
+    options: dict[str, Any] = {"zdict": zdict} if zdict else {}
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, **options)
+    flush_mode = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(data) + compressor.flush(flush_mode)
+
+
+def _member_chunks(
+    members: Iterable[_ArchiveMember],
+) -> Iterator[tuple[int, bytes, bytes, bool]]:
+    """Yield ``(member index, chunk, previous chunk tail, last)`` in order."""
+    for index, member in enumerate(members):
+        source = member.source
+        if isinstance(source, bytes):
+            previous = b""
+            for offset in range(0, max(len(source), 1), _COPY_CHUNK_SIZE):
+                chunk = source[offset : offset + _COPY_CHUNK_SIZE]
+                yield index, chunk, previous, offset + _COPY_CHUNK_SIZE >= len(source)
+                previous = chunk[-_DEFLATE_WINDOW_SIZE:]
+            continue
+        try:
+            with source.open("rb") as handle:
+                previous = b""
+                chunk = handle.read(_COPY_CHUNK_SIZE)
+                while True:
+                    next_chunk = handle.read(_COPY_CHUNK_SIZE) if chunk else b""
+                    yield index, chunk, previous, not next_chunk
+                    if not next_chunk:
+                        break
+                    previous = chunk[-_DEFLATE_WINDOW_SIZE:]
+                    chunk = next_chunk
+        except OSError as exc:
+            raise ArchiveError(f"Failed to read '{source}': {exc}") from exc
+
+
+def _write_members_with_pool(
+    writer: _ZipWriter,
+    members: list[_ArchiveMember],
+    executor: Executor,
+    level: int,
+    window: int,
+) -> None:
+    """Deflate member chunks in ``executor`` and write them in member order.
+
+    At most ``window`` chunks are read ahead of the writer, so memory stays
+    bounded however large the members are.
+    """
+    chunks = _member_chunks(members)
+    pending: deque[tuple[int, bytes, bool, Future[bytes] | None]] = deque()
+
+    def read_ahead() -> None:
+        item = next(chunks, None)
+        if item is None:
+            return
+        index, chunk, previous, last = item
+        future = None
+        if members[index].compress_type == zipfile.ZIP_DEFLATED:
+            future = executor.submit(_deflate_chunk, chunk, previous, last, level)
+        pending.append((index, chunk, last, future))
+
+    digest = None
+    try:
+        for _ in range(window):
+            read_ahead()
+        current = None
+        while pending:
+            index, chunk, last, future = pending.popleft()
+            member = members[index]
+            if index != current:
+                writer.start(_member_info(member))
+                digest = hashlib.sha256() if member.expected_sha256 else None
+                current = index
+            writer.write(chunk, chunk if future is None else future.result())
+            if digest is not None:
+                digest.update(chunk)
+            read_ahead()
+            if last:
+                writer.finish()
+                if digest is not None and digest.hexdigest() != member.expected_sha256:
+                    raise ArchiveError(
+                        f"File payload path '{member.source}' changed while packing."
+                    )
+    finally:
+        chunks.close()
+        for *_, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def _write_archive(
+    destination: Path,
+    members: list[_ArchiveMember],
+    *,
+    compress_type: int,
+    compression_level: int | None,
+    executor: Executor | None,
+    workers: int | None,
+) -> None:
+    """Write ``members`` to ``destination`` in order.
+
+    Without an executor, ``zipfile`` writes and compresses every member. With
+    one, member data is deflated chunk by chunk in the pool while this thread
+    reads ahead and assembles the archive. Member order and contents do not
+    depend on the pool.
+    """
+    if executor is None:
+        with zipfile.ZipFile(
+            destination,
+            "w",
+            compression=compress_type,
+            compresslevel=compression_level,
+        ) as archive:
+            _write_archive_members(archive, members)
+        return
+
+    if compression_level is None:
+        compression_level = zlib.Z_DEFAULT_COMPRESSION
+    with destination.open("wb") as handle:
+        writer = _ZipWriter(handle)
+        _write_members_with_pool(
+            writer, members, executor, compression_level, window=2 * (workers or 1)
+        )
+        writer.close()
 
 
 def pack_protocol_archive(
@@ -696,6 +1293,9 @@ def pack_protocol_archive(
     output_path: str | Path | None = None,
     *,
     force: bool = False,
+    workers: int | None = None,
+    compression: str = "deflate",
+    compression_level: int | None = None,
 ) -> Path:
     protocol_dir_path = _ensure_protocol_dir(protocol_dir)
     _validate_protocol_definition(protocol_dir_path)
@@ -705,36 +1305,53 @@ def pack_protocol_archive(
         else protocol_dir_path.with_suffix(ARCHIVE_SUFFIX)
     )
     _validate_output_path_for_write(destination, force=force)
+    compress_type = _archive_compression(compression, compression_level)
 
     protocol_files = _collect_protocol_files(protocol_dir_path, output_path=destination)
     metadata = _load_protocol_metadata(protocol_dir_path)
     relative_files = [
         path.relative_to(protocol_dir_path).as_posix() for path in protocol_files
     ]
-    file_hashes = _relative_protocol_file_hashes(protocol_dir_path, protocol_files)
-
-    manifest = {
-        "format": ARCHIVE_FORMAT,
-        "version": ARCHIVE_VERSION,
-        "kind": "protocol",
-        "created_at": _utc_now_iso(),
-        "protocol": {
-            **metadata,
-            "files": relative_files,
-            "file_hashes": file_hashes,
-        },
-    }
-
-    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr(
-            ARCHIVE_MANIFEST_PATH,
-            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
+    with _archive_executor(workers) as executor:
+        file_hashes = _relative_protocol_file_hashes(
+            protocol_dir_path, protocol_files, executor
         )
-        for file_path in protocol_files:
-            archive.write(
+
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "kind": "protocol",
+            "created_at": _utc_now_iso(),
+            "protocol": {
+                **metadata,
+                "files": relative_files,
+                "file_hashes": file_hashes,
+            },
+        }
+        members = [
+            _ArchiveMember(
+                ARCHIVE_MANIFEST_PATH,
+                _manifest_bytes(manifest),
+                compress_type=compress_type,
+            )
+        ]
+        members.extend(
+            _ArchiveMember(
+                file_path.relative_to(protocol_dir_path).as_posix(),
                 file_path,
-                arcname=file_path.relative_to(protocol_dir_path).as_posix(),
+                compress_type=_member_compress_type(file_path, compress_type),
             )
+            for file_path in protocol_files
+        )
+
+        _write_archive(
+            destination,
+            members,
+            compress_type=compress_type,
+            compression_level=compression_level,
+            executor=executor,
+            workers=workers,
+        )
 
     return destination
 
@@ -744,6 +1361,9 @@ def pack_protocols_archive(
     output_path: str | Path | None = None,
     *,
     force: bool = False,
+    workers: int | None = None,
+    compression: str = "deflate",
+    compression_level: int | None = None,
 ) -> Path:
     protocol_dir_list = [Path(path) for path in protocol_dirs]
     if not protocol_dir_list:
@@ -759,28 +1379,40 @@ def pack_protocols_archive(
         )
     )
     _validate_output_path_for_write(destination, force=force)
+    compress_type = _archive_compression(compression, compression_level)
 
     protocols = _collect_protocol_archive_descriptors(
         protocol_dir_list,
         output_path=destination,
     )
-    manifest = {
-        "format": ARCHIVE_FORMAT,
-        "version": ARCHIVE_VERSION,
-        "kind": "protocols",
-        "created_at": _utc_now_iso(),
-        "protocols": [
-            _protocol_bundle_manifest_entry(protocol)
-            for protocol in protocols
-        ],
-    }
-
-    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr(
-            ARCHIVE_MANIFEST_PATH,
-            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
+    with _archive_executor(workers) as executor:
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "kind": "protocols",
+            "created_at": _utc_now_iso(),
+            "protocols": [
+                _protocol_bundle_manifest_entry(protocol, executor)
+                for protocol in protocols
+            ],
+        }
+        members = [
+            _ArchiveMember(
+                ARCHIVE_MANIFEST_PATH,
+                _manifest_bytes(manifest),
+                compress_type=compress_type,
+            )
+        ]
+        members.extend(_protocol_bundle_members(protocols, compress_type))
+
+        _write_archive(
+            destination,
+            members,
+            compress_type=compress_type,
+            compression_level=compression_level,
+            executor=executor,
+            workers=workers,
         )
-        _write_protocol_bundle_files(archive, protocols)
 
     return destination
 
@@ -792,6 +1424,9 @@ def pack_records_archive(
     protocol_dirs: Iterable[str | Path] | None = None,
     file_payloads: Iterable[dict[str, Any]] | None = None,
     force: bool = False,
+    workers: int | None = None,
+    compression: str = "deflate",
+    compression_level: int | None = None,
 ) -> Path:
     record_path_list = [Path(path) for path in record_paths]
     if not record_path_list:
@@ -812,6 +1447,7 @@ def pack_records_archive(
         )
     )
     _validate_output_path_for_write(destination, force=force)
+    compress_type = _archive_compression(compression, compression_level)
 
     record_descriptors: list[dict[str, Any]] = []
     for record_path in record_path_list:
@@ -876,60 +1512,95 @@ def pack_records_archive(
         )
         descriptor["archive_path"] = archive_path
 
-    manifest_blobs, manifest_files, blob_payloads = _normalize_file_payloads(
-        file_payloads,
-        record_descriptors,
-    )
-    manifest = {
-        "format": ARCHIVE_FORMAT,
-        "version": ARCHIVE_VERSION,
-        "kind": "records",
-        "created_at": _utc_now_iso(),
-        "records": manifest_records,
-        "protocols": [
-            _protocol_bundle_manifest_entry(protocol)
-            for protocol in embedded_protocols
-        ],
-    }
-    if manifest_blobs:
-        manifest["blobs"] = manifest_blobs
-    if manifest_files:
-        manifest["files"] = manifest_files
-
-    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr(
-            ARCHIVE_MANIFEST_PATH,
-            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
+    with _archive_executor(workers) as executor:
+        manifest_blobs, manifest_files, blob_sources = _normalize_file_payloads(
+            file_payloads,
+            record_descriptors,
+            executor,
         )
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "kind": "records",
+            "created_at": _utc_now_iso(),
+            "records": manifest_records,
+            "protocols": [
+                _protocol_bundle_manifest_entry(protocol, executor)
+                for protocol in embedded_protocols
+            ],
+        }
+        if manifest_blobs:
+            manifest["blobs"] = manifest_blobs
+        if manifest_files:
+            manifest["files"] = manifest_files
 
-        for descriptor in record_descriptors:
-            archive.writestr(
+        members = [
+            _ArchiveMember(
+                ARCHIVE_MANIFEST_PATH,
+                _manifest_bytes(manifest),
+                compress_type=compress_type,
+            )
+        ]
+        members.extend(
+            _ArchiveMember(
                 descriptor["archive_path"],
-                record_payloads[descriptor["archive_path"]],
+                record_payloads[descriptor["archive_path"]].encode("utf-8"),
+                compress_type=compress_type,
+            )
+            for descriptor in record_descriptors
+        )
+        members.extend(_protocol_bundle_members(embedded_protocols, compress_type))
+        members.extend(
+            _ArchiveMember(
+                archive_path,
+                source,
+                expected_sha256=archive_path.rsplit("/", 1)[-1],
+                compress_type=_member_compress_type(
+                    source,
+                    compress_type,
+                    filename=filename,
+                    mime_type=mime_type,
+                ),
             )
+            for archive_path, (source, filename, mime_type) in blob_sources.items()
+        )
 
-        _write_protocol_bundle_files(archive, embedded_protocols)
-        for archive_path, payload in blob_payloads.items():
-            archive.writestr(archive_path, payload)
+        _write_archive(
+            destination,
+            members,
+            compress_type=compress_type,
+            compression_level=compression_level,
+            executor=executor,
+            workers=workers,
+        )
 
     return destination
 
 
-def read_archive_manifest(archive_path: str | Path) -> dict[str, Any]:
-    archive_file = Path(archive_path)
+def _open_archive_zip(archive_file: Path) -> zipfile.ZipFile:
     if not archive_file.exists():
         raise ArchiveError(f"Archive '{archive_file}' not found.")
     if not archive_file.is_file():
         raise ArchiveError(f"Archive path '{archive_file}' must be a file.")
+    try:
+        return zipfile.ZipFile(archive_file, "r")
+    except zipfile.BadZipFile as exc:
+        raise ArchiveError(f"Archive '{archive_file}' is not a valid zip file.") from exc
+
 
+def read_archive_manifest(archive_path: str | Path) -> dict[str, Any]:
+    archive_file = Path(archive_path)
+    with _open_archive_zip(archive_file) as archive:
+        return _read_zip_manifest(archive, archive_file)
+
+
+def _read_zip_manifest(archive: zipfile.ZipFile, archive_file: Path) -> dict[str, Any]:
     try:
-        with zipfile.ZipFile(archive_file, "r") as archive:
-            try:
-                raw_manifest = archive.read(ARCHIVE_MANIFEST_PATH)
-            except KeyError as exc:
-                raise ArchiveError(
-                    f"Archive '{archive_file}' does not contain '{ARCHIVE_MANIFEST_PATH}'."
-                ) from exc
+        raw_manifest = archive.read(ARCHIVE_MANIFEST_PATH)
+    except KeyError as exc:
+        raise ArchiveError(
+            f"Archive '{archive_file}' does not contain '{ARCHIVE_MANIFEST_PATH}'."
+        ) from exc
     except zipfile.BadZipFile as exc:
         raise ArchiveError(f"Archive '{archive_file}' is not a valid zip file.") from exc
 
@@ -971,8 +1642,23 @@ def _read_archive_member_bytes(archive: zipfile.ZipFile, member_name: str) -> by
         raise ArchiveError(f"Archive is missing member '{member_name}'.") from exc
 
 
+def _archive_member_digest(
+    archive: zipfile.ZipFile, member_name: str
+) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with archive.open(member_name, "r") as source:
+            while chunk := source.read(_COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                size += len(chunk)
+    except KeyError as exc:
+        raise ArchiveError(f"Archive is missing member '{member_name}'.") from exc
+    return digest.hexdigest(), size
+
+
 def _archive_member_sha256(archive: zipfile.ZipFile, member_name: str) -> str:
-    return _sha256_bytes(_read_archive_member_bytes(archive, member_name))
+    return _archive_member_digest(archive, member_name)[0]
 
 
 def _validate_protocol_manifest(
@@ -1122,17 +1808,16 @@ def _validate_blobs_manifest(
             issues.append(f"Blob file '{archive_path}' is missing.")
             continue
 
-        raw_blob = _read_archive_member_bytes(archive, archive_path)
-        actual_hash = _sha256_bytes(raw_blob)
+        actual_hash, actual_size = _archive_member_digest(archive, archive_path)
         if actual_hash != expected_hash:
             issues.append(
                 f"Blob file '{archive_path}' sha256 mismatch: "
                 f"expected {expected_hash}, got {actual_hash}."
             )
-        if isinstance(expected_size, int) and expected_size != len(raw_blob):
+        if isinstance(expected_size, int) and expected_size != actual_size:
             issues.append(
                 f"Blob file '{archive_path}' size mismatch: "
-                f"expected {expected_size}, got {len(raw_blob)}."
+                f"expected {expected_size}, got {actual_size}."
             )
         elif expected_size is not None and not isinstance(expected_size, int):
             issues.append(f"Blob '{blob_id}' size must be an integer when present.")
@@ -1405,7 +2090,7 @@ def _safe_extract_member(archive: zipfile.ZipFile, member: zipfile.ZipInfo, outp
     destination = output_dir.joinpath(*relative_path.parts)
     destination.parent.mkdir(parents=True, exist_ok=True)
     with archive.open(member, "r") as source, destination.open("wb") as target:
-        target.write(source.read())
+        shutil.copyfileobj(source, target, _COPY_CHUNK_SIZE)
 
 
 def unpack_archive(
@@ -1441,3 +2126,147 @@ def unpack_archive(
             _safe_extract_member(archive, member, destination)
 
     return destination, manifest
+
+
+class ArchiveReader:
+    """Random access to the records and blobs of a records ``.aira`` archive.
+
+    The zip is opened once and its manifest is indexed by record path,
+    ``record_id`` and ``protocol_id``. Records are decompressed, checked
+    against their manifest SHA-256 and parsed only when requested, and blobs
+    are returned as streams, so serving one record from a large archive does
+    not touch the others. Use it as a context manager or call ``close()``.
+    """
+
+    def __init__(self, archive_path: str | Path) -> None:
+        self.path = Path(archive_path)
+        self._archive = _open_archive_zip(self.path)
+        try:
+            self.manifest = _read_zip_manifest(self._archive, self.path)
+            if self.manifest["kind"] != "records":
+                raise ArchiveError(
+                    f"Archive '{self.path}' has kind '{self.manifest['kind']}', "
+                    "not 'records'."
+                )
+        except BaseException:
+            self._archive.close()
+            raise
+
+        self._records_by_path: dict[str, dict[str, Any]] = {}
+        self._records_by_id: dict[str, list[dict[str, Any]]] = {}
+        self._records_by_protocol: dict[str, list[dict[str, Any]]] = {}
+        for entry in self.manifest.get("records") or []:
+            if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+                continue
+            self._records_by_path[entry["path"]] = entry
+            if isinstance(entry.get("record_id"), str):
+                self._records_by_id.setdefault(entry["record_id"], []).append(entry)
+            if isinstance(entry.get("protocol_id"), str):
+                self._records_by_protocol.setdefault(entry["protocol_id"], []).append(entry)
+        self._blobs_by_id: dict[str, dict[str, Any]] = {
+            blob["blob_id"]: blob
+            for blob in self.manifest.get("blobs") or []
+            if isinstance(blob, dict) and isinstance(blob.get("blob_id"), str)
+        }
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    @property
+    def record_entries(self) -> list[dict[str, Any]]:
+        """Manifest entries of every record, in archive order."""
+        return list(self._records_by_path.values())
+
+    def get_record(
+        self,
+        record_id: str,
+        *,
+        record_version: int | None = None,
+    ) -> dict[str, Any]:
+        """Return one record, by default the highest ``record_version`` of ``record_id``."""
+        entries = self._records_by_id.get(record_id, [])
+        if record_version is not None:
+            entries = [
+                entry for entry in entries if entry.get("record_version") == record_version
+            ]
+        if not entries:
+            version_label = "" if record_version is None else f" version {record_version}"
+            raise ArchiveError(
+                f"Record '{record_id}'{version_label} not found in archive '{self.path}'."
+            )
+        entry = max(
+            entries,
+            key=lambda item: (
+                item["record_version"]
+                if isinstance(item.get("record_version"), int)
+                else -1
+            ),
+        )
+        return self._read_record(entry)
+
+    def read_record(self, path: str) -> dict[str, Any]:
+        """Return the record stored at archive member ``path``."""
+        entry = self._records_by_path.get(path)
+        if entry is None:
+            raise ArchiveError(f"Record path '{path}' not found in archive '{self.path}'.")
+        return self._read_record(entry)
+
+    def iter_records(
+        self,
+        filter: Callable[[dict[str, Any]], bool] | None = None,
+        *,
+        protocol_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield records lazily, in archive order.
+
+        ``filter`` receives each record's manifest entry, so records it rejects
+        are never decompressed.
+        """
+        entries = (
+            self._records_by_protocol.get(protocol_id, [])
+            if protocol_id is not None
+            else self._records_by_path.values()
+        )
+        for entry in entries:
+            if filter is None or filter(entry):
+                yield self._read_record(entry)
+
+    def open_blob(self, blob_id: str) -> IO[bytes]:
+        """Return a binary stream over the blob ``blob_id``.
+
+        The stream decompresses on read; zipfile checks the member CRC once it
+        has been read to the end.
+        """
+        blob = self._blobs_by_id.get(blob_id)
+        if blob is None:
+            raise ArchiveError(f"Blob '{blob_id}' not found in archive '{self.path}'.")
+        try:
+            return self._archive.open(blob["archive_path"], "r")
+        except KeyError as exc:
+            raise ArchiveError(
+                f"Archive is missing member '{blob['archive_path']}'."
+            ) from exc
+
+    def _read_record(self, entry: dict[str, Any]) -> dict[str, Any]:
+        record_path = entry["path"]
+        raw_record = _read_archive_member_bytes(self._archive, record_path)
+        expected_hash = entry.get("sha256")
+        if isinstance(expected_hash, str) and expected_hash:
+            actual_hash = _sha256_bytes(raw_record)
+            if actual_hash != expected_hash:
+                raise ArchiveError(
+                    f"Record file '{record_path}' sha256 mismatch: expected {expected_hash}, got {actual_hash}."
+                )
+        try:
+            record = json.loads(raw_record.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ArchiveError(f"Record file '{record_path}' is not valid UTF-8 JSON.") from exc
+        if not isinstance(record, dict):
+            raise ArchiveError(f"Record file '{record_path}' must contain a JSON object.")
+        return record
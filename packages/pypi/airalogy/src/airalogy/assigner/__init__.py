@@ -1,10 +1,11 @@
 from .assigner_base import AssignerBase, DefaultAssigner, assigner
-from .assigner_result import AssignerResult
+from .assigner_result import AssignerCascadeResult, AssignerResult
 from .inline_assigner import load_inline_assigners
 
 __all__ = [
     "AssignerBase",
     "DefaultAssigner",
+    "AssignerCascadeResult",
     "AssignerResult",
     "assigner",
     "load_inline_assigners",
@@ -1,9 +1,14 @@
+import asyncio
 import functools
+import inspect
 import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from graphlib import CycleError, TopologicalSorter
 from typing import Any, Callable, Literal
 
-from airalogy.assigner.assigner_result import AssignerResult
+from airalogy.assigner.assigner_result import AssignerCascadeResult, AssignerResult
 
 AssignerMode = Literal[
     "manual",
@@ -36,15 +41,25 @@ class AssignerBase:
     assigned_info: dict[str, tuple[list[str], Callable, AssignerMode]] = {}
     dependent_info: dict[str, list[tuple[str, Callable, AssignerMode]]] = {}
     dependency_graph: dict[str, set[str]] = {}
+    # Reverse adjacency of dependency_graph: node -> nodes that depend on it.
+    _successor_graph: dict[str, set[str]] = {}
+    # assigned key -> all of its transitive dependent fields.
+    _transitive_dependency_cache: dict[str, tuple[str, ...]] = {}
 
     def __init_subclass__(cls, **kwargs):
         with AssignerBase._lock:
             cls.assigned_info = AssignerBase.assigned_info
             cls.dependent_info = AssignerBase.dependent_info
             cls.dependency_graph = AssignerBase.dependency_graph
+            cls._successor_graph = AssignerBase._successor_graph
+            cls._transitive_dependency_cache = (
+                AssignerBase._transitive_dependency_cache
+            )
             AssignerBase.assigned_info = {}
             AssignerBase.dependent_info = {}
             AssignerBase.dependency_graph = {}
+            AssignerBase._successor_graph = {}
+            AssignerBase._transitive_dependency_cache = {}
 
     @classmethod
     def assigner(
@@ -68,21 +83,22 @@ class AssignerBase:
                     raise ValueError(
                         f"assigned_fields: {key} has been defined in other assigner."
                     )
-                cls.assigned_info[key] = (dependent_fields, assign_func, mode)
             if assigner_name in cls.dependency_graph:
                 raise ValueError(f"assigner_name: {assigner_name} is not unique.")
+            cls._check_no_new_cycle(assigner_name, assigned_fields, dependent_fields)
+
+            for key in assigned_fields:
+                cls.assigned_info[key] = (dependent_fields, assign_func, mode)
             for key in dependent_fields:
                 if key not in cls.dependent_info:
                     cls.dependent_info[key] = []
                 for assigned_key in assigned_fields:
                     cls.dependent_info[key].append((assigned_key, assign_func, mode))
 
-            # Build dependency_graph
-            cls.build_dependency_graph()
-            cls.validate_dependency_graph()
+            # Insert the new edges; the graph is still a DAG.
+            cls._add_assigner_edges(assigner_name, assigned_fields, dependent_fields)
 
-            @functools.wraps(assign_func)
-            def wrapper(dependent_data: dict) -> AssignerResult:
+            def check_dependent_data(dependent_data: dict) -> AssignerResult | None:
                 # check dependent_data type
                 if not isinstance(dependent_data, dict):
                     return AssignerResult(
@@ -100,16 +116,9 @@ class AssignerBase:
                         assigned_fields=None,
                         error_message=f"Missing dependent rfs: {missing_keys} for assigned_fields: {assigned_fields}, in {assign_func.__name__}",
                     )
+                return None
 
-                try:
-                    result = assign_func(dependent_data)
-                except Exception as e:
-                    return AssignerResult(
-                        success=False,
-                        assigned_fields=None,
-                        error_message=str(e),
-                    )
-
+            def check_result(result: Any) -> AssignerResult:
                 # 检查 assign_func 的返回值
                 if not isinstance(result, AssignerResult):
                     return AssignerResult(
@@ -139,6 +148,40 @@ class AssignerBase:
 
                 return result
 
+            if inspect.iscoroutinefunction(assign_func):
+
+                @functools.wraps(assign_func)
+                async def async_wrapper(dependent_data: dict) -> AssignerResult:
+                    failure = check_dependent_data(dependent_data)
+                    if failure is not None:
+                        return failure
+                    try:
+                        result = await assign_func(dependent_data)
+                    except Exception as e:
+                        return AssignerResult(
+                            success=False,
+                            assigned_fields=None,
+                            error_message=str(e),
+                        )
+                    return check_result(result)
+
+                return staticmethod(async_wrapper)
+
+            @functools.wraps(assign_func)
+            def wrapper(dependent_data: dict) -> AssignerResult:
+                failure = check_dependent_data(dependent_data)
+                if failure is not None:
+                    return failure
+                try:
+                    result = assign_func(dependent_data)
+                except Exception as e:
+                    return AssignerResult(
+                        success=False,
+                        assigned_fields=None,
+                        error_message=str(e),
+                    )
+                return check_result(result)
+
             return staticmethod(wrapper)
 
         return decorator
@@ -150,29 +193,84 @@ class AssignerBase:
         Graph structure:
             - dependent_field -> assigner (assigner depends on input field)
             - assigner -> assigned_field (assigned_field depends on assigner)
+
+        Registering an assigner updates the graph incrementally, so this is
+        only needed after editing `assigned_info` by hand.
         """
         cls.dependency_graph = {}
-        graph = cls.dependency_graph
+        cls._successor_graph = {}
+        cls._transitive_dependency_cache = {}
 
         for assigned_key, (
             dependent_fields,
             assign_func,
             _,
         ) in cls.assigned_info.items():
-            assigner_name = assign_func.__name__
+            cls._add_assigner_edges(
+                assign_func.__name__, [assigned_key], dependent_fields
+            )
+
+    @classmethod
+    def _add_assigner_edges(
+        cls,
+        assigner_name: str,
+        assigned_fields: list[str],
+        dependent_fields: list[str],
+    ) -> None:
+        graph = cls.dependency_graph
+        successors = cls._successor_graph
+
+        # assigner depends on dependent_fields
+        graph.setdefault(assigner_name, set())
+        successors.setdefault(assigner_name, set())
+        for dep_field in dependent_fields:
+            graph[assigner_name].add(dep_field)
+            graph.setdefault(dep_field, set())
+            successors.setdefault(dep_field, set()).add(assigner_name)
+
+        # assigned_field depends on assigner
+        for assigned_key in assigned_fields:
+            graph.setdefault(assigned_key, set()).add(assigner_name)
+            successors.setdefault(assigned_key, set())
+            successors[assigner_name].add(assigned_key)
+
+        # New edges can only extend the transitive dependencies of keys
+        # downstream of this assigner; recomputing lazily is cheaper than
+        # finding them.
+        cls._transitive_dependency_cache.clear()
 
-            # assigned_field depends on assigner
-            if assigned_key not in graph:
-                graph[assigned_key] = set()
-            graph[assigned_key].add(assigner_name)
+    @classmethod
+    def _check_no_new_cycle(
+        cls,
+        assigner_name: str,
+        assigned_fields: list[str],
+        dependent_fields: list[str],
+    ) -> None:
+        """Raise ValueError if registering the assigner would close a cycle.
 
-            # assigner depends on dependent_fields
-            if assigner_name not in graph:
-                graph[assigner_name] = set()
-            for dep_field in dependent_fields:
-                graph[assigner_name].add(dep_field)
-                if dep_field not in graph:
-                    graph[dep_field] = set()
+        The graph is acyclic before the insertion, so a new cycle must run
+        from one of the new assigned fields to one of its dependent fields.
+        """
+        targets = set(dependent_fields)
+        parents: dict[str, str | None] = {}
+        stack = []
+        for assigned_key in assigned_fields:
+            if assigned_key not in parents:
+                parents[assigned_key] = None
+                stack.append(assigned_key)
+
+        while stack:
+            node = stack.pop()
+            if node in targets:
+                path = [node]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                cycle = [assigner_name, *reversed(path), assigner_name]
+                raise ValueError(f"Circular dependency detected: {' -> '.join(cycle)}")
+            for successor in cls._successor_graph.get(node, ()):
+                if successor not in parents:
+                    parents[successor] = node
+                    stack.append(successor)
 
     @classmethod
     def validate_dependency_graph(cls) -> None:
@@ -268,16 +366,25 @@ class AssignerBase:
 
     @classmethod
     def get_all_dependent_fields_recursive(cls, assigned_key: str) -> list[str]:
-        """Get all dependent fields recursively using BFS traversal."""
+        """Get all dependent fields recursively in breadth-first order.
+
+        Results are cached until the next assigner is registered.
+        """
         if assigned_key not in cls.assigned_info:
             return []
+        return list(cls._get_transitive_dependencies(assigned_key))
+
+    @classmethod
+    def _get_transitive_dependencies(cls, assigned_key: str) -> tuple[str, ...]:
+        cache = cls._transitive_dependency_cache
+        if assigned_key in cache:
+            return cache[assigned_key]
 
         visited: set[str] = set()
         result: list[str] = []
-        queue = list(cls.assigned_info[assigned_key][0])
-
+        queue = deque(cls.assigned_info[assigned_key][0])
         while queue:
-            field = queue.pop(0)
+            field = queue.popleft()
             if field in visited:
                 continue
             visited.add(field)
@@ -288,7 +395,17 @@ class AssignerBase:
                     if dep not in visited:
                         queue.append(dep)
 
-        return result
+        cache[assigned_key] = tuple(result)
+        return cache[assigned_key]
+
+    @classmethod
+    def clear_assigners(cls) -> None:
+        """Forget every assigner registered on this class."""
+        cls.assigned_info.clear()
+        cls.dependent_info.clear()
+        cls.dependency_graph.clear()
+        cls._successor_graph.clear()
+        cls._transitive_dependency_cache.clear()
 
     @classmethod
     def get_assign_func_of_assigned_key(cls, assigned_key: str) -> Callable | None:
@@ -316,11 +433,14 @@ class AssignerBase:
         }
 
     @classmethod
-    def assign(cls, assigned_key: str, dependent_data: dict) -> AssignerResult:
+    def _resolve_assign_func(
+        cls, assigned_key: str, dependent_data: dict
+    ) -> tuple[Callable | None, AssignerResult | None]:
+        """Return (assign_func, None), or (None, failure) when it cannot run."""
         dep_fields = cls.get_dependent_fields_of_assigned_key(assigned_key)
         for df in dep_fields:
             if df not in dependent_data:
-                return AssignerResult(
+                return None, AssignerResult(
                     success=False,
                     assigned_fields=None,
                     error_message=f"Missing dependent field: {df} for assigned field: {assigned_key}",
@@ -328,14 +448,160 @@ class AssignerBase:
 
         assign_func = cls.get_assign_func_of_assigned_key(assigned_key)
         if assign_func is None:
-            return AssignerResult(
+            return None, AssignerResult(
                 success=False,
                 assigned_fields=None,
                 error_message=f"Cannot find assign function for field: {assigned_key}",
             )
+        return assign_func, None
+
+    @classmethod
+    def is_async_assigner(cls, assigned_key: str) -> bool:
+        """Whether the assigner of `assigned_key` is an `async def` function."""
+        return inspect.iscoroutinefunction(
+            cls.get_assign_func_of_assigned_key(assigned_key)
+        )
+
+    @classmethod
+    def assign(cls, assigned_key: str, dependent_data: dict) -> AssignerResult:
+        assign_func, failure = cls._resolve_assign_func(assigned_key, dependent_data)
+        if failure is not None:
+            return failure
+
+        if inspect.iscoroutinefunction(assign_func):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(assign_func(dependent_data))
+            return AssignerResult(
+                success=False,
+                assigned_fields=None,
+                error_message=f"The assigner of {assigned_key} is async, use `await aassign(...)` inside a running event loop.",
+            )
 
         return assign_func(dependent_data)
 
+    @classmethod
+    async def aassign(cls, assigned_key: str, dependent_data: dict) -> AssignerResult:
+        """Async variant of `assign`.
+
+        `async def` assigners are awaited on the running event loop; regular
+        assigners run in the loop's default thread pool so they do not block it.
+        """
+        assign_func, failure = cls._resolve_assign_func(assigned_key, dependent_data)
+        if failure is not None:
+            return failure
+
+        if inspect.iscoroutinefunction(assign_func):
+            return await assign_func(dependent_data)
+        return await asyncio.to_thread(assign_func, dependent_data)
+
+    @classmethod
+    def assign_cascade(
+        cls,
+        changed_fields: list[str],
+        data: dict,
+        prepare_dependent_data: Callable[[str, dict], dict] | None = None,
+        max_workers: int = 1,
+    ) -> AssignerCascadeResult:
+        """Run every automatic assigner affected by `changed_fields`.
+
+        Assigners are scheduled in dependency order, so fields assigned by one
+        assigner feed the assigners downstream of it. `auto` and
+        `auto_readonly` assigners run whenever one of their dependent fields
+        changed; `auto_first` assigners only run while one of their assigned
+        fields has no value yet; manual assigners never run.
+
+        With `max_workers` > 1, assigners whose dependencies are all settled
+        run concurrently in a thread pool, so a cascade of slow I/O-bound
+        assigners takes roughly its critical-path time.
+
+        Args:
+            changed_fields: Fields whose values changed.
+            data: Current values of the record's fields. Not modified.
+            prepare_dependent_data: Optional hook called with the first
+                assigned key and the dependent data of each assigner before it
+                runs, returning the data to pass to it (e.g. type-converted).
+                Exceptions raised by the hook fail that assigner.
+            max_workers: Maximum number of assigners running at once.
+
+        Returns:
+            AssignerCascadeResult with all assigned fields and per-assigner
+            timings, errors and skipped assigners.
+        """
+        run = _CascadeRun(cls, changed_fields, data, prepare_dependent_data)
+        if max_workers <= 1:
+            while run.sorter.is_active():
+                for assigner_name, assigned_key, dependent_data in run.ready_jobs():
+                    run.complete(
+                        assigner_name,
+                        *_call_assigner(cls, assigned_key, dependent_data),
+                    )
+            return run.result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending: dict[Future, str] = {}
+            while run.sorter.is_active():
+                for assigner_name, assigned_key, dependent_data in run.ready_jobs():
+                    future = pool.submit(
+                        _call_assigner, cls, assigned_key, dependent_data
+                    )
+                    pending[future] = assigner_name
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    run.complete(pending.pop(future), *future.result())
+        return run.result
+
+    @classmethod
+    async def aassign_cascade(
+        cls,
+        changed_fields: list[str],
+        data: dict,
+        prepare_dependent_data: Callable[[str, dict], dict] | None = None,
+        max_concurrency: int | None = None,
+    ) -> AssignerCascadeResult:
+        """Async variant of `assign_cascade`.
+
+        Independent assigners run concurrently: coroutine assigners are
+        awaited on the running event loop and regular assigners run in the
+        loop's default thread pool.
+
+        Args:
+            changed_fields: Fields whose values changed.
+            data: Current values of the record's fields. Not modified.
+            prepare_dependent_data: Same as in `assign_cascade`.
+            max_concurrency: Maximum number of assigners running at once;
+                unlimited when None.
+
+        Returns:
+            AssignerCascadeResult with all assigned fields and per-assigner
+            timings, errors and skipped assigners.
+        """
+        run = _CascadeRun(cls, changed_fields, data, prepare_dependent_data)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_job(assigned_key: str, dependent_data: dict):
+            if semaphore is None:
+                return await _acall_assigner(cls, assigned_key, dependent_data)
+            async with semaphore:
+                return await _acall_assigner(cls, assigned_key, dependent_data)
+
+        pending: dict[asyncio.Future, str] = {}
+        while run.sorter.is_active():
+            for assigner_name, assigned_key, dependent_data in run.ready_jobs():
+                task = asyncio.ensure_future(run_job(assigned_key, dependent_data))
+                pending[task] = assigner_name
+            if not pending:
+                break
+            finished, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                run.complete(pending.pop(task), *task.result())
+        return run.result
+
 
 class DefaultAssigner(AssignerBase):
     """Default assigner container for standalone @assigner functions."""
@@ -364,3 +630,164 @@ def assigner(
         return wrapped
 
     return decorator
+
+
+def _call_assigner(
+    assigner_cls: type[AssignerBase],
+    assigned_key: str,
+    dependent_data: dict,
+) -> tuple[AssignerResult | None, str | None, float]:
+    """Run one assigner, returning (result, error message, elapsed seconds)."""
+    started = time.perf_counter()
+    try:
+        result = _check_assigner_result(
+            assigned_key, assigner_cls.assign(assigned_key, dependent_data)
+        )
+        error_message = result.error_message
+    except Exception as e:
+        result = None
+        error_message = str(e)
+    return result, error_message, time.perf_counter() - started
+
+
+async def _acall_assigner(
+    assigner_cls: type[AssignerBase],
+    assigned_key: str,
+    dependent_data: dict,
+) -> tuple[AssignerResult | None, str | None, float]:
+    """Async variant of `_call_assigner`."""
+    if not assigner_cls.is_async_assigner(assigned_key):
+        return await asyncio.to_thread(
+            _call_assigner, assigner_cls, assigned_key, dependent_data
+        )
+
+    started = time.perf_counter()
+    try:
+        result = _check_assigner_result(
+            assigned_key, await assigner_cls.aassign(assigned_key, dependent_data)
+        )
+        error_message = result.error_message
+    except Exception as e:
+        result = None
+        error_message = str(e)
+    return result, error_message, time.perf_counter() - started
+
+
+def _check_assigner_result(assigned_key: str, result: Any) -> AssignerResult:
+    if not isinstance(result, AssignerResult):
+        raise TypeError(
+            f"The assigner of {assigned_key} must return a AssignerResult."
+        )
+    return result
+
+
+class _CascadeRun:
+    """Scheduling state of one `assign_cascade` call.
+
+    Walks the dependency graph with `TopologicalSorter.get_ready()`: field
+    nodes settle immediately, and an assigner node is planned once all of its
+    dependent fields are settled, so its inputs are final when it runs.
+    """
+
+    def __init__(
+        self,
+        assigner_cls: type[AssignerBase],
+        changed_fields: list[str],
+        data: dict,
+        prepare_dependent_data: Callable[[str, dict], dict] | None,
+    ):
+        self.assigners: dict[str, tuple[list[str], list[str], AssignerMode]] = {}
+        for assigned_key, (dependent_fields, assign_func, mode) in (
+            assigner_cls.assigned_info.items()
+        ):
+            entry = self.assigners.setdefault(
+                assign_func.__name__, ([], list(dependent_fields), mode)
+            )
+            entry[0].append(assigned_key)
+
+        self.values = dict(data)
+        self.changed = set(changed_fields)
+        self.failed: set[str] = set()
+        self.prepare_dependent_data = prepare_dependent_data
+        self.result = AssignerCascadeResult()
+        self.sorter = TopologicalSorter(assigner_cls.dependency_graph)
+        self.sorter.prepare()
+
+    def ready_jobs(self) -> list[tuple[str, str, dict]]:
+        """Settle ready nodes that need no work and return assigners to run.
+
+        Each job is (assigner name, first assigned key, dependent data).
+        """
+        jobs = []
+        ready = self.sorter.get_ready()
+        while ready:
+            for node in ready:
+                job = self._plan(node)
+                if job is None:
+                    self.sorter.done(node)
+                else:
+                    jobs.append(job)
+            ready = self.sorter.get_ready()
+        return jobs
+
+    def complete(
+        self,
+        assigner_name: str,
+        assigner_result: AssignerResult | None,
+        error_message: str | None,
+        elapsed: float,
+    ) -> None:
+        """Record the outcome of an assigner and settle its node."""
+        self._record(assigner_name, assigner_result, error_message, elapsed)
+        self.sorter.done(assigner_name)
+
+    def _plan(self, node: str) -> tuple[str, str, dict] | None:
+        if node not in self.assigners:
+            return None
+        assigned_keys, dependent_fields, mode = self.assigners[node]
+        if is_manual_assigner(mode) or self.changed.isdisjoint(dependent_fields):
+            return None
+        if mode == "auto_first" and all(
+            self.values.get(key) is not None for key in assigned_keys
+        ):
+            return None
+        # Outputs of skipped or failed assigners still mark their downstream
+        # assigners as affected, so those are reported too.
+        self.changed.update(assigned_keys)
+        if any(
+            key in self.failed or self.values.get(key) is None
+            for key in dependent_fields
+        ):
+            self.failed.update(assigned_keys)
+            self.result.skipped.append(node)
+            return None
+
+        dependent_data = {key: self.values[key] for key in dependent_fields}
+        if self.prepare_dependent_data is not None:
+            started = time.perf_counter()
+            try:
+                dependent_data = self.prepare_dependent_data(
+                    assigned_keys[0], dependent_data
+                )
+            except Exception as e:
+                self._record(node, None, str(e), time.perf_counter() - started)
+                return None
+        return node, assigned_keys[0], dependent_data
+
+    def _record(
+        self,
+        assigner_name: str,
+        assigner_result: AssignerResult | None,
+        error_message: str | None,
+        elapsed: float,
+    ) -> None:
+        self.result.timings[assigner_name] = elapsed
+        if assigner_result is None or not assigner_result.success:
+            self.failed.update(self.assigners[assigner_name][0])
+            self.result.errors[assigner_name] = error_message or ""
+            self.result.success = False
+            return
+
+        assigned = assigner_result.assigned_fields or {}
+        self.values.update(assigned)
+        self.result.assigned_fields.update(assigned)
@@ -39,3 +39,31 @@ class AssignerResult(BaseModel):
                     "When success is False, error_message must not be None."
                 )
         return self
+
+
+class AssignerCascadeResult(BaseModel):
+    """
+    The result of running every assigner affected by a set of changed fields.
+    """
+
+    success: bool = True
+    """
+    Whether every assigner that ran succeeded.
+    """
+    assigned_fields: dict = {}
+    """
+    The assigned RVs of all assigners that ran, with their values.
+    """
+    timings: dict[str, float] = {}
+    """
+    Wall-clock seconds spent in each assigner that ran, in execution order.
+    """
+    errors: dict[str, str] = {}
+    """
+    The error message of each assigner that failed.
+    """
+    skipped: list[str] = []
+    """
+    Affected assigners that did not run because a dependent field was missing
+    or was assigned by a failed assigner.
+    """
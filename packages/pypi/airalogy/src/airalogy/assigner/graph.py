@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Literal, Optional
 
+from airalogy.markdown.lexer import LineIndex
+
 AssignerGraphRuntime = Literal["client", "server"]
 CLIENT_ASSIGNER_FORBIDDEN_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (
@@ -68,20 +70,8 @@ class AssignerGraphValidationError(ValueError):
         self.node = node
 
 
-def _position_from_offset(content: str, offset: int, length: int) -> GraphPosition:
-    span_text = content[offset : offset + length]
-    newlines_in_span = span_text.count("\n")
-    start_line = content[:offset].count("\n") + 1
-    end_line = start_line + newlines_in_span
-    line_start = content.rfind("\n", 0, offset) + 1
-    start_col = offset - line_start + 1
-
-    if newlines_in_span > 0:
-        last_newline_in_span = span_text.rfind("\n")
-        end_col = length - last_newline_in_span - 1
-    else:
-        end_col = start_col + length - 1
-
+def _position_from_offset(line_index: LineIndex, offset: int, length: int) -> GraphPosition:
+    start_line, end_line, start_col, end_col = line_index.span(offset, length)
     return GraphPosition(
         start_line=start_line,
         end_line=end_line,
@@ -598,6 +588,7 @@ def extract_server_assigner_graph_nodes_from_python(
 
 def extract_assigner_graph_nodes_from_aimd(aimd_content: str) -> list[AssignerGraphNode]:
     nodes: list[AssignerGraphNode] = []
+    line_index = LineIndex(aimd_content)
 
     for match in CODE_BLOCK_PATTERN.finditer(aimd_content):
         lang = (match.group("lang") or "").strip().lower()
@@ -606,7 +597,7 @@ def extract_assigner_graph_nodes_from_aimd(aimd_content: str) -> list[AssignerGr
 
         meta = (match.group("meta") or "").strip()
         code = match.group("code").rstrip("\n\r")
-        position = _position_from_offset(aimd_content, match.start(), len(match.group(0)))
+        position = _position_from_offset(line_index, match.start(), len(match.group(0)))
         code_start_line = position.start_line
 
         if re.search(
@@ -165,6 +165,9 @@ def pack_command(args):
                     input_paths,
                     output_path=args.output,
                     force=args.force,
+                    workers=args.workers,
+                    compression=args.compression,
+                    compression_level=args.compression_level,
                 )
                 print(f"✓ Packed protocols archive: {output_path}")
                 return 0
@@ -172,6 +175,9 @@ def pack_command(args):
                 input_paths[0],
                 output_path=args.output,
                 force=args.force,
+                workers=args.workers,
+                compression=args.compression,
+                compression_level=args.compression_level,
             )
             print(f"✓ Packed protocol archive: {output_path}")
             return 0
@@ -194,6 +200,9 @@ def pack_command(args):
             protocol_dirs=args.protocol_dir,
             file_payloads=file_payloads,
             force=args.force,
+            workers=args.workers,
+            compression=args.compression,
+            compression_level=args.compression_level,
         )
         print(f"✓ Packed records archive: {output_path}")
         return 0
@@ -490,6 +499,30 @@ def main():
             "payload paths to store under blobs/. Can be passed multiple times."
         ),
     )
+    pack_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Hash and compress archive members in this many threads. "
+            "Defaults to a single thread."
+        ),
+    )
+    pack_parser.add_argument(
+        "--compression",
+        choices=["deflate", "store"],
+        default="deflate",
+        help=(
+            "Compression for archive members. Already-compressed files such as "
+            "images, videos, PDFs, and Office documents are always stored as-is."
+        ),
+    )
+    pack_parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Deflate level from 0 (fastest) to 9 (smallest). Defaults to 6.",
+    )
     pack_parser.set_defaults(func=pack_command)
 
     # Unpack command
@@ -10,7 +10,7 @@ from typing import Any, Iterable, Literal, Mapping
 
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 
-from .markdown import generate_model, parse_aimd
+from .markdown import get_aimd_cache
 from .markdown.model_sync import (
     load_var_model_from_path,
     merge_var_models,
@@ -159,7 +159,7 @@ def _load_protocol_context(
             )
         aimd_content = aimd_path.read_text(encoding="utf-8")
 
-    parsed_aimd = parse_aimd(aimd_content)
+    parsed_aimd = get_aimd_cache().parse_aimd(aimd_content)
     model = var_model or _load_var_model(protocol_path, aimd_content)
     if not isinstance(model, type) or not issubclass(model, BaseModel):
         raise TypeError("var_model must be a pydantic BaseModel subclass.")
@@ -180,23 +180,11 @@ def _load_var_model(protocol_dir: Path | None, aimd_content: str) -> type[BaseMo
     if protocol_dir is not None:
         model_path = protocol_dir / "model.py"
         if model_path.is_file():
-            aimd_model = _generate_var_model(aimd_content)
+            aimd_model = get_aimd_cache().get_var_model(aimd_content)
             override_model = load_var_model_from_path(model_path)
             return merge_var_models(aimd_model, override_model)
 
-    return _generate_var_model(aimd_content)
-
-
-def _generate_var_model(aimd_content: str) -> type[BaseModel]:
-    namespace: dict[str, Any] = {"__name__": "_airalogy_ingest_generated_model"}
-    exec(
-        compile(generate_model(aimd_content), "<airalogy generated VarModel>", "exec"),
-        namespace,
-    )
-    model = namespace.get("VarModel")
-    if model is None:
-        raise ValueError("Generated model code did not define VarModel.")
-    return model
+    return get_aimd_cache().get_var_model(aimd_content)
 
 
 def _load_protocol_metadata(protocol_dir: Path | None) -> dict[str, Any]:
@@ -30,20 +30,23 @@ from .errors import (
     InvalidSyntaxError,
     TypeAnnotationError,
 )
-from .lexer import Lexer
+from .lexer import Lexer, LineIndex
 from .model_generator import generate_model
 from .parser import AimdParser, extract_assigner_blocks, parse_aimd
 from .parser.connectors import parse_connectors_content
 from .parser.collectors import parse_collectors_content
 from .parser.workflow import is_aimd_workflow_reference, parse_workflow_content
-from .tokens import Position, Token, TokenType
+from .tokens import CodeBlock, Position, Token, TokenType
 from .get import get_airalogy_image_ids
 from .validator import AimdValidator, ValidationError, validate_aimd
+from .cache import AimdCache, AimdCacheInfo, configure_aimd_cache, get_aimd_cache
 
 __all__ = [
     # Parser
     "AimdParser",
     "Lexer",
+    "LineIndex",
+    "CodeBlock",
     "Token",
     "TokenType",
     "Position",
@@ -82,6 +85,11 @@ __all__ = [
     "validate_aimd",
     # Model generation
     "generate_model",
+    # Caching
+    "AimdCache",
+    "AimdCacheInfo",
+    "configure_aimd_cache",
+    "get_aimd_cache",
     # Markdown helpers
     "get_airalogy_image_ids",
 ]
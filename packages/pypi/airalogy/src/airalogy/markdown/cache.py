@@ -0,0 +1,309 @@
+"""
+Content-addressed cache for AIMD parse results and generated VarModels.
+
+Entries are keyed by the SHA-256 of the AIMD content, so repeated parsing,
+model generation or validation of an unchanged protocol is a hash lookup.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from airalogy import __version__
+from airalogy.types.registry import get_airalogy_type_registry
+
+from .model_generator import _generate_model
+from .parser.core import _parse_aimd
+from .validator import ValidationError, _validate_aimd
+
+# Only JSON-serializable entry kinds are persisted to the on-disk cache.
+_PERSISTED_KINDS = {"parse", "model_source"}
+_DISK_FILE_PREFIX = "aimd-"
+
+
+@dataclass(frozen=True)
+class AimdCacheInfo:
+    """Hit/miss counters and occupancy of an AimdCache."""
+
+    hits: int
+    misses: int
+    disk_hits: int
+    maxsize: int
+    currsize: int
+
+
+class AimdCache:
+    """
+    Bounded LRU cache for AIMD parse results, VarModel source and VarModel classes.
+
+    Parse results are returned as deep copies, so callers may mutate them
+    freely. Compiled VarModel classes are shared between callers.
+
+    When `cache_dir` is set, parse results and generated VarModel source are
+    also persisted as JSON files and reloaded on in-process misses.
+    """
+
+    def __init__(self, maxsize: int = 128, cache_dir: Optional[str | Path] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of in-process entries across all kinds
+            cache_dir: Optional directory for persisted entries
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+
+    @staticmethod
+    def content_hash(aimd_content: str) -> str:
+        """Return the cache key digest for AIMD content."""
+        return hashlib.sha256(aimd_content.encode("utf-8")).hexdigest()
+
+    def parse_aimd(self, aimd_content: str) -> dict:
+        """
+        Cached equivalent of `parse_aimd`.
+
+        Args:
+            aimd_content: AIMD document content
+
+        Returns:
+            Dictionary containing parsed templates in dictionary format.
+        """
+        result = self._get_or_compute(
+            "parse",
+            self.content_hash(aimd_content),
+            lambda: _parse_aimd(aimd_content),
+        )
+        return copy.deepcopy(result)
+
+    def generate_model(self, aimd_content: str) -> str:
+        """
+        Cached equivalent of `generate_model`.
+
+        Args:
+            aimd_content: AIMD document content
+
+        Returns:
+            Python code for VarModel
+        """
+        return self._get_or_compute(
+            "model_source",
+            self._model_key(aimd_content),
+            lambda: _generate_model(aimd_content),
+        )
+
+    def get_var_model(self, aimd_content: str) -> type[BaseModel]:
+        """
+        Get the compiled VarModel class generated from AIMD content.
+
+        Args:
+            aimd_content: AIMD document content
+
+        Returns:
+            VarModel class shared by every caller with the same content
+        """
+        return self._get_or_compute(
+            "model_class",
+            self._model_key(aimd_content),
+            lambda: _compile_var_model(self.generate_model(aimd_content)),
+        )
+
+    def validate_aimd(
+        self,
+        aimd_content: str,
+        protocol_dir: Optional[str | Path] = None,
+    ) -> Tuple[bool, List[ValidationError]]:
+        """
+        Cached equivalent of `validate_aimd`.
+
+        When `protocol_dir` is given, the key also covers every Python file in
+        it, since `model.py` and `assigner.py` take part in validation and may
+        import their neighbours. Modules imported from outside `protocol_dir`
+        are not covered; call `invalidate` after changing them.
+
+        Args:
+            aimd_content: AIMD document content
+            protocol_dir: Optional protocol directory
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        digest = self.content_hash(aimd_content)
+        if protocol_dir is not None:
+            digest = f"{digest}:{_python_files_digest(Path(protocol_dir))}"
+
+        is_valid, errors = self._get_or_compute(
+            "validate",
+            digest,
+            lambda: _validate_aimd(aimd_content, protocol_dir=protocol_dir),
+        )
+        return is_valid, list(errors)
+
+    def invalidate(self, aimd_content: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            aimd_content: Content whose entries to drop; drops everything when None
+        """
+        digest = self.content_hash(aimd_content) if aimd_content is not None else None
+        with self._lock:
+            if digest is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[1].startswith(digest)]:
+                    del self._entries[key]
+
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return
+        pattern = f"{_DISK_FILE_PREFIX}*-{digest}*.json" if digest else f"{_DISK_FILE_PREFIX}*.json"
+        for path in self.cache_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+
+    def cache_info(self) -> AimdCacheInfo:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return AimdCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                disk_hits=self._disk_hits,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def _model_key(self, aimd_content: str) -> str:
+        # Generated imports depend on the registered Airalogy types.
+        registry = get_airalogy_type_registry()
+        registry_state = repr(
+            [
+                (descriptor.type_name, descriptor.import_from, descriptor.aliases)
+                for descriptor in registry.iter_descriptors()
+            ]
+        )
+        registry_digest = hashlib.sha256(registry_state.encode("utf-8")).hexdigest()[:16]
+        return f"{self.content_hash(aimd_content)}-{registry_digest}"
+
+    def _get_or_compute(self, kind: str, digest: str, compute: Callable[[], Any]) -> Any:
+        key = (kind, digest)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        value = self._load_from_disk(kind, digest)
+        if value is None:
+            value = compute()
+            self._store_to_disk(kind, digest, value)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _disk_path(self, kind: str, digest: str) -> Optional[Path]:
+        if self.cache_dir is None or kind not in _PERSISTED_KINDS:
+            return None
+        return self.cache_dir / f"{_DISK_FILE_PREFIX}{kind}-{digest}-{__version__}.json"
+
+    def _load_from_disk(self, kind: str, digest: str) -> Any:
+        path = self._disk_path(kind, digest)
+        if path is None or not path.is_file():
+            return None
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with self._lock:
+            self._disk_hits += 1
+        return value
+
+    def _store_to_disk(self, kind: str, digest: str, value: Any) -> None:
+        path = self._disk_path(kind, digest)
+        if path is None:
+            return
+        try:
+            payload = json.dumps({"value": value}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        # Skip values that would not survive a JSON round trip unchanged.
+        if json.loads(payload)["value"] != value:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(payload, encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+def _python_files_digest(protocol_dir: Path) -> str:
+    hasher = hashlib.sha256()
+    paths = sorted(protocol_dir.rglob("*.py")) if protocol_dir.is_dir() else []
+    for path in paths:
+        if "__pycache__" in path.parts or not path.is_file():
+            continue
+        name = path.relative_to(protocol_dir).as_posix().encode("utf-8")
+        content = path.read_bytes()
+        hasher.update(f"{len(name)}:{len(content)}:".encode("ascii"))
+        hasher.update(name)
+        hasher.update(content)
+    return hasher.hexdigest()
+
+
+def _compile_var_model(model_code: str) -> type[BaseModel]:
+    namespace: dict[str, Any] = {"__name__": "_airalogy_cached_generated_model"}
+    exec(compile(model_code, "<airalogy generated VarModel>", "exec"), namespace)
+    model = namespace.get("VarModel")
+    if model is None:
+        raise ValueError("Generated model code did not define VarModel.")
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        raise TypeError("Generated VarModel must be a pydantic BaseModel subclass.")
+    return model
+
+
+_DEFAULT_CACHE = AimdCache()
+
+
+def get_aimd_cache() -> AimdCache:
+    """Return the process-wide AIMD cache."""
+    return _DEFAULT_CACHE
+
+
+def configure_aimd_cache(
+    maxsize: int = 128,
+    cache_dir: Optional[str | Path] = None,
+) -> AimdCache:
+    """
+    Replace the process-wide AIMD cache.
+
+    Args:
+        maxsize: Maximum number of in-process entries across all kinds
+        cache_dir: Optional directory for persisted entries
+
+    Returns:
+        The new process-wide cache
+    """
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = AimdCache(maxsize=maxsize, cache_dir=cache_dir)
+    return _DEFAULT_CACHE
@@ -3,9 +3,74 @@ Lexer for AIMD syntax - tokenizes AIMD content.
 """
 
 import re
+from bisect import bisect_right
 from typing import Iterator
 
-from .tokens import Position, Token, TokenType
+from .tokens import CodeBlock, Position, Token, TokenType
+
+
+class LineIndex:
+    """
+    Line-start index for converting content offsets to line/column positions.
+
+    The index is built once per document, so each lookup is a binary search
+    instead of a rescan of the content preceding the offset.
+    """
+
+    def __init__(self, content: str):
+        """
+        Build the line-start index for content.
+
+        Args:
+            content: Document content
+        """
+        self.line_starts = [0]
+        newline = content.find("\n")
+        while newline != -1:
+            self.line_starts.append(newline + 1)
+            newline = content.find("\n", newline + 1)
+
+    def span(self, offset: int, length: int) -> tuple[int, int, int, int]:
+        """
+        Convert an offset span to 1-indexed line/column coordinates.
+
+        Args:
+            offset: Start offset in content
+            length: Length of the span
+
+        Returns:
+            Tuple of (start_line, end_line, start_col, end_col)
+        """
+        end = offset + length
+        start_line = bisect_right(self.line_starts, offset)
+        end_line = bisect_right(self.line_starts, end, lo=start_line - 1)
+        start_col = offset - self.line_starts[start_line - 1] + 1
+
+        if end_line > start_line:
+            end_col = end - self.line_starts[end_line - 1]
+        else:
+            end_col = start_col + length - 1
+
+        return start_line, end_line, start_col, end_col
+
+    def position(self, offset: int, length: int) -> Position:
+        """
+        Convert an offset span to a Position.
+
+        Args:
+            offset: Start offset in content
+            length: Length of the span
+
+        Returns:
+            Position object with row and column info
+        """
+        start_line, end_line, start_col, end_col = self.span(offset, length)
+        return Position(
+            start_line=start_line,
+            end_line=end_line,
+            start_col=start_col,
+            end_col=end_col,
+        )
 
 
 class Lexer:
@@ -16,7 +81,8 @@ class Lexer:
     expressions like {{var|...}}, {{step|...}}, etc.
 
     Code blocks (both inline with backticks and multi-line with triple backticks)
-    are skipped and not parsed as template expressions.
+    are skipped and not parsed as template expressions. Fenced code blocks are
+    scanned once and grouped by language for the block parsers.
     """
 
     # Template start pattern: {{type|content}}
@@ -58,7 +124,43 @@ class Lexer:
         """
         self.content = content
         self.lines = content.splitlines(keepends=True)
+        self.line_index = LineIndex(content)
+        self.code_blocks = self._scan_code_blocks()
+        self._code_blocks_by_lang: dict[str, list[CodeBlock]] = {}
+        for block in self.code_blocks:
+            self._code_blocks_by_lang.setdefault(block.lang.lower(), []).append(block)
         self._excluded_ranges = self._find_excluded_ranges()
+        self._excluded_starts = [start for start, _ in self._excluded_ranges]
+
+    def _scan_code_blocks(self) -> list[CodeBlock]:
+        """
+        Find all fenced code blocks in a single pass over the content.
+
+        Returns:
+            List of CodeBlock objects in document order
+        """
+        return [
+            CodeBlock(
+                lang=match.group("lang") or "",
+                meta=(match.group("meta") or "").strip(),
+                code=match.group("code"),
+                start=match.start(),
+                end=match.end(),
+            )
+            for match in self.CODE_BLOCK_PATTERN.finditer(self.content)
+        ]
+
+    def get_code_blocks(self, lang: str) -> list[CodeBlock]:
+        """
+        Get fenced code blocks with the given language tag.
+
+        Args:
+            lang: Language tag, matched case-insensitively
+
+        Returns:
+            List of CodeBlock objects in document order
+        """
+        return self._code_blocks_by_lang.get(lang.lower(), [])
 
     def _find_excluded_ranges(self) -> list[tuple[int, int]]:
         """
@@ -69,9 +171,9 @@ class Lexer:
         """
         excluded_ranges = []
 
-        # Find multi-line code blocks
-        for match in self.CODE_BLOCK_PATTERN.finditer(self.content):
-            excluded_ranges.append((match.start(), match.end()))
+        # Multi-line code blocks
+        for block in self.code_blocks:
+            excluded_ranges.append((block.start, block.end))
 
         # Find inline code blocks
         for match in self.INLINE_CODE_PATTERN.finditer(self.content):
@@ -100,11 +202,10 @@ class Lexer:
         Returns:
             True if the range is within an excluded range, False otherwise
         """
-        end = offset + length
-        for start, excl_end in self._excluded_ranges:
-            if offset >= start and end <= excl_end:
-                return True
-        return False
+        index = bisect_right(self._excluded_starts, offset) - 1
+        if index < 0:
+            return False
+        return offset + length <= self._excluded_ranges[index][1]
 
     def _get_position(self, offset: int, length: int) -> Position:
         """
@@ -117,33 +218,7 @@ class Lexer:
         Returns:
             Position object with row and column info
         """
-        # Count newlines in the token to determine if it spans multiple lines
-        token_text = self.content[offset : offset + length]
-        newlines_in_token = token_text.count("\n")
-
-        # Find the starting line (1-indexed)
-        start_line = self.content[:offset].count("\n") + 1
-        end_line = start_line + newlines_in_token
-
-        # Find start of current line for start_col (1-indexed)
-        line_start = self.content.rfind("\n", 0, offset) + 1
-        start_col = offset - line_start + 1
-
-        # Find end_col
-        if newlines_in_token > 0:
-            # If multi-line, end_col is from the last newline
-            last_newline_in_token = token_text.rfind("\n")
-            end_col = length - last_newline_in_token - 1
-        else:
-            # Single line
-            end_col = start_col + length - 1
-
-        return Position(
-            start_line=start_line,
-            end_line=end_line,
-            start_col=start_col,
-            end_col=end_col,
-        )
+        return self.line_index.position(offset, length)
 
     def _is_escaped(self, offset: int) -> bool:
         slash_count = 0
@@ -372,5 +372,11 @@ def generate_model(aimd_content: str) -> str:
         >>> code = generate_model(aimd_content)
         >>> print(code)
     """
+    from .cache import get_aimd_cache
+
+    return get_aimd_cache().generate_model(aimd_content)
+
+
+def _generate_model(aimd_content: str) -> str:
     generator = ModelGenerator(aimd_content)
     return generator.generate_model()
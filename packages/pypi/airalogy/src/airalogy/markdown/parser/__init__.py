@@ -25,8 +25,8 @@ from ..errors import (
     InvalidNameError,
     InvalidSyntaxError,
 )
-from ..lexer import Lexer
-from ..tokens import Position, Token, TokenType
+from ..lexer import Lexer, LineIndex
+from ..tokens import CodeBlock, Position, Token, TokenType
 from .core import AimdParser, extract_assigner_blocks, parse_aimd
 from .connectors import parse_connectors_content
 from .collectors import parse_collectors_content
@@ -62,7 +62,9 @@ __all__ = [
     "InvalidNameError",
     "InvalidSyntaxError",
     "Lexer",
+    "LineIndex",
     "Position",
+    "CodeBlock",
     "Token",
     "TokenType",
 ]
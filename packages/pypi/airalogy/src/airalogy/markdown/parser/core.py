@@ -26,7 +26,7 @@ from ..errors import (
     InvalidNameError,
 )
 from ..lexer import Lexer
-from ..tokens import Position, Token, TokenType
+from ..tokens import CodeBlock, Position, Token, TokenType
 from .common import BLANK_PLACEHOLDER_PATTERN, NAME_PATTERN
 from .connectors import parse_connectors_content
 from .collectors import parse_collectors_content
@@ -154,27 +154,19 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
         Returns:
             Position object with row and column info
         """
-        span_text = self.content[offset : offset + length]
-        newlines_in_span = span_text.count("\n")
+        return self.lexer.line_index.position(offset, length)
 
-        start_line = self.content[:offset].count("\n") + 1
-        end_line = start_line + newlines_in_span
-
-        line_start = self.content.rfind("\n", 0, offset) + 1
-        start_col = offset - line_start + 1
+    def _get_code_block_position(self, block: CodeBlock) -> Position:
+        """
+        Get the position of a fenced code block, including its fences.
 
-        if newlines_in_span > 0:
-            last_newline_in_span = span_text.rfind("\n")
-            end_col = length - last_newline_in_span - 1
-        else:
-            end_col = start_col + length - 1
+        Args:
+            block: Code block from the lexer
 
-        return Position(
-            start_line=start_line,
-            end_line=end_line,
-            start_col=start_col,
-            end_col=end_col,
-        )
+        Returns:
+            Position object with row and column info
+        """
+        return self._get_position_from_offset(block.start, block.end - block.start)
 
     def _parse_assigner_blocks(self) -> List[AssignerBlockNode]:
         """
@@ -184,22 +176,19 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
             List of AssignerBlockNode objects.
         """
         blocks: List[AssignerBlockNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = match.group("lang") or ""
-            if lang != "assigner":
+        for block in self.lexer.get_code_blocks("assigner"):
+            if block.lang != "assigner":
                 continue
 
-            meta = (match.group("meta") or "").strip()
             if re.search(
                 r"""(?:^|\s)runtime\s*=\s*(?:"client"|'client'|client)(?:\s|$)""",
-                meta,
+                block.meta,
             ):
                 continue
 
-            raw = match.group(0)
-            code = match.group("code").rstrip("\n\r")
+            code = block.code.rstrip("\n\r")
             code = textwrap.dedent(code)
-            position = self._get_position_from_offset(match.start(), len(raw))
+            position = self._get_code_block_position(block)
             blocks.append(AssignerBlockNode(position=position, code=code))
 
         return blocks
@@ -212,15 +201,10 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
             List of ReferenceNode objects.
         """
         references: List[ReferenceNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip().lower()
-            if lang != "refs":
-                continue
-
-            raw = match.group(0)
-            code = match.group("code").rstrip("\n\r")
+        for block in self.lexer.get_code_blocks("refs"):
+            code = block.code.rstrip("\n\r")
             code = textwrap.dedent(code)
-            position = self._get_position_from_offset(match.start(), len(raw))
+            position = self._get_code_block_position(block)
             references.extend(parse_refs_content(code, position))
 
         return references
@@ -233,14 +217,9 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
             List of ConnectorsNode objects.
         """
         blocks: List[ConnectorsNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip().lower()
-            if lang != "connectors":
-                continue
-
-            raw = match.group(0)
-            code = textwrap.dedent(match.group("code").rstrip("\n\r"))
-            position = self._get_position_from_offset(match.start(), len(raw))
+        for block in self.lexer.get_code_blocks("connectors"):
+            code = textwrap.dedent(block.code.rstrip("\n\r"))
+            position = self._get_code_block_position(block)
             blocks.append(parse_connectors_content(code, position))
 
         return blocks
@@ -249,14 +228,9 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
         """Extract Collector registry code blocks from AIMD content."""
 
         blocks: List[CollectorsNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip().lower()
-            if lang != "collectors":
-                continue
-
-            raw = match.group(0)
-            code = textwrap.dedent(match.group("code").rstrip("\n\r"))
-            position = self._get_position_from_offset(match.start(), len(raw))
+        for block in self.lexer.get_code_blocks("collectors"):
+            code = textwrap.dedent(block.code.rstrip("\n\r"))
+            position = self._get_code_block_position(block)
             blocks.append(parse_collectors_content(code, position))
 
         return blocks
@@ -365,14 +339,9 @@ class AimdParser(VarParserMixin, QuizParserMixin, StepParserMixin, WorkflowParse
             List of MediaNode objects.
         """
         media_items: List[MediaNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip().lower()
-            if lang != "media":
-                continue
-
-            raw = match.group(0)
-            code = textwrap.dedent(match.group("code").rstrip("\n\r"))
-            position = self._get_position_from_offset(match.start(), len(raw))
+        for block in self.lexer.get_code_blocks("media"):
+            code = textwrap.dedent(block.code.rstrip("\n\r"))
+            position = self._get_code_block_position(block)
 
             try:
                 parsed = yaml.safe_load(code) if code.strip() else {}
@@ -627,6 +596,8 @@ def parse_aimd(aimd_content: str) -> dict:
     """
     Parse AIMD content into a dictionary structure.
 
+    Results are cached by content in the process-wide AIMD cache.
+
     Args:
         aimd_content: AIMD document content
 
@@ -636,6 +607,12 @@ def parse_aimd(aimd_content: str) -> dict:
     Raises:
         AimdParseError: If parsing fails
     """
+    from ..cache import get_aimd_cache
+
+    return get_aimd_cache().parse_aimd(aimd_content)
+
+
+def _parse_aimd(aimd_content: str) -> dict:
     parser = AimdParser(aimd_content)
     result = parser.parse()
 
@@ -672,6 +649,7 @@ def parse_aimd(aimd_content: str) -> dict:
         },
     }
 
+
 def extract_assigner_blocks(aimd_content: str) -> list[dict]:
     """
     Extract inline assigner blocks from AIMD content.
@@ -682,6 +660,4 @@ def extract_assigner_blocks(aimd_content: str) -> list[dict]:
     Returns:
         List of assigner block dictionaries.
     """
-    parser = AimdParser(aimd_content)
-    result = parser.parse()
-    return [block.to_dict() for block in result["templates"]["assigner"]]
+    return parse_aimd(aimd_content)["templates"]["assigner"]
@@ -1662,15 +1662,13 @@ class QuizParserMixin:
         Extract and parse `quiz` code blocks into QuizNode objects.
         """
         quiz_vars: List[QuizNode] = []
-        for match in self.lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip()
-            if lang != "quiz":
+        for block in self.lexer.get_code_blocks("quiz"):
+            if block.lang != "quiz":
                 continue
 
-            raw = match.group(0)
-            code = match.group("code").rstrip("\n\r")
+            code = block.code.rstrip("\n\r")
             code = textwrap.dedent(code)
-            position = self._get_position_from_offset(match.start(), len(raw))
+            position = self._get_code_block_position(block)
             quiz_var = self._parse_quiz_block(code, position)
             if quiz_var is not None:
                 quiz_vars.append(quiz_var)
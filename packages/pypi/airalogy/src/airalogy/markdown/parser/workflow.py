@@ -10,7 +10,6 @@ import yaml
 
 from ..ast_nodes import WorkflowNode
 from ..errors import InvalidSyntaxError
-from ..lexer import Lexer
 from ..tokens import Position
 
 WORKFLOW_VERSION = "airalogy.workflow.v1"
@@ -485,14 +484,9 @@ class WorkflowParserMixin:
 
     def _parse_workflow_blocks(self) -> List[WorkflowNode]:
         workflows: List[WorkflowNode] = []
-        for match in Lexer.CODE_BLOCK_PATTERN.finditer(self.content):
-            lang = (match.group("lang") or "").strip().lower()
-            if lang != "workflow":
-                continue
-
-            raw = match.group(0)
-            code = textwrap.dedent(match.group("code").rstrip("\n\r"))
-            position = self._get_position_from_offset(match.start(), len(raw))
+        for block in self.lexer.get_code_blocks("workflow"):
+            code = textwrap.dedent(block.code.rstrip("\n\r"))
+            position = self._get_code_block_position(block)
             try:
                 workflows.append(parse_workflow_content(code, position))
             except InvalidSyntaxError as exc:
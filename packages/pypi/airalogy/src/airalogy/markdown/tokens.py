@@ -52,3 +52,17 @@ class Token:
 
     def __repr__(self) -> str:
         return f"Token({self.type.name}, {self.value!r}, {self.position})"
+
+
+@dataclass
+class CodeBlock:
+    """A fenced code block in the AIMD document."""
+
+    lang: str  # Language tag as written after the opening fence
+    meta: str  # Remaining info string after the language tag
+    code: str  # Block body without the fences
+    start: int  # Offset of the opening fence
+    end: int  # Offset just after the closing fence
+
+    def __repr__(self) -> str:
+        return f"CodeBlock({self.lang!r}, {self.start}-{self.end})"
@@ -209,8 +209,13 @@ def validate_aimd(
     """
     Validate AIMD content.
 
+    Results are cached in the process-wide AIMD cache, keyed by the content
+    and the Python files of `protocol_dir`.
+
     Args:
         aimd_content: AIMD document content
+        protocol_dir: Optional protocol directory whose model.py and assigner.py
+            are checked against the AIMD content
 
     Returns:
         Tuple of (is_valid, list_of_errors)
@@ -221,5 +226,14 @@ def validate_aimd(
         ...     for error in errors:
         ...         print(error)
     """
+    from .cache import get_aimd_cache
+
+    return get_aimd_cache().validate_aimd(aimd_content, protocol_dir=protocol_dir)
+
+
+def _validate_aimd(
+    aimd_content: str,
+    protocol_dir: Optional[str | Path] = None,
+) -> Tuple[bool, List[ValidationError]]:
     validator = AimdValidator(aimd_content, protocol_dir=protocol_dir)
     return validator.validate()
@@ -9,7 +9,7 @@ from typing import Any, Iterable
 
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 
-from airalogy.markdown import generate_model, parse_aimd, validate_aimd
+from airalogy.markdown import get_aimd_cache
 from airalogy.markdown.model_sync import (
     load_var_model_from_path,
     merge_var_models,
@@ -381,12 +381,13 @@ def _load_protocol_context(
     if not aimd_path.is_file():
         raise ValueError(f"Protocol directory '{protocol_path}' must contain protocol.aimd.")
     aimd_content = aimd_path.read_text(encoding="utf-8")
-    is_valid, aimd_errors = validate_aimd(aimd_content, protocol_dir=protocol_path)
+    aimd_cache = get_aimd_cache()
+    is_valid, aimd_errors = aimd_cache.validate_aimd(aimd_content, protocol_dir=protocol_path)
     if not is_valid:
         messages = "; ".join(str(error) for error in aimd_errors)
         raise ValueError(f"Protocol '{protocol_path}' failed validation: {messages}")
 
-    parsed_aimd = parse_aimd(aimd_content)
+    parsed_aimd = aimd_cache.parse_aimd(aimd_content)
     var_model = _load_var_model(protocol_path, aimd_content)
     if validate_model_sync:
         validate_var_model_compatible_with_aimd_vars(
@@ -441,16 +442,7 @@ def _select_protocol_context(
 
 
 def _load_var_model(protocol_dir: Path, aimd_content: str) -> type[BaseModel]:
-    namespace: dict[str, Any] = {"__name__": "_airalogy_record_generated_model"}
-    exec(
-        compile(generate_model(aimd_content), "<airalogy generated VarModel>", "exec"),
-        namespace,
-    )
-    generated_model = namespace.get("VarModel")
-    if generated_model is None:
-        raise ValueError("Generated model code did not define VarModel.")
-    if not isinstance(generated_model, type) or not issubclass(generated_model, BaseModel):
-        raise TypeError("Generated VarModel must be a pydantic BaseModel subclass.")
+    generated_model = get_aimd_cache().get_var_model(aimd_content)
 
     model_path = protocol_dir / "model.py"
     if model_path.is_file():
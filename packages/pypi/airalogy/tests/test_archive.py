@@ -1,13 +1,17 @@
 import hashlib
 import json
+import os
+import random
 import zipfile
 from pathlib import Path
 
 import pytest
 
+from airalogy import archive as archive_module
 from airalogy.archive import (
     ARCHIVE_MANIFEST_PATH,
     ArchiveError,
+    ArchiveReader,
     inspect_archive,
     load_file_payload_specs,
     pack_protocol_archive,
@@ -36,6 +40,7 @@ def _write_protocol(protocol_dir: Path, *, protocol_id: str, version: str, name:
     (protocol_dir / "files").mkdir(exist_ok=True)
     (protocol_dir / "files" / "notes.txt").write_text("protocol asset")
     (protocol_dir / ".env").write_text("API_KEY=secret\n")
+    (protocol_dir / ".aimd_model.sha256").write_text("0" * 64)
     (protocol_dir / "__pycache__").mkdir(exist_ok=True)
     (protocol_dir / "__pycache__" / "model.cpython-313.pyc").write_bytes(b"compiled")
 
@@ -63,6 +68,7 @@ def test_pack_protocol_archive_round_trip(tmp_path: Path):
         assert "protocol.toml" in names
         assert "files/notes.txt" in names
         assert ".env" not in names
+        assert ".aimd_model.sha256" not in names
         assert "__pycache__/model.cpython-313.pyc" not in names
 
         manifest = json.loads(archive.read(ARCHIVE_MANIFEST_PATH).decode("utf-8"))
@@ -384,6 +390,413 @@ def test_pack_records_archive_with_reference_only_file_payload(tmp_path: Path):
     assert issues == []
 
 
+def test_pack_records_archive_streams_file_payloads_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(archive_module, "_COPY_CHUNK_SIZE", 64)
+    read_sizes: list[int] = []
+    original_open = Path.open
+
+    def tracking_open(self, mode="r", *args, **kwargs):
+        handle = original_open(self, mode, *args, **kwargs)
+        if self.name.startswith("scan") and "b" in mode:
+            original_read = handle.read
+
+            def read(size=-1):
+                read_sizes.append(size)
+                return original_read(size)
+
+            handle.read = read
+        return handle
+
+    monkeypatch.setattr(Path, "open", tracking_open)
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo"},
+                "data": {"var": {}},
+            }
+        )
+    )
+    payload = bytes(range(256)) * 40
+    scan_a = tmp_path / "scan-a.bin"
+    scan_b = tmp_path / "scan-b.bin"
+    scan_a.write_bytes(payload)
+    scan_b.write_bytes(payload)
+    archive_path = tmp_path / "records-streamed.aira"
+    pack_records_archive(
+        [records_file],
+        archive_path,
+        file_payloads=[
+            {"path": str(scan_a), "file_id": "airalogy.id.file.scan-a.bin"},
+            {"path": str(scan_b), "file_id": "airalogy.id.file.scan-b.bin"},
+        ],
+    )
+
+    assert read_sizes.count(64) > len(payload) // 64
+    # Apart from the chunks, each payload is sampled once to decide whether to deflate it.
+    assert set(read_sizes) == {64, archive_module._COMPRESSION_PROBE_SIZE}
+    with zipfile.ZipFile(archive_path) as archive:
+        manifest = json.loads(archive.read(ARCHIVE_MANIFEST_PATH).decode("utf-8"))
+        blob = manifest["blobs"][0]
+        assert len(manifest["blobs"]) == 1
+        assert blob["sha256"] == hashlib.sha256(payload).hexdigest()
+        assert blob["size"] == len(payload)
+        assert archive.read(blob["archive_path"]) == payload
+        assert archive.getinfo(blob["archive_path"]).compress_type == zipfile.ZIP_DEFLATED
+    assert [item["blob_id"] for item in manifest["files"]] == [blob["blob_id"]] * 2
+    assert validate_archive(archive_path) == (True, [])
+
+
+def test_pack_records_archive_rejects_file_payload_changed_while_packing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo"},
+                "data": {"var": {}},
+            }
+        )
+    )
+    payload_file = tmp_path / "payload.txt"
+    payload_file.write_text("original")
+    original_sha256_file = archive_module._sha256_file
+
+    def sha256_then_modify(path: Path) -> tuple[str, int]:
+        result = original_sha256_file(path)
+        if path == payload_file:
+            payload_file.write_text("modified")
+        return result
+
+    monkeypatch.setattr(archive_module, "_sha256_file", sha256_then_modify)
+
+    with pytest.raises(ArchiveError, match="changed while packing"):
+        pack_records_archive(
+            [records_file],
+            tmp_path / "records.aira",
+            file_payloads=[{"path": str(payload_file), "file_id": "airalogy.id.file.payload.txt"}],
+        )
+
+
+def test_pack_records_archive_with_workers_matches_sequential_members(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(archive_module, "_COPY_CHUNK_SIZE", 256)
+    protocol_dir = tmp_path / "protocol_demo"
+    _write_protocol(
+        protocol_dir,
+        protocol_id="protocol_demo",
+        version="0.0.1",
+        name="Protocol Demo",
+    )
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo", "protocol_version": "0.0.1"},
+                "data": {"var": {"sample_name": "alpha"}, "step": {}, "check": {}, "quiz": {}},
+            }
+        )
+    )
+    payloads = {
+        "scan.bin": hashlib.sha256(b"seed").digest() * 300,
+        "empty.bin": b"",
+        "notes.txt": b"short note",
+    }
+    file_payloads = []
+    for name, payload in payloads.items():
+        (tmp_path / name).write_bytes(payload)
+        file_payloads.append({"path": str(tmp_path / name), "file_id": f"airalogy.id.file.{name}"})
+
+    def pack(output_name: str, workers: int | None) -> dict[str, bytes]:
+        output = tmp_path / output_name
+        pack_records_archive(
+            [records_file],
+            output,
+            protocol_dirs=[protocol_dir],
+            file_payloads=file_payloads,
+            workers=workers,
+        )
+        assert validate_archive(output) == (True, [])
+        with zipfile.ZipFile(output) as archive:
+            assert archive.testzip() is None
+            return {
+                info.filename: archive.read(info)
+                for info in archive.infolist()
+                if info.filename != ARCHIVE_MANIFEST_PATH
+            }
+
+    sequential = pack("sequential.aira", None)
+    parallel = pack("parallel.aira", 4)
+
+    assert list(parallel) == list(sequential)
+    assert parallel == sequential
+    assert set(payloads.values()) <= set(parallel.values())
+    with pytest.raises(ArchiveError, match="workers must be a positive integer"):
+        pack("invalid.aira", 0)
+
+
+def test_pack_protocol_archive_with_workers_writes_zip64_members(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(archive_module, "_ZIP64_LIMIT", 512)
+    monkeypatch.setattr(archive_module, "_COPY_CHUNK_SIZE", 256)
+    protocol_dir = tmp_path / "protocol_demo"
+    _write_protocol(
+        protocol_dir,
+        protocol_id="protocol_demo",
+        version="0.0.1",
+        name="Protocol Demo",
+    )
+    asset = "\n".join(f"row {index},{index * index}" for index in range(400)).encode()
+    (protocol_dir / "files" / "table.csv").write_bytes(asset)
+
+    output = pack_protocol_archive(protocol_dir, tmp_path / "protocol.aira", workers=2)
+
+    assert validate_archive(output) == (True, [])
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+        info = archive.getinfo("files/table.csv")
+        assert info.extra[:2] == b"\x01\x00"  # zip64 extended information
+        assert info.compress_size < info.file_size
+        assert archive.read(info) == asset
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_pack_records_archive_stores_already_compressed_payloads(
+    tmp_path: Path, workers: int | None
+):
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo"},
+                "data": {"var": {}},
+            }
+        )
+    )
+    payloads = {
+        "photo.png": (os.urandom(8192), None),
+        "clip.dat": (os.urandom(2048), "video/mp4"),
+        "capture.raw": (os.urandom(8192), None),
+        "export.csv": (b"time,value\n" + b"0.0,1.0\n" * 2000, "text/csv"),
+    }
+    file_payloads = []
+    for name, (payload, mime_type) in payloads.items():
+        (tmp_path / name).write_bytes(payload)
+        file_payloads.append(
+            {"path": str(tmp_path / name), "file_id": f"airalogy.id.file.{name}", "mime_type": mime_type}
+        )
+
+    def compress_types(output_name: str, **options) -> dict[str, int]:
+        output = tmp_path / output_name
+        pack_records_archive([records_file], output, file_payloads=file_payloads, **options)
+        assert validate_archive(output) == (True, [])
+        with zipfile.ZipFile(output) as archive:
+            manifest = json.loads(archive.read(ARCHIVE_MANIFEST_PATH).decode("utf-8"))
+            paths = {
+                hashlib.sha256(payload).hexdigest(): name
+                for name, (payload, _mime_type) in payloads.items()
+            }
+            types = {
+                paths[blob["sha256"]]: archive.getinfo(blob["archive_path"]).compress_type
+                for blob in manifest["blobs"]
+            }
+            types["manifest"] = archive.getinfo(ARCHIVE_MANIFEST_PATH).compress_type
+            return types
+
+    assert compress_types("default.aira", workers=workers) == {
+        "photo.png": zipfile.ZIP_STORED,
+        "clip.dat": zipfile.ZIP_STORED,
+        "capture.raw": zipfile.ZIP_STORED,
+        "export.csv": zipfile.ZIP_DEFLATED,
+        "manifest": zipfile.ZIP_DEFLATED,
+    }
+    assert compress_types("level.aira", workers=workers, compression_level=9)["export.csv"] == (
+        zipfile.ZIP_DEFLATED
+    )
+    assert set(compress_types("stored.aira", workers=workers, compression="store").values()) == {
+        zipfile.ZIP_STORED
+    }
+    with pytest.raises(ArchiveError, match="Unsupported archive compression 'lzma'"):
+        compress_types("lzma.aira", compression="lzma")
+    with pytest.raises(ArchiveError, match="compression_level must be an integer from 0 to 9"):
+        compress_types("invalid-level.aira", compression_level=12)
+
+
+def test_blob_payloads_use_the_compression_level(tmp_path: Path):
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo"},
+                "data": {"var": {}},
+            }
+        )
+    )
+    rng = random.Random(0)
+    export = tmp_path / "export.csv"
+    export.write_text(
+        "".join(f"{index},{rng.randint(0, 99)},{rng.choice('abc')}\n" for index in range(20000))
+    )
+    file_payloads = [{"path": str(export), "file_id": "airalogy.id.file.export.csv"}]
+
+    def blob_size(output_name: str, level: int) -> int:
+        output = tmp_path / output_name
+        pack_records_archive(
+            [records_file], output, file_payloads=file_payloads, compression_level=level
+        )
+        with zipfile.ZipFile(output) as archive:
+            manifest = json.loads(archive.read(ARCHIVE_MANIFEST_PATH).decode("utf-8"))
+            return archive.getinfo(manifest["blobs"][0]["archive_path"]).compress_size
+
+    assert blob_size("fast.aira", 1) > blob_size("small.aira", 9)
+
+
+def test_validate_and_unpack_archive_read_blobs_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            {
+                "record_id": "01234567-0123-0123-0123-0123456789ab",
+                "metadata": {"protocol_id": "protocol_demo"},
+                "data": {"var": {}},
+            }
+        )
+    )
+    payload = bytes(range(256)) * 40
+    payload_file = tmp_path / "scan.bin"
+    payload_file.write_bytes(payload)
+    archive_path = tmp_path / "records-chunked.aira"
+    pack_records_archive(
+        [records_file],
+        archive_path,
+        file_payloads=[{"path": str(payload_file), "file_id": "airalogy.id.file.scan.bin"}],
+    )
+
+    monkeypatch.setattr(archive_module, "_COPY_CHUNK_SIZE", 64)
+    reads: list[tuple[str, int]] = []
+    original_read = zipfile.ZipExtFile.read
+
+    def tracking_read(self, n=-1):
+        reads.append((self.name, n))
+        return original_read(self, n)
+
+    monkeypatch.setattr(zipfile.ZipExtFile, "read", tracking_read)
+
+    assert validate_archive(archive_path) == (True, [])
+    unpack_dir, manifest = unpack_archive(archive_path, tmp_path / "unpacked")
+
+    blob_path = manifest["blobs"][0]["archive_path"]
+    assert (unpack_dir / blob_path).read_bytes() == payload
+    blob_reads = [size for name, size in reads if name == blob_path]
+    # Hashing and extraction each read the 10240-byte blob in 64-byte chunks.
+    assert len(blob_reads) > 2 * len(payload) // 64
+    assert set(blob_reads) == {64}
+
+
+def test_archive_reader_reads_single_records_and_blobs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    def record(record_id: str, version: int, protocol_id: str, sample: str) -> dict:
+        return {
+            "record_id": record_id,
+            "record_version": version,
+            "metadata": {"protocol_id": protocol_id},
+            "data": {"var": {"sample_name": sample}},
+        }
+
+    alpha_id = "01234567-0123-0123-0123-0123456789ab"
+    beta_id = "89abcdef-0123-0123-0123-0123456789ab"
+    gamma_id = "fedcba98-0123-0123-0123-0123456789ab"
+    records_file = tmp_path / "records.json"
+    records_file.write_text(
+        json.dumps(
+            [
+                record(alpha_id, 1, "protocol_a", "alpha-v1"),
+                record(alpha_id, 2, "protocol_a", "alpha-v2"),
+                record(beta_id, 1, "protocol_b", "beta"),
+                record(gamma_id, 1, "protocol_a", "gamma"),
+            ]
+        )
+    )
+    payload_file = tmp_path / "scan.bin"
+    payload_file.write_bytes(b"scan bytes" * 100)
+    archive_path = tmp_path / "records.aira"
+    pack_records_archive(
+        [records_file],
+        archive_path,
+        file_payloads=[
+            {"path": str(payload_file), "file_id": "airalogy.id.file.scan.bin", "record_id": beta_id}
+        ],
+    )
+
+    opened: list[str] = []
+    original_open = zipfile.ZipFile.open
+
+    def tracking_open(self, name, *args, **kwargs):
+        opened.append(name if isinstance(name, str) else name.filename)
+        return original_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", tracking_open)
+
+    with ArchiveReader(archive_path) as reader:
+        assert opened == [ARCHIVE_MANIFEST_PATH]
+        assert len(reader.record_entries) == 4
+
+        latest = reader.get_record(alpha_id)
+        assert latest["data"]["var"]["sample_name"] == "alpha-v2"
+        assert reader.get_record(alpha_id, record_version=1)["data"]["var"]["sample_name"] == "alpha-v1"
+        assert opened[1:] == [
+            "records/01234567-0123-0123-0123-0123456789ab.v2.json",
+            "records/01234567-0123-0123-0123-0123456789ab.v1.json",
+        ]
+
+        opened.clear()
+        samples = [
+            item["data"]["var"]["sample_name"]
+            for item in reader.iter_records(
+                lambda entry: entry["record_version"] == 1, protocol_id="protocol_a"
+            )
+        ]
+        assert samples == ["alpha-v1", "gamma"]
+        assert len(opened) == 2
+        assert [item["record_id"] for item in reader.iter_records()] == [
+            alpha_id,
+            alpha_id,
+            beta_id,
+            gamma_id,
+        ]
+
+        blob_id = reader.manifest["blobs"][0]["blob_id"]
+        with reader.open_blob(blob_id) as stream:
+            assert stream.read(10) == b"scan bytes"
+            assert len(stream.read()) == 990
+
+        with pytest.raises(ArchiveError, match="Record 'missing' not found"):
+            reader.get_record("missing")
+        with pytest.raises(ArchiveError, match="version 3 not found"):
+            reader.get_record(alpha_id, record_version=3)
+        with pytest.raises(ArchiveError, match="Blob 'sha256:missing' not found"):
+            reader.open_blob("sha256:missing")
+
+    protocol_dir = tmp_path / "protocol_demo"
+    _write_protocol(protocol_dir, protocol_id="protocol_demo", version="0.0.1", name="Demo")
+    protocol_archive = pack_protocol_archive(protocol_dir, tmp_path / "protocol.aira")
+    with pytest.raises(ArchiveError, match="has kind 'protocol', not 'records'"):
+        ArchiveReader(protocol_archive)
+
+
 def test_validate_archive_detects_blob_hash_mismatch(tmp_path: Path):
     records_file = tmp_path / "records.json"
     records_file.write_text(
@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 from airalogy.assigner import (
@@ -196,6 +199,74 @@ def test_validate_dependency_graph_with_cycle():
             def assign_b(dep): ...
 
 
+class IncrementalAssigner(AssignerBase):
+    pass
+
+
+def test_dependency_graph_is_updated_incrementally():
+    IncrementalAssigner.clear_assigners()
+
+    def register(assigned: str, dependent: str) -> None:
+        def assign(dep: dict) -> AssignerResult:
+            return AssignerResult(assigned_fields={assigned: dep[dependent]})
+
+        assign.__name__ = f"assign_{assigned}"
+        IncrementalAssigner.assigner(
+            assigned_fields=[assigned], dependent_fields=[dependent], mode="auto"
+        )(assign)
+
+    register("inc_b", "inc_a")
+    assert IncrementalAssigner.get_all_dependent_fields_recursive("inc_b") == ["inc_a"]
+    register("inc_c", "inc_b")
+    assert IncrementalAssigner.get_all_dependent_fields_recursive("inc_c") == [
+        "inc_b",
+        "inc_a",
+    ]
+
+    with pytest.raises(ValueError) as exc_info:
+        register("inc_a", "inc_c")
+    assert str(exc_info.value) == (
+        "Circular dependency detected: assign_inc_a -> inc_a -> assign_inc_b"
+        " -> inc_b -> assign_inc_c -> inc_c -> assign_inc_a"
+    )
+    assert "inc_a" not in IncrementalAssigner.assigned_info
+    assert "assign_inc_a" not in IncrementalAssigner.dependency_graph
+
+    incremental_graph = IncrementalAssigner.dependency_graph
+    IncrementalAssigner.build_dependency_graph()
+    assert IncrementalAssigner.dependency_graph == incremental_graph
+    IncrementalAssigner.validate_dependency_graph()
+
+
+class DependencyOrderAssigner(AssignerBase):
+    pass
+
+
+def test_get_all_dependent_fields_recursive_is_breadth_first():
+    DependencyOrderAssigner.clear_assigners()
+
+    def register(assigned: str, dependent: list[str]) -> None:
+        def assign(dep: dict) -> AssignerResult:
+            return AssignerResult(assigned_fields={assigned: len(dep)})
+
+        assign.__name__ = f"assign_{assigned}"
+        DependencyOrderAssigner.assigner(
+            assigned_fields=[assigned], dependent_fields=dependent, mode="auto"
+        )(assign)
+
+    register("d", ["f"])
+    register("b", ["d"])
+    register("c", ["e"])
+    register("a", ["b", "c"])
+
+    expected = ["b", "c", "d", "e", "f"]
+    assert DependencyOrderAssigner.get_all_dependent_fields_recursive("a") == expected
+    # Cached results keep the same order.
+    assert DependencyOrderAssigner.get_all_dependent_fields_recursive("a") == expected
+    all_fields = DependencyOrderAssigner.all_assigned_fields()
+    assert all_fields["a"]["all_dependent_fields"] == expected
+
+
 def test_export_dependency_graph_to_dict():
     data = RvAssigner.export_dependency_graph_to_dict()
     assert "nodes" in data
@@ -449,6 +520,274 @@ def test_readonly_modes_exposed_in_all_assigned_fields():
     assert rfs["rv_readonly_manual"]["mode"] == "manual_readonly"
 
 
+class CascadeAssigner(AssignerBase):
+    @assigner(
+        assigned_fields=["cascade_total"],
+        dependent_fields=["cascade_a", "cascade_b"],
+        mode="auto",
+    )
+    def assign_cascade_total(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={"cascade_total": dep["cascade_a"] + dep["cascade_b"]}
+        )
+
+    @assigner(
+        assigned_fields=["cascade_double"],
+        dependent_fields=["cascade_total"],
+        mode="auto_readonly",
+    )
+    def assign_cascade_double(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={"cascade_double": dep["cascade_total"] * 2}
+        )
+
+    @assigner(
+        assigned_fields=["cascade_label"],
+        dependent_fields=["cascade_total"],
+        mode="auto_first",
+    )
+    def assign_cascade_label(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={"cascade_label": f"total={dep['cascade_total']}"}
+        )
+
+    @assigner(
+        assigned_fields=["cascade_net"],
+        dependent_fields=["cascade_total", "cascade_discount"],
+        mode="manual",
+    )
+    def assign_cascade_net(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={
+                "cascade_net": dep["cascade_total"] - dep["cascade_discount"]
+            }
+        )
+
+    @assigner(
+        assigned_fields=["cascade_ratio"],
+        dependent_fields=["cascade_double", "cascade_divisor"],
+        mode="auto",
+    )
+    def assign_cascade_ratio(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={
+                "cascade_ratio": dep["cascade_double"] / dep["cascade_divisor"]
+            }
+        )
+
+    @assigner(
+        assigned_fields=["cascade_report"],
+        dependent_fields=["cascade_ratio"],
+        mode="auto",
+    )
+    def assign_cascade_report(dep: dict) -> AssignerResult:
+        return AssignerResult(
+            assigned_fields={"cascade_report": f"ratio={dep['cascade_ratio']}"}
+        )
+
+
+def test_assign_cascade_runs_affected_assigners_in_order():
+    data = {"cascade_a": 1, "cascade_b": 2, "cascade_divisor": 4}
+
+    result = CascadeAssigner.assign_cascade(["cascade_a"], data)
+
+    assert result.success
+    assert result.assigned_fields == {
+        "cascade_total": 3,
+        "cascade_double": 6,
+        "cascade_label": "total=3",
+        "cascade_ratio": 1.5,
+        "cascade_report": "ratio=1.5",
+    }
+    order = list(result.timings)
+    assert order.index("assign_cascade_total") < order.index("assign_cascade_double")
+    assert order.index("assign_cascade_double") < order.index("assign_cascade_ratio")
+    assert order.index("assign_cascade_ratio") < order.index("assign_cascade_report")
+    assert "assign_cascade_net" not in order
+    assert result.skipped == []
+    assert data == {"cascade_a": 1, "cascade_b": 2, "cascade_divisor": 4}
+
+
+def test_assign_cascade_only_runs_downstream_of_changed_fields():
+    data = {
+        "cascade_a": 1,
+        "cascade_b": 2,
+        "cascade_total": 3,
+        "cascade_double": 6,
+        "cascade_label": "total=3",
+        "cascade_divisor": 3,
+    }
+
+    result = CascadeAssigner.assign_cascade(["cascade_divisor"], data)
+
+    assert result.assigned_fields == {"cascade_ratio": 2.0, "cascade_report": "ratio=2.0"}
+    assert list(result.timings) == ["assign_cascade_ratio", "assign_cascade_report"]
+
+    # auto_first assigners keep an existing value.
+    result = CascadeAssigner.assign_cascade(["cascade_a"], data)
+    assert "cascade_label" not in result.assigned_fields
+    assert result.assigned_fields["cascade_total"] == 3
+
+
+def test_assign_cascade_skips_downstream_of_failures():
+    data = {"cascade_a": 1, "cascade_b": 2, "cascade_divisor": 0}
+
+    result = CascadeAssigner.assign_cascade(["cascade_a"], data)
+
+    assert not result.success
+    assert "division by zero" in result.errors["assign_cascade_ratio"]
+    assert result.skipped == ["assign_cascade_report"]
+    assert result.assigned_fields["cascade_double"] == 6
+    assert "cascade_ratio" not in result.assigned_fields
+
+    result = CascadeAssigner.assign_cascade(["cascade_a"], {"cascade_a": 1})
+    assert result.skipped[0] == "assign_cascade_total"
+    assert result.assigned_fields == {}
+
+
+def test_assign_cascade_prepares_dependent_data():
+    seen = []
+
+    def prepare(assigned_key: str, dependent_data: dict) -> dict:
+        seen.append(assigned_key)
+        return {key: int(value) for key, value in dependent_data.items()}
+
+    result = CascadeAssigner.assign_cascade(
+        ["cascade_b"],
+        {"cascade_a": "1", "cascade_b": "2", "cascade_label": "done"},
+        prepare_dependent_data=prepare,
+    )
+
+    assert result.assigned_fields == {"cascade_total": 3, "cascade_double": 6}
+    assert seen == ["cascade_total", "cascade_double"]
+    assert result.skipped == ["assign_cascade_ratio", "assign_cascade_report"]
+
+
+_FAN_OUT_DELAY = 0.2
+
+
+class FanOutAssigner(AssignerBase):
+    @assigner(assigned_fields=["fan_a"], dependent_fields=["fan_x"], mode="auto")
+    def assign_fan_a(dep: dict) -> AssignerResult:
+        time.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"fan_a": dep["fan_x"] + 1})
+
+    @assigner(assigned_fields=["fan_b"], dependent_fields=["fan_x"], mode="auto")
+    def assign_fan_b(dep: dict) -> AssignerResult:
+        time.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"fan_b": dep["fan_x"] + 2})
+
+    @assigner(assigned_fields=["fan_c"], dependent_fields=["fan_x"], mode="auto")
+    async def assign_fan_c(dep: dict) -> AssignerResult:
+        await asyncio.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"fan_c": dep["fan_x"] + 3})
+
+    @assigner(assigned_fields=["fan_d"], dependent_fields=["fan_x"], mode="auto")
+    async def assign_fan_d(dep: dict) -> AssignerResult:
+        await asyncio.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"fan_d": dep["fan_x"] + 4})
+
+    @assigner(
+        assigned_fields=["fan_sum"],
+        dependent_fields=["fan_a", "fan_b", "fan_c", "fan_d"],
+        mode="auto",
+    )
+    def assign_fan_sum(dep: dict) -> AssignerResult:
+        return AssignerResult(assigned_fields={"fan_sum": sum(dep.values())})
+
+
+_FAN_OUT_FIELDS = {"fan_a": 1, "fan_b": 2, "fan_c": 3, "fan_d": 4, "fan_sum": 10}
+
+
+def test_aassign_cascade_runs_independent_assigners_concurrently():
+    started = time.perf_counter()
+    result = asyncio.run(FanOutAssigner.aassign_cascade(["fan_x"], {"fan_x": 0}))
+    elapsed = time.perf_counter() - started
+
+    assert result.success
+    assert result.assigned_fields == _FAN_OUT_FIELDS
+    assert list(result.timings)[-1] == "assign_fan_sum"
+    assert elapsed < 3 * _FAN_OUT_DELAY
+
+
+def test_aassign_cascade_respects_max_concurrency():
+    started = time.perf_counter()
+    result = asyncio.run(
+        FanOutAssigner.aassign_cascade(["fan_x"], {"fan_x": 0}, max_concurrency=1)
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result.assigned_fields == _FAN_OUT_FIELDS
+    assert elapsed >= 4 * _FAN_OUT_DELAY
+
+
+def test_async_assigner_wrapper_checks_input_and_output():
+    assert asyncio.run(FanOutAssigner.assign_fan_c({"fan_x": 1})).assigned_fields == {
+        "fan_c": 4
+    }
+
+    result = asyncio.run(FanOutAssigner.assign_fan_c({}))
+    assert not result.success
+    assert "Missing dependent rfs" in result.error_message
+
+
+def test_aassign_awaits_async_and_offloads_sync_assigners():
+    async def assign_both():
+        return await asyncio.gather(
+            FanOutAssigner.aassign("fan_c", {"fan_x": 1}),
+            FanOutAssigner.aassign("fan_a", {"fan_x": 1}),
+            FanOutAssigner.aassign("fan_d", {}),
+        )
+
+    async_result, sync_result, missing = asyncio.run(assign_both())
+
+    assert async_result.assigned_fields == {"fan_c": 4}
+    assert sync_result.assigned_fields == {"fan_a": 2}
+    assert not missing.success
+    assert FanOutAssigner.is_async_assigner("fan_c")
+    assert not FanOutAssigner.is_async_assigner("fan_a")
+
+
+def test_assign_runs_async_assigner_outside_event_loop():
+    assert FanOutAssigner.assign("fan_d", {"fan_x": 1}).assigned_fields == {
+        "fan_d": 5
+    }
+
+    async def assign_in_loop():
+        return FanOutAssigner.assign("fan_d", {"fan_x": 1})
+
+    result = asyncio.run(assign_in_loop())
+    assert not result.success
+    assert "aassign" in result.error_message
+
+
+class SlowAssigner(AssignerBase):
+    @assigner(assigned_fields=["slow_a"], dependent_fields=["slow_x"], mode="auto")
+    def assign_slow_a(dep: dict) -> AssignerResult:
+        time.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"slow_a": 1})
+
+    @assigner(assigned_fields=["slow_b"], dependent_fields=["slow_x"], mode="auto")
+    def assign_slow_b(dep: dict) -> AssignerResult:
+        time.sleep(_FAN_OUT_DELAY)
+        return AssignerResult(assigned_fields={"slow_b": 2})
+
+    @assigner(assigned_fields=["slow_c"], dependent_fields=["slow_x"], mode="auto")
+    def assign_slow_c(dep: dict) -> AssignerResult:
+        raise RuntimeError("lookup failed")
+
+
+def test_assign_cascade_thread_pool_runs_sync_assigners_concurrently():
+    started = time.perf_counter()
+    result = SlowAssigner.assign_cascade(["slow_x"], {"slow_x": 0}, max_workers=4)
+    elapsed = time.perf_counter() - started
+
+    assert result.assigned_fields == {"slow_a": 1, "slow_b": 2}
+    assert result.errors == {"assign_slow_c": "lookup failed"}
+    assert elapsed < 2 * _FAN_OUT_DELAY
+
+
+
 def test_load_inline_assigners_executes_inline_var_blocks():
     content = """
 ```assigner
@@ -0,0 +1,153 @@
+"""
+Tests for the content-addressed AIMD cache.
+"""
+
+from airalogy.markdown import (
+    AimdCache,
+    extract_assigner_blocks,
+    generate_model,
+    get_aimd_cache,
+    parse_aimd,
+    validate_aimd,
+)
+from airalogy.markdown import cache as cache_module
+
+CONTENT = """
+Sample: {{var|sample_name: str}}
+Volume: {{var|volume: float = 1.5}}
+
+{{step|mix}}
+"""
+
+
+def test_parse_results_are_cached_by_content():
+    cache = AimdCache()
+
+    first = cache.parse_aimd(CONTENT)
+    second = cache.parse_aimd(CONTENT)
+
+    assert first == parse_aimd(CONTENT)
+    assert second == first
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_parse_results_are_isolated_copies():
+    cache = AimdCache()
+
+    first = cache.parse_aimd(CONTENT)
+    first["templates"]["var"].clear()
+
+    assert len(cache.parse_aimd(CONTENT)["templates"]["var"]) == 2
+
+
+def test_var_model_class_is_shared_and_built_from_cached_source():
+    cache = AimdCache()
+
+    model = cache.get_var_model(CONTENT)
+
+    assert cache.get_var_model(CONTENT) is model
+    assert cache.generate_model(CONTENT) == generate_model(CONTENT)
+    assert model(sample_name="s1").volume == 1.5
+
+
+def test_lru_eviction_respects_maxsize():
+    cache = AimdCache(maxsize=2)
+
+    cache.parse_aimd("{{var|a}}")
+    cache.parse_aimd("{{var|b}}")
+    cache.parse_aimd("{{var|a}}")
+    cache.parse_aimd("{{var|c}}")
+    cache.parse_aimd("{{var|a}}")
+
+    info = cache.cache_info()
+    assert info.currsize == 2
+    assert (info.hits, info.misses) == (2, 3)
+
+
+def test_invalidate_drops_entries_for_content():
+    cache = AimdCache()
+    cache.parse_aimd(CONTENT)
+    cache.generate_model(CONTENT)
+    cache.parse_aimd("{{var|other}}")
+
+    cache.invalidate(CONTENT)
+    assert cache.cache_info().currsize == 1
+
+    cache.invalidate()
+    assert cache.cache_info().currsize == 0
+
+
+def test_disk_cache_is_reused_across_instances(tmp_path):
+    AimdCache(cache_dir=tmp_path).generate_model(CONTENT)
+    AimdCache(cache_dir=tmp_path).parse_aimd(CONTENT)
+
+    cache = AimdCache(cache_dir=tmp_path)
+    assert cache.generate_model(CONTENT) == generate_model(CONTENT)
+    assert cache.parse_aimd(CONTENT) == parse_aimd(CONTENT)
+    assert cache.cache_info().disk_hits == 2
+
+    cache.invalidate(CONTENT)
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_validation_key_covers_protocol_model_file(tmp_path):
+    cache = AimdCache()
+    (tmp_path / "model.py").write_text(
+        "from pydantic import BaseModel\n\n"
+        "class VarModel(BaseModel):\n"
+        "    sample_name: str\n"
+        "    volume: float = 1.5\n",
+        encoding="utf-8",
+    )
+
+    assert cache.validate_aimd(CONTENT, protocol_dir=tmp_path)[0] is True
+
+    (tmp_path / "model.py").write_text(
+        "from pydantic import BaseModel\n\n"
+        "class VarModel(BaseModel):\n"
+        "    sample_name: int\n",
+        encoding="utf-8",
+    )
+
+    is_valid, errors = cache.validate_aimd(CONTENT, protocol_dir=tmp_path)
+    assert is_valid is False
+    assert errors[0].message.startswith("model.py:")
+    assert cache.cache_info().hits == 0
+
+
+def test_validation_key_covers_modules_imported_by_model_file(tmp_path):
+    cache = AimdCache()
+    (tmp_path / "fields.py").write_text("SAMPLE_TYPE = str\n", encoding="utf-8")
+    (tmp_path / "model.py").write_text(
+        "import sys\n"
+        "sys.path.insert(0, str(__import__('pathlib').Path(__file__).parent))\n"
+        "sys.modules.pop('fields', None)\n"
+        "from fields import SAMPLE_TYPE\n"
+        "from pydantic import BaseModel\n\n"
+        "class VarModel(BaseModel):\n"
+        "    sample_name: SAMPLE_TYPE\n"
+        "    volume: float = 1.5\n",
+        encoding="utf-8",
+    )
+
+    assert cache.validate_aimd(CONTENT, protocol_dir=tmp_path)[0] is True
+
+    (tmp_path / "fields.py").write_text("SAMPLE_TYPE = int\n", encoding="utf-8")
+
+    assert cache.validate_aimd(CONTENT, protocol_dir=tmp_path)[0] is False
+    assert cache.cache_info().hits == 0
+
+
+def test_module_functions_use_the_process_wide_cache(monkeypatch):
+    monkeypatch.setattr(cache_module, "_DEFAULT_CACHE", AimdCache())
+
+    parsed = parse_aimd(CONTENT)
+    parsed["templates"]["var"].clear()
+    assert len(parse_aimd(CONTENT)["templates"]["var"]) == 2
+    assert extract_assigner_blocks(CONTENT) == []
+    assert generate_model(CONTENT) == generate_model(CONTENT)
+    assert validate_aimd(CONTENT) == validate_aimd(CONTENT)
+
+    info = get_aimd_cache().cache_info()
+    assert (info.hits, info.misses) == (4, 3)
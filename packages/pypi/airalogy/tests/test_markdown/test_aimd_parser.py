@@ -16,6 +16,7 @@ from airalogy.markdown import (
     InvalidNameError,
     InvalidSyntaxError,
     Lexer,
+    LineIndex,
     QuizNode,
     StepNode,
     TokenType,
@@ -188,6 +189,67 @@ options:
         assert len(tokens) == 1
         assert tokens[0].type == TokenType.EOF
 
+    def test_line_index_matches_naive_positions(self):
+        """Test that indexed positions match a direct scan of the content."""
+        content = "a\n\n{{var|x}}\n```\ncode\n```\nlast line {{step|s}}\n"
+        index = LineIndex(content)
+
+        for offset in range(len(content) + 1):
+            for length in range(len(content) - offset + 1):
+                span_text = content[offset : offset + length]
+                start_line = content[:offset].count("\n") + 1
+                start_col = offset - (content.rfind("\n", 0, offset) + 1) + 1
+                if "\n" in span_text:
+                    end_col = length - span_text.rfind("\n") - 1
+                else:
+                    end_col = start_col + length - 1
+                assert index.span(offset, length) == (
+                    start_line,
+                    start_line + span_text.count("\n"),
+                    start_col,
+                    end_col,
+                )
+
+    def test_adjacent_code_spans_are_excluded(self):
+        """Test excluded-range lookup across many code spans."""
+        content = "".join(f"`{{{{var|code_{i}}}}}` " for i in range(50))
+        content += "{{var|real_var}}"
+        tokens = list(Lexer(content).tokenize())
+
+        assert [token.value for token in tokens[:-1]] == ["real_var"]
+        assert tokens[0].position.start_col == content.index("{{var|real_var}}") + 1
+
+    def test_code_blocks_are_grouped_by_language(self):
+        """Test that fenced code blocks are scanned once and grouped by language."""
+        content = """
+```quiz
+id: q1
+```
+
+```Media
+id: m1
+```
+
+```python
+print("x")
+```
+
+```assigner runtime=client
+```
+"""
+        lexer = Lexer(content)
+
+        assert [block.lang for block in lexer.code_blocks] == [
+            "quiz",
+            "Media",
+            "python",
+            "assigner",
+        ]
+        assert [block.code for block in lexer.get_code_blocks("quiz")] == ["id: q1\n"]
+        assert [block.lang for block in lexer.get_code_blocks("media")] == ["Media"]
+        assert lexer.get_code_blocks("assigner")[0].meta == "runtime=client"
+        assert lexer.get_code_blocks("workflow") == []
+
     def test_parser_skips_inline_code_vars(self):
         """Test that parser correctly skips variables in inline code."""
         content = "{{var|real_var}} and `{{var|code_var}}`"